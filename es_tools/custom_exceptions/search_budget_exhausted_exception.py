@@ -0,0 +1,26 @@
+"""Výjimka pro vyčerpání rozpočtu prohledávání.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje výjimku sloužící pro reprezentaci, že během prohledávání vymazávacího systému byl vyčerpán
+rozpočet prohledávání (počet prohledaných konfigurací, doba běhu nebo paměť).
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: search_budget_exhausted_exception.py
+"""
+
+
+class SearchBudgetExhaustedException(Exception):
+    """Výjimka pro vyčerpání rozpočtu prohledávání.
+
+    Tato třída reprezentuje vyčerpání rozpočtu prohledávání před rozhodnutím o přijetí vstupního řetězce. Jako výjimka
+    je odvozena od třídy Exception.
+    """
+    def __init__(self, msg="The search budget has been exhausted.") -> None:
+        """**Konstruktor třídy SearchBudgetExhaustedException**
+
+        :param msg: chybová zpráva.
+        :type msg: str
+        """
+        self.msg = msg
@@ -64,7 +64,8 @@ class ExitCode(Enum):
     """
     MAXIMUM_INPUT_STRING_LENGTH_EXCEEDED = 42
     """
-    Překročena maximální povolená délka vstupního řetězce pro zpracování vymazávacím systémem.
+    Překročena maximální povolená délka vstupního řetězce pro zpracování vymazávacím systémem. Délka vstupního
+    řetězce již není omezena a návratový kód není využíván, hodnota je však zachována pro zpětnou kompatibilitu.
     """
     INVALID_EXAMPLE_NUMBER = 70
     """
@@ -0,0 +1,113 @@
+"""Automat Aho-Corasick pro vyhledávání výskytů vymazávacích řetězců.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje třídu AhoCorasickAutomaton, která slouží pro nalezení všech i překrývajících se výskytů všech
+vymazávacích řetězců na vstupní pásce jediným průchodem vstupní páskou. Automat je sestaven pouze jednou při vytvoření
+vymazávacího systému, a vymazávací systém tak nemusí pro každý vymazávací řetězec procházet celou vstupní pásku.
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: aho_corasick_automaton.py
+"""
+
+from typing import Dict, Iterable, List
+
+
+class AhoCorasickAutomaton:
+    """Automat Aho-Corasick nad množinou vymazávacích řetězců.
+
+    Stavy automatu odpovídají prefixům vymazávacích řetězců (počáteční stav 0 odpovídá prázdnému řetězci). Každý stav
+    obsahuje přechody pro symboly, které prefix prodlužují, takzvaný failure přechod do stavu odpovídajícímu nejdelšímu
+    vlastnímu sufixu prefixu a seznam vymazávacích řetězců, které končí v daném stavu (včetně řetězců dosažitelných
+    failure přechody). Prázdný vymazávací řetězec není vyhledáván, jelikož jeho vymazáním se vstupní páska nemění.
+    """
+    def __init__(self, erasing_strings: Iterable[str]) -> None:
+        """**Konstruktor třídy AhoCorasickAutomaton**
+
+        :param erasing_strings: vymazávací řetězce, jejichž výskyty jsou vyhledávány.
+        :type erasing_strings: Iterable[str]
+        """
+        self.__erasing_strings = [erasing_string for erasing_string in erasing_strings if erasing_string != ""]
+        self.__transitions: List[Dict[str, int]] = [dict()]
+        self.__failure_transitions: List[int] = [0]
+        self.__outputs: List[List[str]] = [list()]
+
+        self._build_trie()
+        self._build_failure_transitions()
+
+    @property
+    def erasing_strings(self) -> List[str]:
+        """Vyhledávané vymazávací řetězce.
+
+        :getter: získání seznamu vyhledávaných (neprázdných) vymazávacích řetězců.
+        :type: List[str]
+        """
+        return self.__erasing_strings
+
+    def _build_trie(self) -> None:
+        """Sestavení stromu prefixů vymazávacích řetězců."""
+        for erasing_string in self.__erasing_strings:
+            state = 0
+
+            for symbol in erasing_string:
+                next_state = self.__transitions[state].get(symbol)
+
+                if next_state is None:
+                    next_state = len(self.__transitions)
+                    self.__transitions[state][symbol] = next_state
+                    self.__transitions.append(dict())
+                    self.__failure_transitions.append(0)
+                    self.__outputs.append(list())
+
+                state = next_state
+
+            self.__outputs[state].append(erasing_string)
+
+    def _build_failure_transitions(self) -> None:
+        """Výpočet failure přechodů průchodem stromu prefixů do šířky."""
+        to_process = list(self.__transitions[0].values())
+
+        i = 0
+        while i < len(to_process):
+            state = to_process[i]
+
+            for symbol, next_state in self.__transitions[state].items():
+                failure_state = self.__failure_transitions[state]
+
+                while failure_state != 0 and symbol not in self.__transitions[failure_state]:
+                    failure_state = self.__failure_transitions[failure_state]
+
+                failure_state = self.__transitions[failure_state].get(symbol, 0)
+
+                self.__failure_transitions[next_state] = failure_state
+                self.__outputs[next_state] = self.__outputs[next_state] + self.__outputs[failure_state]
+                to_process.append(next_state)
+
+            i = i + 1
+
+    def find_occurrences(self, input_tape: str) -> Dict[str, List[int]]:
+        """Nalezení všech i překrývajících se výskytů vymazávacích řetězců na vstupní pásce.
+
+        :param input_tape: vstupní páska.
+        :type input_tape: str
+        :return: slovník, který každému vymazávacímu řetězci vyskytujícímu se na vstupní pásce přiřazuje vzestupně
+                 seřazený seznam pozic jeho výskytů.
+        :rtype: Dict[str, List[int]]
+        """
+        transitions = self.__transitions
+        failure_transitions = self.__failure_transitions
+        outputs = self.__outputs
+        occurrences = dict()
+        state = 0
+
+        for end_position, symbol in enumerate(input_tape, 1):
+            while state != 0 and symbol not in transitions[state]:
+                state = failure_transitions[state]
+
+            state = transitions[state].get(symbol, 0)
+
+            for erasing_string in outputs[state]:
+                occurrences.setdefault(erasing_string, list()).append(end_position - len(erasing_string))
+
+        return occurrences
@@ -0,0 +1,131 @@
+"""Prioritní fronta aplikovatelných vymazávacích řetězců.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje třídu ApplicableErasingStringsQueue, která uchovává dosud neověřené aplikovatelné vymazávací
+řetězce jednoho uzlu prohledávání seskupené podle úrovně shody s regulárním jazykem. Úrovně shody jsou uloženy v haldě
+v pořadí, které vyžaduje zvolený typ kvantifikátoru, a skupina vymazávacích řetězců s nejlepší úrovní shody je tak
+získána v logaritmickém čase bez opakovaného procházení všech aplikovatelných vymazávacích řetězců. Mezi vymazávacími
+řetězci této skupiny jsou poté vybrány ty s nejlepšími úrovněmi počtu opakování podvýrazů.
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: applicable_erasing_strings_queue.py
+"""
+
+import heapq
+
+from sys import maxsize
+from typing import Dict, List, Optional, Tuple
+
+from es_tools.formal_models.erasing_system.custom_utils.custom_constants import MATCH_LEVEL_TUPLE_INDEX, \
+    QUANTIFIERS_LEVELS_TUPLE_INDEX
+
+ErasingStringTuple = Tuple[str, int, Optional[List[int]], int]
+
+
+class ApplicableErasingStringsQueue:
+    """Prioritní fronta aplikovatelných vymazávacích řetězců.
+
+    Pro chamtivý kvantifikátor je nejlepší nejnižší úroveň shody, pro líný kvantifikátor nejvyšší úroveň shody.
+    V rámci skupin jsou vymazávací řetězce uchovávány v pořadí vložení, které tak odpovídá pořadí v původním seznamu
+    aplikovatelných vymazávacích řetězců.
+    """
+    def __init__(self, applicable_erasing_strings: List[ErasingStringTuple], quantifier_type_greedy: bool) -> None:
+        """**Konstruktor třídy ApplicableErasingStringsQueue**
+
+        :param applicable_erasing_strings: seznam aplikovatelných vymazávacích řetězců.
+        :type applicable_erasing_strings: List[ErasingStringTuple]
+        :param quantifier_type_greedy: typ kvantifikátoru (True — chamtivý, False — líný).
+        :type quantifier_type_greedy: bool
+        """
+        self.__quantifier_type_greedy = quantifier_type_greedy
+        self.__groups: Dict[int, List[ErasingStringTuple]] = dict()
+        self.__priorities: List[int] = list()
+        self.__length = len(applicable_erasing_strings)
+
+        for erasing_string_tuple in applicable_erasing_strings:
+            match_level = erasing_string_tuple[MATCH_LEVEL_TUPLE_INDEX]
+            group = self.__groups.get(match_level)
+
+            if group is None:
+                group = self.__groups[match_level] = list()
+                self.__priorities.append(match_level if quantifier_type_greedy else -match_level)
+
+            group.append(erasing_string_tuple)
+
+        heapq.heapify(self.__priorities)
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def best_match_level(self) -> int:
+        """Nejlepší úroveň shody mezi dosud neověřenými vymazávacími řetězci.
+
+        Úrovně shody, jejichž skupiny již byly vyprázdněny, jsou z haldy odstraněny až při tomto dotazu.
+
+        :return: nejlepší úroveň shody pro zvolený typ kvantifikátoru.
+        :rtype: int
+        """
+        while True:
+            match_level = self.__priorities[0] if self.__quantifier_type_greedy else -self.__priorities[0]
+
+            if match_level in self.__groups:
+                return match_level
+
+            heapq.heappop(self.__priorities)
+
+    def best_group(self) -> List[ErasingStringTuple]:
+        """Skupina vymazávacích řetězců s nejlepší úrovní shody.
+
+        Navrácený seznam je přímo skupinou fronty, a doplnění úrovní počtu opakování podvýrazů jeho prvků tak upravuje
+        i frontu.
+
+        :return: neprázdný seznam vymazávacích řetězců s nejlepší úrovní shody.
+        :rtype: List[ErasingStringTuple]
+        """
+        return self.__groups[self.best_match_level()]
+
+    def filter_best_quantifiers_levels(self, group: List[ErasingStringTuple]) -> List[ErasingStringTuple]:
+        """Výběr vymazávacích řetězců skupiny s nejlepšími úrovněmi počtu opakování podvýrazů.
+
+        Úrovně počtu opakování jsou porovnávány postupně pro jednotlivé podvýrazy (nejvýše do úrovně shody skupiny),
+        přičemž pro chamtivý kvantifikátor je vybírán nejvyšší a pro líný kvantifikátor nejnižší počet opakování.
+        Seznam úrovní, který je kratší než aktuálně porovnávaný podvýraz, není dále porovnáván a vyřazen není. Vybrány
+        jsou tak právě ty vymazávací řetězce, jejichž seznam úrovní je prefixem nejlepšího seznamu úrovní, přičemž
+        pro chamtivý kvantifikátor je nejlepším seznamem lexikograficky největší seznam a pro líný kvantifikátor
+        lexikograficky nejmenší seznam, u kterého je prefix považován za větší než jeho prodloužení.
+
+        :param group: skupina vymazávacích řetězců se shodnou úrovní shody a doplněnými úrovněmi počtu opakování.
+        :type group: List[ErasingStringTuple]
+        :return: vybrané vymazávací řetězce v pořadí skupiny.
+        :rtype: List[ErasingStringTuple]
+        """
+        if len(group) < 2:
+            return group
+
+        match_level = max(group[0][MATCH_LEVEL_TUPLE_INDEX], 0)
+        quantifiers_levels = [tuple(erasing_string_tuple[QUANTIFIERS_LEVELS_TUPLE_INDEX][:match_level])
+                              for erasing_string_tuple in group]
+
+        if self.__quantifier_type_greedy:
+            best_quantifiers_levels = max(quantifiers_levels)
+        else:
+            best_quantifiers_levels = min(levels + (maxsize,) for levels in quantifiers_levels)[:-1]
+
+        return [erasing_string_tuple for erasing_string_tuple, levels in zip(group, quantifiers_levels)
+                if levels == best_quantifiers_levels[:len(levels)]]
+
+    def remove(self, erasing_string_tuple: ErasingStringTuple) -> None:
+        """Odstranění ověřeného vymazávacího řetězce z fronty.
+
+        :param erasing_string_tuple: odstraňovaný vymazávací řetězec (prvek některé skupiny fronty).
+        :type erasing_string_tuple: ErasingStringTuple
+        """
+        match_level = erasing_string_tuple[MATCH_LEVEL_TUPLE_INDEX]
+        group = self.__groups[match_level]
+        group.remove(erasing_string_tuple)
+        self.__length = self.__length - 1
+
+        if len(group) == 0:
+            del self.__groups[match_level]
@@ -0,0 +1,123 @@
+"""Rozhodování o přijetí vstupního řetězce vymazávacím systémem tvaru Dyckova jazyka.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje třídu BracketMatching a funkci create_bracket_matching(), která ji vytváří. Pokud má každý
+vymazávací řetězec délku dva, první symboly vymazávacích řetězců (otevírací závorky) se liší od jejich druhých symbolů
+(uzavíracích závorek) a regulární jazyk je iterací sjednocení obsahujícího všechny vymazávací řetězce (například
+vymazávací řetězce „Aa“, „Bb“, „Cc“ a regulární jazyk „(Aa|Bb|Cc)*“), náleží řetězec vzniklý konkatenací použitých
+vymazávacích řetězců do regulárního jazyka vždy. Vstupní řetězec je pak přijat právě tehdy, pokud jej lze celý vymazat,
+tedy pokud náleží do Dyckova jazyka nad danými závorkami, o čemž lze rozhodnout zásobníkovým algoritmem v lineárním
+čase.
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: bracket_matching.py
+"""
+
+from typing import Iterable, List, Optional, Set, Tuple
+
+from es_tools.formal_models.erasing_system.custom_utils.custom_constants import BUDGET_CHECK_INTERVAL
+from es_tools.formal_models.erasing_system.custom_utils.search_budget import SearchBudget
+
+
+class BracketMatching:
+    """Ověření vyváženosti závorek zásobníkovým algoritmem.
+
+    Uzavírací závorka nemůže být vymazána s otevírací závorkou napravo od ní ani s jinou uzavírací závorkou, a musí být
+    proto vymazána s nejbližší dosud nevymazanou otevírací závorkou nalevo od ní. Párování závorek při vymazání celého
+    vstupního řetězce je tedy určeno jednoznačně a odpovídá párování zásobníkovým algoritmem.
+    """
+    def __init__(self, erasing_strings: Set[str], empty_string_accepted: bool) -> None:
+        """**Konstruktor třídy BracketMatching**
+
+        :param erasing_strings: vymazávací řetězce délky dva, jejichž první symboly se liší od jejich druhých symbolů.
+        :type erasing_strings: Set[str]
+        :param empty_string_accepted: pravdivostní hodnota, zda regulární jazyk obsahuje prázdný řetězec.
+        :type empty_string_accepted: bool
+        """
+        self.__erasing_strings = erasing_strings
+        self.__opening_brackets = {erasing_string[0] for erasing_string in erasing_strings}
+        self.__closing_brackets = {erasing_string[1] for erasing_string in erasing_strings}
+        self.__empty_string_accepted = empty_string_accepted
+
+    def is_accepted(self, input_string: str, derivation: Optional[List[Tuple[str, int]]] = None,
+                    budget: Optional[SearchBudget] = None) -> bool:
+        """Rozhodnutí o přijetí vstupního řetězce.
+
+        :param input_string: vstupní řetězec.
+        :type input_string: str
+        :param derivation: seznam, do kterého jsou při přijetí vstupního řetězce doplněny dvojice vymazávacího řetězce
+                           a původního indexu jeho prvního symbolu ve vstupním řetězci v pořadí vymazání, nebo None.
+                           Uzavírací závorky jsou vymazávány zleva doprava spolu s párovými otevíracími závorkami.
+        :type derivation: Optional[List[Tuple[str, int]]]
+        :param budget: rozpočet prohledávání, jehož doba běhu a paměť jsou ověřovány vždy po zpracování
+                       BUDGET_CHECK_INTERVAL symbolů, nebo None, pokud rozhodování není omezeno.
+        :type budget: Optional[SearchBudget]
+        :return: True, pokud lze vstupní řetězec celý vymazat a regulární jazyk obsahuje řetězec vzniklý konkatenací
+                 použitých vymazávacích řetězců, jinak False.
+        :rtype: bool
+        :raises SearchBudgetExhaustedException: rozpočet prohledávání byl vyčerpán.
+        """
+        if input_string == "":
+            return self.__empty_string_accepted
+
+        # Zásobník obsahuje indexy dosud nespárovaných otevíracích závorek.
+        stack: List[int] = list()
+        pairs = list()
+
+        for index, symbol in enumerate(input_string):
+            if budget is not None and index % BUDGET_CHECK_INTERVAL == 0:
+                budget.check()
+
+            if symbol in self.__opening_brackets:
+                stack.append(index)
+            elif symbol in self.__closing_brackets and len(stack) > 0 and \
+                    input_string[stack[-1]] + symbol in self.__erasing_strings:
+                opening_index = stack.pop()
+
+                if derivation is not None:
+                    pairs.append((input_string[opening_index] + symbol, opening_index))
+            else:
+                return False
+
+        if len(stack) != 0:
+            return False
+
+        if derivation is not None:
+            derivation.extend(pairs)
+
+        return True
+
+
+def create_bracket_matching(erasing_strings: Iterable[str],
+                            elements: Optional[List[Tuple[List[str], str]]]) -> Optional[BracketMatching]:
+    """Vytvoření ověření vyváženosti závorek, pokud má vymazávací systém tvar Dyckova jazyka.
+
+    :param erasing_strings: vymazávací řetězce.
+    :type erasing_strings: Iterable[str]
+    :param elements: seznam prvků regulárního výrazu vytvořený funkcí parse_regular_language_elements(), nebo None,
+                     pokud regulární výraz obsahuje nepodporovanou konstrukci.
+    :type elements: Optional[List[Tuple[List[str], str]]]
+    :return: ověření vyváženosti závorek, nebo None, pokud vymazávací systém nemá tvar Dyckova jazyka.
+    :rtype: Optional[BracketMatching]
+    """
+    erasing_strings = set(erasing_strings)
+
+    if len(erasing_strings) == 0 or any(len(erasing_string) != 2 for erasing_string in erasing_strings):
+        return None
+
+    if len({erasing_string[0] for erasing_string in erasing_strings} &
+           {erasing_string[1] for erasing_string in erasing_strings}) > 0:
+        return None
+
+    # Regulární jazyk musí být iterací sjednocení, které obsahuje všechny vymazávací řetězce.
+    if elements is None or len(elements) != 1:
+        return None
+
+    alternatives, operator = elements[0]
+
+    if operator not in ["*", "+"] or not erasing_strings.issubset(alternatives):
+        return None
+
+    return BracketMatching(erasing_strings, operator == "*")
@@ -0,0 +1,82 @@
+"""Porovnání řetězce se všemi porovnávanými regulárními výrazy jediným během regulárního výrazu.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje třídu ComparedLanguagesMatcher, která spojuje všechny porovnávané regulární výrazy pro daný typ
+kvantifikátoru (viz funkce compile_compared_languages()) do jediného regulárního výrazu. Namísto postupného porovnání
+řetězce s každým porovnávaným jazykem a jeho upravenou variantou tak řetězec prochází pouze jeden přeložený regulární
+výraz.
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: compared_languages_matcher.py
+"""
+
+import re
+
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from es_tools.formal_models.erasing_system.custom_utils.match_language_tools import calculate_levels
+
+
+class ComparedLanguagesMatcher:
+    """Porovnání řetězce se seřazenými porovnávanými regulárními výrazy.
+
+    Porovnávané regulární výrazy jsou spojeny operací sjednocení v pořadí, ve kterém byly dříve postupně porovnávány
+    (porovnávaný výraz a poté jeho upravená varianta). Každá alternativa je uzavřena do vlastní skupiny. Jelikož
+    alternativy regulárního výrazu jsou zkoušeny zleva a celková shoda je nalezena pro první alternativu, pro kterou
+    existuje, odpovídá nalezená alternativa i skupiny jejích podvýrazů prvnímu porovnávanému výrazu, se kterým se
+    řetězec shoduje. Skupina alternativy je uzavřena až po všech skupinách jejích podvýrazů, a nalezenou alternativu
+    tak určuje index naposledy uzavřené skupiny.
+    """
+    def __init__(self, compared_languages: List[Tuple[Pattern, Optional[Pattern], int]],
+                 default_match_level: int) -> None:
+        """**Konstruktor třídy ComparedLanguagesMatcher**
+
+        :param compared_languages: seznam trojic vytvořený funkcí compile_compared_languages().
+        :type compared_languages: List[Tuple[Pattern, Optional[Pattern], int]]
+        :param default_match_level: úroveň shody navrácená, pokud řetězec neodpovídá žádnému porovnávanému výrazu.
+        :type default_match_level: int
+        """
+        self.__default_match_level = default_match_level
+
+        # Pro index skupiny každé alternativy je uchováván počet skupin jejích podvýrazů a úroveň shody.
+        self.__alternatives: Dict[int, Tuple[int, int]] = dict()
+        alternatives_patterns = list()
+        group_index = 1
+
+        for pattern, transformed_pattern, match_level in compared_languages:
+            for alternative_pattern in [pattern, transformed_pattern]:
+                if alternative_pattern is None:
+                    continue
+
+                alternatives_patterns.append("(" + alternative_pattern.pattern + ")")
+                self.__alternatives[group_index] = (alternative_pattern.groups, match_level)
+                group_index = group_index + alternative_pattern.groups + 1
+
+        if len(alternatives_patterns) > 0:
+            self.__pattern = re.compile("|".join(alternatives_patterns))
+        else:
+            self.__pattern = None
+
+    def match(self, input_string: str) -> Tuple[bool, int, List[int]]:
+        """Porovnání řetězce s porovnávanými regulárními výrazy.
+
+        :param input_string: porovnávaný řetězec.
+        :type input_string: str
+        :return: trojice hodnot, které po řadě reprezentují:
+                 1. zda řetězec odpovídá některému porovnávanému výrazu,
+                 2. úroveň shody prvního takového výrazu,
+                 3. seznam obsahující počty opakování jednotlivých podvýrazů regulárního výrazu v řetězci.
+        :rtype: Tuple[bool, int, List[int]]
+        """
+        match_result = None if self.__pattern is None else self.__pattern.fullmatch(input_string)
+
+        if match_result is None:
+            return False, self.__default_match_level, list()
+
+        group_index = match_result.lastindex
+        groups_number, match_level = self.__alternatives[group_index]
+
+        return True, match_level, calculate_levels(match_result.groups()[group_index:group_index + groups_number],
+                                                   input_string)
@@ -10,6 +10,21 @@ Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Br
 ERASING_STRING_TUPLE_INDEX = 0
 MATCH_LEVEL_TUPLE_INDEX = 1
 QUANTIFIERS_LEVELS_TUPLE_INDEX = 2
+NEXT_LANGUAGE_STATE_TUPLE_INDEX = 3
 
 DEFAULT_MATCH_LEVEL = -1
 DEFAULT_QUANTIFIER_LEVEL = 0
+
+DEFAULT_TRANSPOSITION_TABLE_SIZE = 50000
+
+DEAD_STATE = -1
+MAXIMUM_AUTOMATON_STATES_NUMBER = 10000
+INITIAL_LANGUAGE_STATE = 0
+
+MAXIMUM_PARIKH_IMAGE_BASES_NUMBER = 10000
+MAXIMUM_FINITE_LANGUAGE_WORDS_NUMBER = 10000
+
+BUDGET_CHECK_INTERVAL = 1024
+
+TAPE_HASH_BASE = 1469598103934665603
+TAPE_HASH_MODULUS = 2305843009213693951
@@ -0,0 +1,223 @@
+"""Počítání přijímajících posloupností vymazání a výčet řetězců vzniklých konkatenací.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje třídu DerivationCounting, která pro vstupní řetězec počítá všechny přijímající posloupnosti
+vymazání a vypisuje všechny různé řetězce vzniklé konkatenací použitých vymazávacích řetězců, které náleží
+do regulárního jazyka. Hlavní algoritmus vymazávacího systému končí prvním přijetím, a proto je výpočet založen
+na podproblémech určených obsahem vstupní pásky a stavem automatu pro regulární jazyk. Každý podproblém je vyřešen
+nejvýše jednou, a počet posloupností vymazání tak není zjišťován jejich procházením.
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: derivation_counting.py
+"""
+
+import heapq
+
+from typing import Callable, Dict, Hashable, List, Optional, Pattern, Tuple, TypeVar
+
+from es_tools.formal_models.erasing_system.custom_utils.aho_corasick_automaton import AhoCorasickAutomaton
+from es_tools.formal_models.erasing_system.custom_utils.custom_constants import DEAD_STATE, INITIAL_LANGUAGE_STATE
+from es_tools.formal_models.erasing_system.custom_utils.erasable_tape import ErasableTape
+from es_tools.formal_models.erasing_system.custom_utils.occurrence_index import OccurrenceIndex
+from es_tools.formal_models.erasing_system.custom_utils.regular_language_automaton import RegularLanguageAutomaton
+from es_tools.formal_models.erasing_system.custom_utils.search_budget import SearchBudget
+
+Value = TypeVar("Value")
+
+# Konfigurace je vyhledávána podle dvojice hashe obsahu vstupní pásky a stavu regulárního jazyka.
+Configuration = Tuple[Tuple[int, int], Hashable]
+
+
+class DerivationCounting:
+    """Řešení podproblémů vymazání vstupní pásky ze zadaného stavu regulárního jazyka.
+
+    Stavem regulárního jazyka je stav automatu pro regulární jazyk. Pokud automat nebyl sestaven, je stavem celý
+    řetězec vzniklý konkatenací použitých vymazávacích řetězců, který je na konci porovnán s regulárním výrazem.
+    Podproblémy jsou pak sdíleny pouze konfiguracemi se stejným řetězcem vzniklým konkatenací. Dvě posloupnosti
+    vymazání jsou různé, pokud se liší v některém vymazávacím řetězci nebo v pozici některého vymazání.
+    """
+    def __init__(self, occurrences_automaton: AhoCorasickAutomaton, automaton: Optional[RegularLanguageAutomaton],
+                 regular_language_pattern: Pattern) -> None:
+        """**Konstruktor třídy DerivationCounting**
+
+        :param occurrences_automaton: automat Aho-Corasick nad množinou vymazávacích řetězců.
+        :type occurrences_automaton: AhoCorasickAutomaton
+        :param automaton: deterministický konečný automat pro regulární jazyk, nebo None, pokud nebyl sestaven.
+        :type automaton: Optional[RegularLanguageAutomaton]
+        :param regular_language_pattern: přeložený regulární výraz pro regulární jazyk.
+        :type regular_language_pattern: Pattern
+        """
+        self.__occurrences_automaton = occurrences_automaton
+        self.__automaton = automaton
+        self.__regular_language_pattern = regular_language_pattern
+
+    def _read_erasing_string(self, language_state: Hashable, erasing_string: str) -> Optional[Hashable]:
+        """Připojení vymazávacího řetězce k řetězci vzniklému konkatenací.
+
+        :param language_state: stav regulárního jazyka.
+        :type language_state: Hashable
+        :param erasing_string: vymazávací řetězec.
+        :type erasing_string: str
+        :return: následující stav regulárního jazyka, nebo None, pokud z něj nelze dosáhnout přijetí.
+        :rtype: Optional[Hashable]
+        """
+        if self.__automaton is None:
+            return language_state + erasing_string
+
+        next_language_state = self.__automaton.read(language_state, erasing_string)
+
+        return None if next_language_state == DEAD_STATE else next_language_state
+
+    def _is_final(self, language_state: Hashable) -> bool:
+        """Ověření, zda řetězec vzniklý konkatenací náleží do regulárního jazyka.
+
+        :param language_state: stav regulárního jazyka.
+        :type language_state: Hashable
+        :return: True, pokud řetězec náleží do regulárního jazyka, jinak False.
+        :rtype: bool
+        """
+        if self.__automaton is None:
+            return self.__regular_language_pattern.fullmatch(language_state) is not None
+
+        return language_state in self.__automaton.accepting_states
+
+    def _find_erasures(self, occurrence_index: OccurrenceIndex,
+                       language_state: Hashable) -> List[Tuple[int, str, Hashable]]:
+        """Nalezení všech vymazání z konfigurace.
+
+        :param occurrence_index: index výskytů vymazávacích řetězců na vstupní pásce konfigurace.
+        :type occurrence_index: OccurrenceIndex
+        :param language_state: stav regulárního jazyka konfigurace.
+        :type language_state: Hashable
+        :return: trojice pozice výskytu, vymazávacího řetězce a následujícího stavu regulárního jazyka pro každou pozici
+                 výskytu každého vymazávacího řetězce, po jehož připojení lze dosáhnout přijetí.
+        :rtype: List[Tuple[int, str, Hashable]]
+        """
+        erasures = list()
+
+        for erasing_string, positions in occurrence_index.occurrences.items():
+            next_language_state = self._read_erasing_string(language_state, erasing_string)
+
+            if next_language_state is None:
+                continue
+
+            erasures.extend((position, erasing_string, next_language_state) for position in positions)
+
+        return erasures
+
+    def _solve(self, input_string: str, combine: Callable[[bool, List[Tuple[str, Value]]], Value],
+               budget: Optional[SearchBudget] = None) -> Value:
+        """Vyřešení podproblémů všech konfigurací dosažitelných z počáteční konfigurace.
+
+        Místo rekurzivních volání je využit explicitní zásobník, a délka vstupního řetězce tak není omezena maximální
+        hloubkou rekurze. Vstupní páska i výskyty vymazávacích řetězců jsou sdíleny všemi rámci a při návratu
+        z konfigurace jsou obnoveny. Hodnoty vyřešených konfigurací jsou vyhledávány podle hashe obsahu vstupní pásky
+        a stavu regulárního jazyka, přičemž shoda hashe obsah vstupní pásky neprokazuje, a proto je uložen i přesný
+        obsah, který je porovnán při nalezení konfigurace. Konfigurace je vyřešena až po vyřešení všech konfigurací
+        vzniklých vymazáním z ní.
+
+        :param input_string: vstupní řetězec.
+        :type input_string: str
+        :param combine: funkce, která hodnotu konfigurace určuje z pravdivostní hodnoty, zda je konfigurace
+                        přijímající, a z dvojic vymazávacího řetězce a hodnoty konfigurace vzniklé jeho vymazáním.
+        :type combine: Callable[[bool, List[Tuple[str, Value]]], Value]
+        :param budget: rozpočet prohledávání, ze kterého je spotřebována jedna jednotka za každou řešenou konfiguraci,
+                       nebo None, pokud výpočet není omezen.
+        :type budget: Optional[SearchBudget]
+        :return: hodnota počáteční konfigurace.
+        :rtype: Value
+        :raises SearchBudgetExhaustedException: rozpočet prohledávání byl vyčerpán.
+        """
+        tape = ErasableTape(input_string)
+        occurrence_index = OccurrenceIndex(self.__occurrences_automaton, tape)
+        root_language_state = "" if self.__automaton is None else INITIAL_LANGUAGE_STATE
+        values: Dict[Configuration, Tuple[str, Value]] = dict()
+
+        if budget is not None:
+            budget.consume()
+
+        # Každý rámec obsahuje stav regulárního jazyka, dosud neřešená vymazání, dvojice vymazávacího řetězce a hodnoty
+        # konfigurace vzniklé jeho vymazáním, záznam o vymazání, které vedlo k naposledy řešené konfiguraci,
+        # a vymazávací řetězec tohoto vymazání.
+        stack = [[root_language_state, self._find_erasures(occurrence_index, root_language_state), list(), None, None]]
+
+        while True:
+            frame = stack[-1]
+            language_state, erasures, children, child_erasure, _ = frame
+
+            if child_erasure is not None:
+                occurrence_index.restore(child_erasure)
+                frame[3] = None
+
+            if len(erasures) == 0:
+                value = combine(len(tape) == 0 and self._is_final(language_state), children)
+                stack.pop()
+
+                if len(stack) == 0:
+                    return value
+
+                values[(tape.content_hash, language_state)] = (str(tape), value)
+                stack[-1][2].append((stack[-1][4], value))
+                continue
+
+            position, erasing_string, next_language_state = erasures.pop()
+            stored_value = values.get((tape.erased_content_hash(position, len(erasing_string)), next_language_state))
+
+            if stored_value is not None and stored_value[0] == tape.erased_content(position, len(erasing_string)):
+                children.append((erasing_string, stored_value[1]))
+                continue
+
+            if budget is not None:
+                budget.consume()
+
+            frame[3] = occurrence_index.erase(position, len(erasing_string))
+            frame[4] = erasing_string
+            stack.append([next_language_state, self._find_erasures(occurrence_index, next_language_state), list(),
+                          None, None])
+
+    def count_derivations(self, input_string: str, budget: Optional[SearchBudget] = None) -> int:
+        """Výpočet počtu různých posloupností vymazání, které přijímají vstupní řetězec.
+
+        :param input_string: vstupní řetězec.
+        :type input_string: str
+        :param budget: rozpočet prohledávání, nebo None, pokud výpočet není omezen.
+        :type budget: Optional[SearchBudget]
+        :return: počet přijímajících posloupností vymazání.
+        :rtype: int
+        :raises SearchBudgetExhaustedException: rozpočet prohledávání byl vyčerpán.
+        """
+        return self._solve(input_string, lambda accepting, children: int(accepting) + sum(
+            count for _, count in children), budget)
+
+    def enumerate_concatenations(self, input_string: str, max_results: Optional[int] = None,
+                                 budget: Optional[SearchBudget] = None) -> List[str]:
+        """Výčet různých řetězců vzniklých konkatenací vymazávacích řetězců přijímajících posloupností vymazání.
+
+        Při omezení počtu výsledků je pro každou konfiguraci uchováno pouze max_results lexikograficky nejmenších
+        řetězců. Připojení vymazávacího řetězce na začátek pořadí řetězců nemění, a výsledkem jsou tak přesně
+        lexikograficky nejmenší řetězce ze všech řetězců vzniklých konkatenací.
+
+        :param input_string: vstupní řetězec.
+        :type input_string: str
+        :param max_results: maximální počet vrácených řetězců, nebo None, pokud počet není omezen.
+        :type max_results: Optional[int]
+        :param budget: rozpočet prohledávání, nebo None, pokud výpočet není omezen.
+        :type budget: Optional[SearchBudget]
+        :return: lexikograficky seřazený seznam řetězců vzniklých konkatenací.
+        :rtype: List[str]
+        :raises SearchBudgetExhaustedException: rozpočet prohledávání byl vyčerpán.
+        """
+        def combine(accepting: bool, children: List[Tuple[str, List[str]]]) -> List[str]:
+            concatenations = {erasing_string + suffix for erasing_string, suffixes in children for suffix in suffixes}
+
+            if accepting:
+                concatenations.add("")
+
+            if max_results is None:
+                return sorted(concatenations)
+
+            return heapq.nsmallest(max_results, concatenations)
+
+        return self._solve(input_string, combine, budget)
@@ -0,0 +1,158 @@
+"""Svědek přijetí vstupního řetězce vymazávacím systémem a jeho ověření.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje typ Witness, který reprezentuje posloupnost vymazání vedoucí k přijetí vstupního řetězce, funkci
+apply_witness(), která vymazání svědka provádí v lineárním čase vzhledem k délce vstupního řetězce, a funkci
+verify_witness(), která svědka ověřuje. Svědka lze tedy uložit či předat spolu s výsledkem a výsledek později ověřit bez
+opakovaného prohledávání.
+
+Svědek je n-tice dvojic identifikátoru vymazávacího řetězce a pozice vymazání v pořadí jejich provedení. Identifikátor
+vymazávacího řetězce je jeho index v seřazeném seznamu vymazávacích řetězců a pozice vymazání je původní index prvního
+vymazaného symbolu ve vstupním řetězci, který na rozdíl od pozice na aktuální vstupní pásce nezávisí na předchozích
+vymazáních.
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: derivation_witness.py
+"""
+
+import re
+
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from es_tools.custom_exceptions.invalid_regular_language_pattern_exception import InvalidRegularLanguagePatternException
+from es_tools.formal_models.erasing_system.custom_utils.custom_constants import INITIAL_LANGUAGE_STATE
+from es_tools.formal_models.erasing_system.custom_utils.regular_language_automaton \
+    import create_regular_language_automaton
+from es_tools.formal_models.erasing_system.custom_utils.regular_language_checking_tools import is_valid_regular_language
+
+Witness = Tuple[Tuple[int, int], ...]
+
+
+def original_positions(input_length: int, erasures: Sequence[Tuple[int, int]]) -> List[int]:
+    """Převod pozic vymazání na aktuální vstupní pásce na původní indexy ve vstupním řetězci.
+
+    Převod je využíván pouze jednou po přijetí vstupního řetězce prohledáváním řízeným strategií, jehož konfigurace
+    uchovávají pozice na aktuální vstupní pásce.
+
+    :param input_length: délka vstupního řetězce.
+    :type input_length: int
+    :param erasures: dvojice pozice vymazání na aktuální vstupní pásce a délky vymazávacího řetězce v pořadí vymazání.
+    :type erasures: Sequence[Tuple[int, int]]
+    :return: původní indexy prvních vymazaných symbolů v pořadí vymazání.
+    :rtype: List[int]
+    """
+    remaining_indices = list(range(input_length))
+    positions = list()
+
+    for position, length in erasures:
+        positions.append(remaining_indices[position])
+        del remaining_indices[position:position + length]
+
+    return positions
+
+
+def apply_witness(ordered_erasing_strings: Sequence[str], input_string: str, witness: Witness) -> Optional[str]:
+    """Provedení vymazání svědka přijetí nad vstupním řetězcem.
+
+    Vstupní páska je reprezentována obousměrně vázaným seznamem nevymazaných symbolů, a každé vymazání je tak ověřeno
+    a provedeno v čase úměrném délce vymazávacího řetězce.
+
+    :param ordered_erasing_strings: seřazený seznam vymazávacích řetězců, jehož indexy odpovídají identifikátorům
+                                    ve svědkovi.
+    :type ordered_erasing_strings: Sequence[str]
+    :param input_string: vstupní řetězec.
+    :type input_string: str
+    :param witness: prováděný svědek.
+    :type witness: Witness
+    :return: řetězec vzniklý konkatenací použitých vymazávacích řetězců, nebo None, pokud některé vymazání nelze
+             provést nebo svědek nevymaže celý vstupní řetězec.
+    :rtype: Optional[str]
+    """
+    length = len(input_string)
+
+    # Každé vymazání vymaže alespoň jeden symbol.
+    if len(witness) > length:
+        return None
+
+    # Nevymazané symboly jsou propojeny vázaným seznamem se zarážkou, jejíž index je roven délce vstupního řetězce.
+    sentinel = length
+    next_symbols = list(range(1, length + 1)) + [0]
+    previous_symbols = [length] + list(range(length))
+    erased = [False] * length
+    erased_symbols_number = 0
+    erased_strings = list()
+
+    for erasing_string_id, position in witness:
+        if not 0 <= erasing_string_id < len(ordered_erasing_strings) or not 0 <= position < length or \
+                erased[position]:
+            return None
+
+        erasing_string = ordered_erasing_strings[erasing_string_id]
+
+        if erasing_string == "":
+            return None
+
+        symbol = position
+
+        for erasing_string_symbol in erasing_string:
+            if symbol == sentinel or input_string[symbol] != erasing_string_symbol:
+                return None
+
+            erased[symbol] = True
+            symbol = next_symbols[symbol]
+
+        before = previous_symbols[position]
+        next_symbols[before] = symbol
+        previous_symbols[symbol] = before
+        erased_symbols_number = erased_symbols_number + len(erasing_string)
+        erased_strings.append(erasing_string)
+
+    if erased_symbols_number != length:
+        return None
+
+    return "".join(erased_strings)
+
+
+def verify_witness(erasing_strings: Iterable[str], regular_language: str, input_string: str,
+                   witness: Witness) -> bool:
+    """Ověření svědka přijetí vstupního řetězce.
+
+    Vymazání svědka jsou provedena v lineárním čase (viz funkce apply_witness()). Řetězec vzniklý konkatenací použitých
+    vymazávacích řetězců je poté porovnán s regulárním jazykem deterministickým konečným automatem, případně regulárním
+    výrazem, pokud automat nelze sestavit. Automat je sestavován při každém volání, a při ověřování více svědků téhož
+    vymazávacího systému je proto vhodnější metoda ErasingSystem.verify_witness(), která využívá jeho automat.
+
+    :param erasing_strings: vymazávací řetězce vymazávacího systému, jejichž indexy v seřazeném seznamu odpovídají
+                            identifikátorům ve svědkovi.
+    :type erasing_strings: Iterable[str]
+    :param regular_language: řetězec obsahující regulární výraz reprezentující regulární jazyk.
+    :type regular_language: str
+    :param input_string: vstupní řetězec.
+    :type input_string: str
+    :param witness: ověřovaný svědek.
+    :type witness: Witness
+    :return: True, pokud svědek vymaže celý vstupní řetězec a řetězec vzniklý konkatenací použitých vymazávacích
+             řetězců náleží do regulárního jazyka, jinak False.
+    :rtype: bool
+    :raises InvalidRegularLanguagePatternException: nevalidní nebo nepovolený tvar regulárního výrazu pro regulární
+                                                    jazyk.
+    """
+    if not is_valid_regular_language(regular_language):
+        raise InvalidRegularLanguagePatternException
+
+    erased_strings_concatenation = apply_witness(sorted(erasing_strings), input_string, witness)
+
+    if erased_strings_concatenation is None:
+        return False
+
+    automaton = create_regular_language_automaton(re.findall(r"(\(.+?\)|\[.+?]|.+?)", regular_language))
+
+    if automaton is not None:
+        return automaton.read(INITIAL_LANGUAGE_STATE, erased_strings_concatenation) in automaton.accepting_states
+
+    try:
+        return re.fullmatch(regular_language, erased_strings_concatenation) is not None
+    except re.error:
+        raise InvalidRegularLanguagePatternException
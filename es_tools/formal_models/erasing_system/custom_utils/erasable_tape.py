@@ -0,0 +1,258 @@
+"""Vstupní páska vymazávacího systému s vymazáváním a navracením bez kopírování.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje třídu ErasableTape, která reprezentuje vstupní pásku vymazávacího systému. Vstupní řetězec je
+uložen pouze jednou a vymazané symboly jsou pouze odpojeny z vázaného seznamu nevymazaných symbolů. Vymazání i jeho
+navrácení tak nevyžaduje vytvoření nového řetězce, ale pouze konstantní počet operací pro každý vymazaný symbol
+a aktualizaci intervalového stromu, který v logaritmickém čase udržuje aktuální pozice symbolů a hash obsahu pásky.
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: erasable_tape.py
+"""
+
+from typing import Tuple
+
+from es_tools.formal_models.erasing_system.custom_utils.custom_constants import TAPE_HASH_BASE, TAPE_HASH_MODULUS
+
+TapeErasure = Tuple[int, int, int, int]
+
+
+class ErasableTape:
+    """Vstupní páska s vymazáváním a navracením vymazání.
+
+    Symboly vstupní pásky jsou identifikovány svým původním indexem ve vstupním řetězci, přičemž pořadí původních
+    indexů odpovídá pořadí symbolů na aktuální vstupní pásce. Nevymazané symboly jsou propojeny obousměrně vázaným
+    seznamem se zarážkou, jejíž původní index je roven délce vstupního řetězce. Listy intervalového stromu odpovídají
+    symbolům vstupního řetězce a každý uzel uchovává počet nevymazaných symbolů a polynomiální hash řetězce tvořeného
+    nevymazanými symboly svého intervalu. Hash kořene tak identifikuje obsah aktuální vstupní pásky nezávisle na tom,
+    které výskyty symbolů byly vymazány. Pro sestavení obsahu vstupní pásky jsou navíc uchovávány buňky symbolů,
+    přičemž buňka vymazaného symbolu obsahuje prázdný řetězec.
+    """
+    def __init__(self, input_string: str) -> None:
+        """**Konstruktor třídy ErasableTape**
+
+        :param input_string: vstupní řetězec, přičemž se jedná o počáteční tvar vstupní pásky.
+        :type input_string: str
+        """
+        length = len(input_string)
+
+        self.symbols = input_string
+        self.__cells = list(input_string)
+        self.sentinel = length
+        self.next = list(range(1, length + 1)) + [0]
+        self.previous = [length] + list(range(length))
+        self.__length = length
+
+        self.__powers = [1] * (length + 1)
+
+        for i in range(1, length + 1):
+            self.__powers[i] = self.__powers[i - 1] * TAPE_HASH_BASE % TAPE_HASH_MODULUS
+
+        self.__leaves = 1
+
+        while self.__leaves < length:
+            self.__leaves = self.__leaves * 2
+
+        self.__counts = [0] * (2 * self.__leaves)
+        self.__hashes = [0] * (2 * self.__leaves)
+
+        for i, symbol in enumerate(input_string):
+            self.__counts[self.__leaves + i] = 1
+            self.__hashes[self.__leaves + i] = ord(symbol)
+
+        for node in range(self.__leaves - 1, 0, -1):
+            self._update_node(node)
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __str__(self) -> str:
+        return "".join(self.__cells)
+
+    @property
+    def content_hash(self) -> Tuple[int, int]:
+        """Hash obsahu aktuální vstupní pásky.
+
+        Dvojice délky vstupní pásky a polynomiálního hashe jejího obsahu. Shodný obsah vstupní pásky má vždy shodný
+        hash, přičemž pravděpodobnost shody hashe různých obsahů je vzhledem k modulu hashe malá, nikoliv však nulová.
+        Shoda hashe proto obsah vstupní pásky neprokazuje (viz metoda erased_content()).
+
+        :getter: získání hashe obsahu aktuální vstupní pásky.
+        :type: Tuple[int, int]
+        """
+        return self.__length, self.__hashes[1]
+
+    def _update_node(self, node: int) -> None:
+        """Přepočítání počtu nevymazaných symbolů a hashe uzlu intervalového stromu z jeho potomků.
+
+        :param node: index uzlu intervalového stromu.
+        :type node: int
+        """
+        left = 2 * node
+        right = left + 1
+
+        self.__counts[node] = self.__counts[left] + self.__counts[right]
+        self.__hashes[node] = (self.__hashes[left] * self.__powers[self.__counts[right]] +
+                               self.__hashes[right]) % TAPE_HASH_MODULUS
+
+    def _set_symbol(self, index: int, alive: bool) -> None:
+        """Nastavení, zda je symbol nevymazaný, a aktualizace intervalového stromu.
+
+        :param index: původní index symbolu.
+        :type index: int
+        :param alive: True, pokud je symbol nevymazaný, jinak False.
+        :type alive: bool
+        """
+        counts = self.__counts
+        hashes = self.__hashes
+        powers = self.__powers
+
+        node = self.__leaves + index
+        counts[node] = 1 if alive else 0
+        hashes[node] = ord(self.symbols[index]) if alive else 0
+        self.__cells[index] = self.symbols[index] if alive else ""
+        node = node // 2
+
+        # Přepočítání uzlů na cestě ke kořeni (viz metoda _update_node()) bez volání metody pro každý uzel.
+        while node > 0:
+            left = 2 * node
+            counts[node] = counts[left] + counts[left + 1]
+            hashes[node] = (hashes[left] * powers[counts[left + 1]] + hashes[left + 1]) % TAPE_HASH_MODULUS
+            node = node // 2
+
+    def position(self, index: int) -> int:
+        """Výpočet aktuální pozice symbolu na vstupní pásce.
+
+        :param index: původní index nevymazaného symbolu.
+        :type index: int
+        :return: počet nevymazaných symbolů před daným symbolem.
+        :rtype: int
+        """
+        position = 0
+        node = self.__leaves + index
+
+        while node > 1:
+            if node % 2 == 1:
+                position = position + self.__counts[node - 1]
+
+            node = node // 2
+
+        return position
+
+    def erased_content_hash(self, index: int, length: int) -> Tuple[int, int]:
+        """Výpočet hashe obsahu vstupní pásky po vymazání řetězce, aniž by byl řetězec skutečně vymazán.
+
+        Hash je sestaven z hashe nevymazaných symbolů před vymazávaným řetězcem a hashe nevymazaných symbolů za ním,
+        přičemž oba jsou získány průchodem intervalového stromu od listu ke kořeni.
+
+        :param index: původní index prvního symbolu vymazávaného řetězce.
+        :type index: int
+        :param length: délka vymazávaného řetězce.
+        :type length: int
+        :return: hash obsahu vstupní pásky po vymazání řetězce (viz vlastnost content_hash).
+        :rtype: Tuple[int, int]
+        """
+        counts = self.__counts
+        hashes = self.__hashes
+        powers = self.__powers
+
+        last = index
+        for _ in range(length - 1):
+            last = self.next[last]
+
+        # Hash nevymazaných symbolů před vymazávaným řetězcem.
+        prefix_hash = 0
+        prefix_count = 0
+        node = self.__leaves + index
+
+        while node > 1:
+            if node % 2 == 1:
+                prefix_hash = (hashes[node - 1] * powers[prefix_count] + prefix_hash) % TAPE_HASH_MODULUS
+                prefix_count = prefix_count + counts[node - 1]
+
+            node = node // 2
+
+        # Hash nevymazaných symbolů za vymazávaným řetězcem.
+        suffix_hash = 0
+        suffix_count = 0
+        node = self.__leaves + last
+
+        while node > 1:
+            if node % 2 == 0:
+                suffix_hash = (suffix_hash * powers[counts[node + 1]] + hashes[node + 1]) % TAPE_HASH_MODULUS
+                suffix_count = suffix_count + counts[node + 1]
+
+            node = node // 2
+
+        return self.__length - length, (prefix_hash * powers[suffix_count] + suffix_hash) % TAPE_HASH_MODULUS
+
+    def erased_content(self, index: int, length: int) -> str:
+        """Sestavení obsahu vstupní pásky po vymazání řetězce, aniž by byl řetězec skutečně vymazán.
+
+        Obsah je sestaven v lineárním čase vzhledem k délce vstupního řetězce, a je proto využíván pouze pro ověření
+        shody obsahu vstupních pásek se shodným hashem (viz metoda erased_content_hash()).
+
+        :param index: původní index prvního symbolu vymazávaného řetězce.
+        :type index: int
+        :param length: délka vymazávaného řetězce.
+        :type length: int
+        :return: obsah vstupní pásky po vymazání řetězce.
+        :rtype: str
+        """
+        last = index
+        for _ in range(length - 1):
+            last = self.next[last]
+
+        # Buňky mezi prvním a posledním vymazávaným symbolem, které nejsou vymazávány, byly vymazány již dříve.
+        return "".join(self.__cells[:index]) + "".join(self.__cells[last + 1:])
+
+    def erase(self, index: int, length: int) -> TapeErasure:
+        """Vymazání řetězce z vstupní pásky.
+
+        :param index: původní index prvního symbolu vymazávaného řetězce.
+        :type index: int
+        :param length: délka vymazávaného řetězce.
+        :type length: int
+        :return: záznam o vymazání, který slouží pro jeho navrácení metodou restore().
+        :rtype: TapeErasure
+        """
+        last = index
+        self._set_symbol(index, False)
+
+        for _ in range(length - 1):
+            last = self.next[last]
+            self._set_symbol(last, False)
+
+        # Vymazané symboly jsou pouze odpojeny z vázaného seznamu, přičemž jejich vlastní odkazy zůstávají zachovány.
+        before = self.previous[index]
+        after = self.next[last]
+        self.next[before] = after
+        self.previous[after] = before
+        self.__length = self.__length - length
+
+        return index, last, before, after
+
+    def restore(self, erasure: TapeErasure) -> None:
+        """Navrácení vymazání provedeného metodou erase().
+
+        Vymazání musí být navracena v opačném pořadí, než v jakém byla provedena.
+
+        :param erasure: záznam o vymazání.
+        :type erasure: TapeErasure
+        """
+        index, last, before, after = erasure
+
+        self.next[before] = index
+        self.previous[after] = last
+
+        symbol = index
+        while True:
+            self._set_symbol(symbol, True)
+            self.__length = self.__length + 1
+
+            if symbol == last:
+                break
+
+            symbol = self.next[symbol]
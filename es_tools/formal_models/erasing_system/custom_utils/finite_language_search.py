@@ -0,0 +1,255 @@
+"""Prohledávání řízené řetězci konečného regulárního jazyka.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje třídu FiniteLanguageSearch a funkci enumerate_finite_language(). Pokud regulární výraz neobsahuje
+operátory „*“ ani „+“ (například regulární výraz tvořený jediným řetězcem), je regulární jazyk konečný a řetězec vzniklý
+konkatenací použitých vymazávacích řetězců musí být jedním z jeho řetězců. Prohledávání je proto řízeno přímo těmito
+cílovými řetězci. Cílové řetězce musí mít stejné počty symbolů jako vstupní řetězec, a v každé konfiguraci jsou tak
+zkoušeny pouze ty vymazávací řetězce, které prodlužují již vymazaný prefix některého cílového řetězce s odpovídajícími
+počty symbolů.
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: finite_language_search.py
+"""
+
+from collections import Counter
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+from es_tools.formal_models.erasing_system.custom_utils.aho_corasick_automaton import AhoCorasickAutomaton
+from es_tools.formal_models.erasing_system.custom_utils.custom_constants import MAXIMUM_FINITE_LANGUAGE_WORDS_NUMBER
+from es_tools.formal_models.erasing_system.custom_utils.erasable_tape import ErasableTape
+from es_tools.formal_models.erasing_system.custom_utils.occurrence_index import OccurrenceIndex
+from es_tools.formal_models.erasing_system.custom_utils.search_budget import SearchBudget
+from es_tools.formal_models.erasing_system.custom_utils.search_statistics import SearchStatistics
+from es_tools.formal_models.erasing_system.custom_utils.search_tracer import SearchTracer
+
+# Pro každý uzel stromu prefixů cílových řetězců seznam dvojic vymazávacího řetězce a uzlu, do kterého vymazávací
+# řetězec z uzlu vede, a množina uzlů odpovídajících celým cílovým řetězcům.
+TargetExtensions = Tuple[List[List[Tuple[str, int]]], Set[int]]
+
+
+def enumerate_finite_language(elements: List[Tuple[List[str], str]]) -> Optional[List[str]]:
+    """Výčet všech řetězců konečného regulárního jazyka.
+
+    :param elements: seznam prvků regulárního výrazu vytvořený funkcí parse_regular_language_elements().
+    :type elements: List[Tuple[List[str], str]]
+    :return: seřazený seznam řetězců regulárního jazyka, nebo None, pokud regulární jazyk není konečný či je počet jeho
+             řetězců větší než MAXIMUM_FINITE_LANGUAGE_WORDS_NUMBER.
+    :rtype: Optional[List[str]]
+    """
+    words = {""}
+
+    for alternatives, operator in elements:
+        if operator != "":
+            return None
+
+        words = {word + alternative for word in words for alternative in alternatives}
+
+        if len(words) > MAXIMUM_FINITE_LANGUAGE_WORDS_NUMBER:
+            return None
+
+    return sorted(words)
+
+
+def parikh_vector_key(string: str) -> Hashable:
+    """Klíč Parikhova vektoru řetězce, který je shodný právě pro řetězce se stejnými počty symbolů.
+
+    :param string: řetězec.
+    :type string: str
+    :return: seřazená n-tice dvojic symbolu a počtu jeho výskytů.
+    :rtype: Hashable
+    """
+    return tuple(sorted(Counter(string).items()))
+
+
+class FiniteLanguageSearch:
+    """Úplné prohledávání vymazání řízené cílovými řetězci konečného regulárního jazyka.
+
+    Cílové řetězce se stejnými počty symbolů jako vstupní řetězec jsou uloženy ve stromu prefixů, přičemž stav
+    prohledávání je určen obsahem vstupní pásky a uzlem stromu prefixů (vymazaným prefixem cílového řetězce).
+    Prohledávány jsou všechny pozice výskytů vymazávacích řetězců, a výsledek tak odpovídá režimu ověřování všech pozic
+    vymazávacích řetězců. Stavy, ze kterých nelze vstupní řetězec přijmout, jsou uchovávány a opakovaně prohledávány
+    nejsou. Výpočet je tedy omezen počtem různých dvojic obsahu vstupní pásky a vymazaného prefixu cílového řetězce.
+    """
+    def __init__(self, words: List[str], occurrences_automaton: AhoCorasickAutomaton) -> None:
+        """**Konstruktor třídy FiniteLanguageSearch**
+
+        :param words: řetězce konečného regulárního jazyka.
+        :type words: List[str]
+        :param occurrences_automaton: automat Aho-Corasick nad množinou vymazávacích řetězců.
+        :type occurrences_automaton: AhoCorasickAutomaton
+        """
+        self.__occurrences_automaton = occurrences_automaton
+        self.__erasing_strings = [erasing_string for erasing_string in occurrences_automaton.erasing_strings
+                                  if erasing_string != ""]
+        self.__words: Dict[Hashable, List[str]] = dict()
+        self.__target_extensions: Dict[Hashable, TargetExtensions] = dict()
+
+        for word in words:
+            self.__words.setdefault(parikh_vector_key(word), list()).append(word)
+
+    def _calculate_target_extensions(self, words: List[str]) -> TargetExtensions:
+        """Sestavení stromu prefixů cílových řetězců a výpočet vymazávacích řetězců, které prodlužují jeho uzly.
+
+        :param words: cílové řetězce.
+        :type words: List[str]
+        :return: dvojice obsahující seznam prodloužení pro každý uzel a množinu koncových uzlů.
+        :rtype: TargetExtensions
+        """
+        children: List[Dict[str, int]] = [dict()]
+        accepting_nodes = set()
+
+        for word in words:
+            node = 0
+
+            for symbol in word:
+                if symbol not in children[node]:
+                    children[node][symbol] = len(children)
+                    children.append(dict())
+
+                node = children[node][symbol]
+
+            accepting_nodes.add(node)
+
+        extensions = list()
+
+        for node in range(len(children)):
+            node_extensions = list()
+
+            for erasing_string in self.__erasing_strings:
+                next_node = node
+
+                for symbol in erasing_string:
+                    next_node = children[next_node].get(symbol)
+
+                    if next_node is None:
+                        break
+
+                if next_node is not None:
+                    node_extensions.append((erasing_string, next_node))
+
+            extensions.append(node_extensions)
+
+        return extensions, accepting_nodes
+
+    def is_accepted(self, input_string: str, budget: Optional[SearchBudget] = None,
+                    statistics: Optional[SearchStatistics] = None,
+                    derivation: Optional[List[Tuple[str, int]]] = None, tracer: Optional[SearchTracer] = None) -> bool:
+        """Rozhodnutí o přijetí vstupního řetězce.
+
+        :param input_string: vstupní řetězec.
+        :type input_string: str
+        :param budget: rozpočet prohledávání, nebo None, pokud prohledávání není omezeno.
+        :type budget: Optional[SearchBudget]
+        :param statistics: statistiky prohledávání, ve kterých jsou zvyšovány čítače, nebo None.
+        :type statistics: Optional[SearchStatistics]
+        :param derivation: seznam, do kterého jsou při přijetí vstupního řetězce doplněny dvojice vymazávacího řetězce
+                           a původního indexu jeho prvního symbolu ve vstupním řetězci v pořadí vymazání, nebo None.
+        :type derivation: Optional[List[Tuple[str, int]]]
+        :param tracer: sledování průběhu prohledávání, kterému jsou předávány události prohledávání stejně jako
+                       v hlavním algoritmu vymazávacího systému, nebo None, pokud události nemají být vytvářeny.
+        :type tracer: Optional[SearchTracer]
+        :return: True, pokud lze vstupní řetězec vymazat tak, že řetězec vzniklý konkatenací použitých vymazávacích
+                 řetězců náleží do regulárního jazyka, jinak False.
+        :rtype: bool
+        :raises SearchBudgetExhaustedException: rozpočet prohledávání byl vyčerpán.
+        """
+        key = parikh_vector_key(input_string)
+
+        if key not in self.__words:
+            return False
+
+        if input_string == "":
+            if tracer is not None:
+                tracer.accept([])
+
+            return True
+
+        if statistics is None:
+            statistics = SearchStatistics()
+
+        if key not in self.__target_extensions:
+            self.__target_extensions[key] = self._calculate_target_extensions(self.__words[key])
+
+        extensions, accepting_nodes = self.__target_extensions[key]
+        tape = ErasableTape(input_string)
+        occurrence_index = OccurrenceIndex(self.__occurrences_automaton, tape)
+
+        # Neúspěšné konfigurace jsou vyhledávány podle hashe obsahu vstupní pásky a uzlu stromu prefixů. Shoda hashe
+        # obsah vstupní pásky neprokazuje, a proto je uložen i přesný obsah, který je porovnán při nalezení konfigurace.
+        failed_configurations: Dict[Tuple[Tuple[int, int], int], str] = dict()
+
+        def find_erasures(node: int) -> List[Tuple[int, str, int]]:
+            return [(position, erasing_string, next_node) for erasing_string, next_node in extensions[node]
+                    for position in occurrence_index.occurrences.get(erasing_string, ())]
+
+        # Použité vymazávací řetězce jsou sestaveny z rámců na zásobníku pouze pro události sledování.
+        def erased_strings() -> List[str]:
+            return [stack_frame[3][0] for stack_frame in stack[:-1]]
+
+        # Každý rámec obsahuje uzel stromu prefixů, dosud neprohledaná vymazání, záznam o vymazání, které vedlo
+        # k naposledy prohledávané konfiguraci, a dvojici vymazávacího řetězce a pozice tohoto vymazání.
+        stack = [[0, find_erasures(0), None, None]]
+        statistics.expanded_nodes = statistics.expanded_nodes + 1
+
+        if tracer is not None:
+            tracer.node_entered(tape, [])
+
+        while len(stack) != 0:
+            frame = stack[-1]
+            node, erasures, child_erasure, _ = frame
+
+            if child_erasure is not None:
+                occurrence_index.restore(child_erasure)
+                frame[2] = None
+
+            if len(erasures) == 0:
+                if tracer is not None:
+                    tracer.backtrack(tape, erased_strings())
+
+                failed_configurations[(tape.content_hash, node)] = str(tape)
+                stack.pop()
+                statistics.backtracks = statistics.backtracks + 1
+                continue
+
+            position, erasing_string, next_node = erasures.pop()
+
+            if tracer is not None:
+                tracer.erasure(tape, tape.position(position), erasing_string, erased_strings())
+
+            configuration = (tape.erased_content_hash(position, len(erasing_string)), next_node)
+            failed_content = failed_configurations.get(configuration)
+
+            if failed_content is not None and failed_content == tape.erased_content(position, len(erasing_string)):
+                continue
+
+            if len(tape) == len(erasing_string):
+                if next_node in accepting_nodes:
+                    if tracer is not None:
+                        tracer.accept(erased_strings() + [erasing_string])
+
+                    if derivation is not None:
+                        derivation.extend(stack_frame[3] for stack_frame in stack[:-1])
+                        derivation.append((erasing_string, position))
+
+                    return True
+
+                failed_configurations[configuration] = ""
+                continue
+
+            statistics.expanded_nodes = statistics.expanded_nodes + 1
+
+            if budget is not None:
+                budget.consume()
+
+            frame[2] = occurrence_index.erase(position, len(erasing_string))
+            frame[3] = (erasing_string, position)
+            stack.append([next_node, find_erasures(next_node), None, None])
+            statistics.maximum_depth = max(statistics.maximum_depth, len(stack) - 1)
+
+            if tracer is not None:
+                tracer.node_entered(tape, erased_strings())
+
+        return False
@@ -0,0 +1,304 @@
+"""Rozhodování o přijetí vstupního řetězce dynamickým programováním nad intervaly vstupní pásky.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje třídu IntervalDynamicProgramming, která rozhoduje o přijetí vstupního řetězce vymazávacím systémem
+bez prohledávání s nedeterministickými výběry. Každé vymazání odstraňuje souvislý podřetězec aktuální vstupní pásky,
+který v původním vstupním řetězci odpovídá symbolům oddělených mezerami, jež byly vymazány dříve. Vymazání tak tvoří
+les, a pro každý interval vstupního řetězce lze vypočítat relaci dvojic stavů automatu pro regulární jazyk (stav před
+a po přečtení vymazávacích řetězců použitých pro vymazání intervalu).
+
+Výpočet uvažuje pouze taková pořadí vymazání, ve kterých jsou vymazání každého intervalu použita bezprostředně po sobě
+a sousední intervaly jsou vymazány jeden před druhým (v libovolném pořadí). Nalezené přijetí je tedy vždy platné.
+Obecně však může přijetí vyžadovat libovolné prokládání vymazání různých intervalů, a pokud jej výpočet nenalezne,
+nelze vstupní řetězec bez dalšího odmítnout. Odmítnout jej lze pouze tehdy, pokud vstupní řetězec nelze vymazat vůbec
+(bez ohledu na regulární jazyk), což výpočet s automatem o jediném stavu rozhoduje přesně.
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: interval_dynamic_programming.py
+"""
+
+from math import gcd
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+from es_tools.formal_models.erasing_system.custom_utils.custom_constants import DEAD_STATE, INITIAL_LANGUAGE_STATE
+from es_tools.formal_models.erasing_system.custom_utils.parikh_vector_check import calculate_linear_invariants
+from es_tools.formal_models.erasing_system.custom_utils.regular_language_automaton import RegularLanguageAutomaton
+from es_tools.formal_models.erasing_system.custom_utils.search_budget import SearchBudget
+
+Relation = Dict[int, FrozenSet[int]]
+
+
+def compose_relations(first: Relation, second: Relation) -> Relation:
+    """Složení dvou relací stavů automatu (nejprve první, poté druhá relace).
+
+    :param first: první relace.
+    :type first: Relation
+    :param second: druhá relace.
+    :type second: Relation
+    :return: složená relace.
+    :rtype: Relation
+    """
+    composition = dict()
+
+    for state, next_states in first.items():
+        reachable_states = set()
+
+        for next_state in next_states:
+            reachable_states.update(second.get(next_state, ()))
+
+        if len(reachable_states) > 0:
+            composition[state] = frozenset(reachable_states)
+
+    return composition
+
+
+def compose_relations_in_any_order(first: Relation, second: Relation) -> Relation:
+    """Sjednocení složení dvou relací v obou pořadích.
+
+    :param first: první relace.
+    :type first: Relation
+    :param second: druhá relace.
+    :type second: Relation
+    :return: sjednocení složení první a druhé relace a složení druhé a první relace.
+    :rtype: Relation
+    """
+    return unite_relations(compose_relations(first, second), compose_relations(second, first))
+
+
+def unite_relations(first: Relation, second: Relation) -> Relation:
+    """Sjednocení dvou relací stavů automatu.
+
+    :param first: první relace.
+    :type first: Relation
+    :param second: druhá relace.
+    :type second: Relation
+    :return: sjednocení relací.
+    :rtype: Relation
+    """
+    if len(first) == 0:
+        return second
+
+    union = dict(first)
+
+    for state, next_states in second.items():
+        union[state] = union[state] | next_states if state in union else next_states
+
+    return union
+
+
+class IntervalDynamicProgramming:
+    """Dynamické programování nad intervaly vstupní pásky.
+
+    Pro interval [i, j) je vypočtena relace vymazání intervalu a relace bloku, tedy vymazání intervalu, jehož poslední
+    vymazání odstraňuje první i poslední symbol intervalu. Blok vymazávacího řetězce s je tvořen symboly řetězce s
+    na pozicích i = x_1 < x_2 < ... < x_m = j - 1, přičemž mezery mezi nimi jsou vymazány dříve. Relace vymazání
+    intervalu vzniká složením bloků, které jej pokrývají. Zpracovávány jsou pouze intervaly, jejichž Parikhův vektor
+    splňuje lineární invarianty vymazávacích řetězců a jejichž délka je dělitelná největším společným dělitelem délek
+    vymazávacích řetězců (ostatní intervaly nelze vymazat).
+    """
+    def __init__(self, erasing_strings: Iterable[str], automaton: Optional[RegularLanguageAutomaton]) -> None:
+        """**Konstruktor třídy IntervalDynamicProgramming**
+
+        :param erasing_strings: vymazávací řetězce.
+        :type erasing_strings: Iterable[str]
+        :param automaton: deterministický konečný automat pro regulární jazyk, nebo None, pokud nebyl sestaven.
+        :type automaton: Optional[RegularLanguageAutomaton]
+        """
+        self.__erasing_strings = sorted({erasing_string for erasing_string in erasing_strings if erasing_string != ""})
+        self.__automaton = automaton
+        self.__alphabet = sorted(set("".join(self.__erasing_strings)))
+        self.__invariants = calculate_linear_invariants(self.__erasing_strings, self.__alphabet)
+        self.__lengths_gcd = 0
+
+        for erasing_string in self.__erasing_strings:
+            self.__lengths_gcd = gcd(self.__lengths_gcd, len(erasing_string))
+
+        # Relace vymazávacích řetězců pro automat o jediném stavu (bez ohledu na regulární jazyk) a pro automat pro
+        # regulární jazyk.
+        self.__free_relations = {erasing_string: {0: frozenset([0])} for erasing_string in self.__erasing_strings}
+        self.__language_relations = None
+
+        if automaton is not None:
+            self.__language_relations = dict()
+
+            for erasing_string in self.__erasing_strings:
+                relation = dict()
+
+                for state in automaton.live_states:
+                    next_state = automaton.read(state, erasing_string)
+
+                    if next_state != DEAD_STATE:
+                        relation[state] = frozenset([next_state])
+
+                self.__language_relations[erasing_string] = relation
+
+    def _calculate_interval_keys(self, input_string: str) -> List[tuple]:
+        """Výpočet klíčů prefixů vstupního řetězce pro rychlé vyloučení intervalů, které nelze vymazat.
+
+        Interval [i, j) může být vymazán pouze tehdy, pokud se klíče prefixů délky i a j shodují.
+
+        :param input_string: vstupní řetězec.
+        :type input_string: str
+        :return: seznam klíčů všech prefixů vstupního řetězce.
+        :rtype: List[tuple]
+        """
+        values = [0] * len(self.__invariants)
+        keys = [(0,) + tuple(values)]
+
+        for position, symbol in enumerate(input_string, 1):
+            for k, invariant in enumerate(self.__invariants):
+                values[k] = values[k] + invariant.get(symbol, 0)
+
+            keys.append((position % self.__lengths_gcd if self.__lengths_gcd > 0 else 0,) + tuple(values))
+
+        return keys
+
+    def _solve(self, input_string: str, relations: Dict[str, Relation], identity: Relation,
+               budget: Optional[SearchBudget]) -> Relation:
+        """Výpočet relace vymazání celého vstupního řetězce.
+
+        :param input_string: vstupní řetězec.
+        :type input_string: str
+        :param relations: relace jednotlivých vymazávacích řetězců.
+        :type relations: Dict[str, Relation]
+        :param identity: identická relace, která odpovídá vymazání prázdného intervalu.
+        :type identity: Relation
+        :param budget: rozpočet prohledávání, jehož jednu jednotku spotřebuje každý zpracovaný interval, nebo None,
+                       pokud výpočet není omezen.
+        :type budget: Optional[SearchBudget]
+        :return: relace vymazání celého vstupního řetězce (prázdná, pokud jej nelze vymazat).
+        :rtype: Relation
+        :raises SearchBudgetExhaustedException: rozpočet prohledávání byl vyčerpán.
+        """
+        length = len(input_string)
+        keys = self._calculate_interval_keys(input_string)
+
+        # Úplnou relaci již nelze sjednocením dalších relací rozšířit, a výpočet sjednocení tak lze ukončit.
+        states = frozenset(identity.keys())
+        complete_relation = {state: states for state in states}
+
+        # erased[i][j] — relace vymazání intervalu [i, j), blocks[j][k] — relace bloku [k, j).
+        erased: List[Dict[int, Relation]] = [{i: identity} for i in range(length + 1)]
+        blocks: List[Dict[int, Relation]] = [dict() for _ in range(length + 1)]
+
+        # Vymazání intervalu [i, j) pro i > 0 je využito pouze jako mezera v bloku, a tedy pouze tehdy, pokud symbol
+        # na pozici i - 1 může být jiným než posledním symbolem vymazávacího řetězce (například pro vymazávací řetězce
+        # délky jedna postačuje vymazání intervalů začínajících pozicí 0).
+        gap_preceding_symbols = {erasing_string[t] for erasing_string in self.__erasing_strings
+                                 for t in range(len(erasing_string) - 1)}
+
+        # partial_matches[(erasing_string, t)][x] — relace vymazání intervalu začínajícího aktuální pozicí i, ve kterém
+        # je prvních t + 1 symbolů vymazávacího řetězce na pozicích končících pozicí x a mezery mezi nimi jsou vymazány.
+        for i in range(length - 1, -1, -1):
+            partial_matches: Dict[tuple, Dict[int, Relation]] = dict()
+            gap_start = i == 0 or input_string[i - 1] in gap_preceding_symbols
+
+            for erasing_string in self.__erasing_strings:
+                if erasing_string[0] == input_string[i] and len(relations[erasing_string]) > 0:
+                    partial_matches[(erasing_string, 0)] = {i: identity}
+
+            for j in range(i + 1, length + 1):
+                if budget is not None:
+                    budget.consume()
+
+                # Pokud nelze prodloužit žádnou částečnou shodu a vymazání intervalů začínajících pozicí i není využito,
+                # nemůže pro pozici i vzniknout žádný další blok.
+                if not gap_start and j > i + 1 and \
+                        all(t == len(erasing_string) - 1 for erasing_string, t in partial_matches.keys()):
+                    break
+
+                x = j - 1
+                symbol = input_string[x]
+
+                # Prodloužení částečných shod vymazávacího řetězce o symbol na pozici x.
+                for erasing_string in self.__erasing_strings:
+                    for t in range(1, len(erasing_string)):
+                        if erasing_string[t] != symbol:
+                            continue
+
+                        previous_matches = partial_matches.get((erasing_string, t - 1))
+
+                        if previous_matches is None:
+                            continue
+
+                        relation = dict()
+
+                        # Mezera mezi předchozím symbolem vymazávacího řetězce na pozici y a pozicí x musí být vymazána.
+                        for y, previous_relation in previous_matches.items():
+                            gap_relation = erased[y + 1].get(x)
+
+                            if gap_relation is not None:
+                                relation = unite_relations(relation, compose_relations_in_any_order(previous_relation,
+                                                                                                    gap_relation))
+
+                                if relation == complete_relation:
+                                    break
+
+                        if len(relation) > 0:
+                            partial_matches.setdefault((erasing_string, t), dict())[x] = relation
+
+                if keys[i] != keys[j]:
+                    continue
+
+                # Blok [i, j) vzniká vymazáním vymazávacího řetězce, jehož poslední symbol je na pozici j - 1.
+                block = dict()
+
+                for erasing_string in self.__erasing_strings:
+                    matches = partial_matches.get((erasing_string, len(erasing_string) - 1))
+
+                    if matches is not None and x in matches:
+                        block = unite_relations(block, compose_relations(matches[x], relations[erasing_string]))
+
+                if len(block) > 0:
+                    blocks[j][i] = block
+
+                if not gap_start:
+                    continue
+
+                # Interval [i, j) je pokryt vymazaným intervalem [i, k) a blokem [k, j).
+                relation = dict()
+
+                for k, block in blocks[j].items():
+                    previous_relation = erased[i].get(k)
+
+                    if previous_relation is not None:
+                        relation = unite_relations(relation, compose_relations_in_any_order(previous_relation, block))
+
+                        if relation == complete_relation:
+                            break
+
+                if len(relation) > 0:
+                    erased[i][j] = relation
+
+        return erased[0].get(length, dict())
+
+    def is_accepted(self, input_string: str, budget: Optional[SearchBudget] = None) -> Optional[bool]:
+        """Rozhodnutí o přijetí vstupního řetězce.
+
+        :param input_string: vstupní řetězec.
+        :type input_string: str
+        :param budget: rozpočet prohledávání, nebo None, pokud výpočet není omezen.
+        :type budget: Optional[SearchBudget]
+        :return: True, pokud byl nalezen způsob přijetí vstupního řetězce, False, pokud vstupní řetězec nelze vymazat
+                 (a tedy ani přijmout), a None, pokud výpočet o přijetí nerozhodl.
+        :rtype: Optional[bool]
+        :raises SearchBudgetExhaustedException: rozpočet prohledávání byl vyčerpán.
+        """
+        if any(symbol not in self.__alphabet for symbol in input_string):
+            return False
+
+        if len(self._solve(input_string, self.__free_relations, {0: frozenset([0])}, budget)) == 0:
+            return False
+
+        if self.__automaton is None:
+            return None
+
+        identity = {state: frozenset([state]) for state in self.__automaton.live_states}
+        relation = self._solve(input_string, self.__language_relations, identity, budget)
+
+        if len(relation.get(INITIAL_LANGUAGE_STATE, frozenset()) & self.__automaton.accepting_states) > 0:
+            return True
+
+        return None
@@ -3,10 +3,12 @@
 Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
 
 Tento soubor obsahuje nástroje pro porovnávání řetězců s regulárním jazykem. Významnou implementovanou funkcí je funkce
-match_transformed_language() která provádí kontrolu řetězce s upraveným regulárním jazykem, aby bylo možné ověřovat
-i částečné shody řetězce. Dále soubor obsahuje funkci calculate_levels() pro výpočet úrovní shody. Ta kalkuluje úroveň
-posledního podvýrazu shody řetězce s regulárním výrazem pro regulární jazyk a také úrovně počtů opakování prvků
-jednotlivých podvýrazů regulárního výrazu v řetězci.
+create_transformed_language(), která vytváří upravený regulární jazyk, aby bylo možné ověřovat i částečné shody
+řetězce. Všechny porovnávané (i upravené) regulární výrazy jsou s využitím funkce compile_compared_languages()
+přeloženy již při vytvoření vymazávacího systému, takže samotné porovnávání pouze využívá přeložené vzory. Dále soubor
+obsahuje funkci calculate_levels() pro výpočet úrovní shody. Ta kalkuluje úrovně počtů opakování prvků jednotlivých
+podvýrazů regulárního výrazu v řetězci, přičemž úroveň posledního podvýrazu shody řetězce s regulárním výrazem pro
+regulární jazyk je předem vypočtena funkcí calculate_match_level().
 
 :Author: David Chocholatý
 :Contact: xchoch09@stud.fit.vutbr.cz
@@ -15,54 +17,62 @@ jednotlivých podvýrazů regulárního výrazu v řetězci.
 
 import re
 
-from typing import Any, AnyStr, List, Tuple
+from typing import Any, AnyStr, List, Optional, Pattern, Tuple
 
 from es_tools.formal_models.erasing_system.custom_utils.convert_parentheses_expression_to_extension_string \
     import convert_parentheses_expression_to_extension_string
-from es_tools.formal_models.erasing_system.custom_utils.custom_constants import DEFAULT_MATCH_LEVEL
 from es_tools.formal_models.erasing_system.custom_utils.parentheses_expression_contains_string \
     import parentheses_expression_contains_string
 
 
-def calculate_levels(match_groups: Tuple[AnyStr | Any, ...], compared_language: List[str],
-                     input_string: str) -> Tuple[int, List[int]]:
-    """Výpočet úrovně shody a úrovní počtu opakování podvýrazů pro regulární výraz a vstupní řetězec.
+def calculate_match_level(compared_language: List[str]) -> int:
+    """Výpočet úrovně posledního podvýrazu shody pro porovnávaný regulární výraz.
 
-    Tato funkce slouží pro výpočet úrovní shody. Jedná se konkrétně o dva typy úrovní. První určuje úroveň posledního
-    podvýrazu shody řetězce s regulárním výrazem pro regulární jazyk. Druhý typ je seznamem a určuje úrovně počtu
-    opakování prvků jednotlivých podvýrazů regulárního výrazu ve vstupním řetězci.
+    :param compared_language: porovnávaný regulární jazyk (regulární výraz pro regulární jazyk).
+    :type compared_language: List[str]
+    :return: úroveň posledního podvýrazu shody, tedy počet podvýrazů porovnávaného regulárního výrazu bez operátorů.
+    :rtype: int
+    """
+    return len([element for element in compared_language if element not in ["*", "+"]])
+
+
+def calculate_levels(match_groups: Tuple[AnyStr | Any, ...], input_string: str) -> List[int]:
+    """Výpočet úrovní počtu opakování podvýrazů pro regulární výraz a vstupní řetězec.
+
+    Tato funkce slouží pro výpočet úrovní počtu opakování prvků jednotlivých podvýrazů regulárního výrazu ve vstupním
+    řetězci. Úroveň posledního podvýrazu shody řetězce s regulárním výrazem pro regulární jazyk nezávisí
+    na vstupním řetězci, a proto je předem vypočtena funkcí calculate_match_level(). Opakování každého podvýrazu jsou
+    počítána od pozice, na které skončila opakování předchozího podvýrazu. Vstupní řetězec přitom není zkracován, ale
+    je pouze posouvána tato pozice, a výpočet je tak lineární vzhledem k délce vstupního řetězce.
 
     :param match_groups: skupiny shody podvýrazů regulárního výrazů pro regulární jazyk se vstupním řetězcem.
     :type match_groups: Tuple[AnyStr | Any, ...]
-    :param compared_language: porovnávaný regulární jazyk (regulární výraz pro regulární jazyk).
-    :type compared_language: List[str]
     :param input_string: vstupní řetězec.
     :type input_string: str
-    :return: dvojice obsahující vypočítané úrovně. První prvek dvojice představuje úrověň posledního podvýrazu shody
-             řetězce s regulárním výrazem pro regulární jazyk. Druhý prvek, který je seznamem, obsahuje úrovně počtů
-             opakování prvků jednotlivých podvýrazů regulárního výrazu v řetězci.
-    :rtype: Tuple[int, List[int]]
+    :return: seznam obsahující úrovně počtů opakování prvků jednotlivých podvýrazů regulárního výrazu v řetězci.
+    :rtype: List[int]
     """
-    match_level = len([element for element in compared_language if element not in ["*", "+"]])
     quantifiers_levels = list()
+    position = 0
 
-    for i in range(len(match_groups)):
-        group = match_groups[i]
+    for group in match_groups:
         repeats_number = 0
 
-        if group is not None:
-            while input_string.startswith(group):
+        # Prázdná skupina by se na dané pozici opakovala nekonečněkrát, a proto není počítána.
+        if group:
+            group_length = len(group)
+
+            while input_string.startswith(group, position):
                 repeats_number = repeats_number + 1
-                input_string = input_string[len(group):]
+                position = position + group_length
 
         quantifiers_levels.append(repeats_number)
 
-    return match_level, quantifiers_levels
+    return quantifiers_levels
 
 
-def match_extended_language_ending_with_operator(compared_language: List[str],
-                                                 input_string: str) -> Tuple[bool, int, List[int]]:
-    """Funkce pro úpravu porovnávaného regulárního jazyka končícího operátorem s řetězcem.
+def extend_language_ending_with_operator(compared_language: List[str]) -> str:
+    """Funkce pro úpravu porovnávaného regulárního jazyka končícího operátorem.
 
     Tato funkce slouží pro úpravu regulárního jazyka končícího operátorem „*“ nebo „+“, kterému předchází podvýraz
     v klasických závorkách. Konkrétně dochází k patřičnému rozšíření posledního podvýrazu tak, aby kromě řetězců
@@ -72,53 +82,35 @@ def match_extended_language_ending_with_operator(compared_language: List[str],
 
     :param compared_language: porovnávaný regulární výraz pro regulární jazyk.
     :type compared_language: List[str]
-    :param input_string: vstupní řetězec.
-    :type input_string: str
-    :return: výsledek porovnání, přičemž jednotlivé prvky trojice představují po řadě: 1. zda řetězec může náležet
-             do porovnávaného regulárního jazyka, přičemž poslední podvýraz regulárního výrazu pro porovnávaný
-             regulární jazyk nemusí být zcela obsažen ve vstupním řetězci a pro tento podvýraz může docházet pouze
-             k částečné shodě, 2. úroveň posledního podvýrazu shody vstupního řetězce s regulárním výrazem pro
-             regulární jazyk, 3. úrovně počtů opakování jednotlivých prvků podvýrazů regulárního výrazu ve vstupním
-             řetězci.
-    :rtype: Tuple[bool, int, List[int]]
+    :return: rozšířený regulární výraz, nebo prázdný řetězec, pokud rozšíření nemá význam.
+    :rtype: str
     """
-    match = False
-    match_level = DEFAULT_MATCH_LEVEL
-    quantifiers_levels = list()
-
     last_but_one_compared_language_element = compared_language[-2]
     last_compared_language_element = compared_language[-1]
 
     # Následující podmínka ověřuje situaci, že poslední podvýraz regulárního výrazu obsahuje řetězec delší jak dva
     # symboly. V takovém případě je zapotřebí provést rozšíření porovnávaného regulárního výrazu. Pokud ne, dle návrhu
-    # algoritmu daná funkce by nebyla volána, pokud by řetězec náležel do regulárního jazyka bez modifikace, a tudíž
-    # vstupní řetězec nenáleží do regulárního jazyka a není zapotřebí provádět porovnání.
-    if parentheses_expression_contains_string(last_but_one_compared_language_element):
-        extended_compared_regular_language = compared_language.copy()
-
-        # Pokud byl posledním operátorem symbol „+“, musí být změněn na symbol „*“, tudíž rozšíření porovnávaného
-        # jazyka má význam. Například regulární výraz končící podčástí (a|bcd)+ bude rozšířen o výraz (b|bc)
-        # a vznikne nový konec regulárního výrazu: (a|bcd)*(b|bc).
-        if last_compared_language_element == "+":
-            extended_compared_regular_language[-1] = "*"
+    # algoritmu by porovnání s upraveným výrazem nebylo prováděno, pokud by řetězec náležel do regulárního jazyka bez
+    # modifikace, a tudíž vstupní řetězec nenáleží do regulárního jazyka a není zapotřebí provádět porovnání.
+    if not parentheses_expression_contains_string(last_but_one_compared_language_element):
+        return ""
 
-        extended_compared_regular_language.append(
-            convert_parentheses_expression_to_extension_string(
-                last_but_one_compared_language_element))
+    extended_compared_regular_language = compared_language.copy()
 
-        match_result = re.fullmatch("".join(extended_compared_regular_language), input_string)
+    # Pokud byl posledním operátorem symbol „+“, musí být změněn na symbol „*“, tudíž rozšíření porovnávaného
+    # jazyka má význam. Například regulární výraz končící podčástí (a|bcd)+ bude rozšířen o výraz (b|bc)
+    # a vznikne nový konec regulárního výrazu: (a|bcd)*(b|bc).
+    if last_compared_language_element == "+":
+        extended_compared_regular_language[-1] = "*"
 
-        if match_result:
-            match = True
-            match_level, quantifiers_levels = calculate_levels(match_result.groups(),
-                                                               compared_language,
-                                                               input_string)
+    extended_compared_regular_language.append(
+        convert_parentheses_expression_to_extension_string(
+            last_but_one_compared_language_element))
 
-    return match, match_level, quantifiers_levels
+    return "".join(extended_compared_regular_language)
 
 
-def match_transformed_language_parentheses(compared_language: List[str],
-                                           input_string: str) -> Tuple[bool, int, List[int]]:
+def transform_language_ending_with_parentheses(compared_language: List[str]) -> str:
     """Funkce pro úpravu porovnávaného regulárního jazyka končícího podvýrazem v klasických závorkách.
 
     Tato funkce slouží pro úpravu regulárního jazyka končícího podvýrazem v klasických závorkách. Konkrétně dochází
@@ -129,113 +121,134 @@ def match_transformed_language_parentheses(compared_language: List[str],
 
     :param compared_language: porovnávaný regulární výraz pro regulární jazyk.
     :type compared_language: List[str]
-    :param input_string: vstupní řetězec.
-    :type input_string: str
-    :return: výsledek porovnání, přičemž jednotlivé prvky trojice představují po řadě: 1. zda řetězec může náležet
-             do porovnávaného regulárního jazyka, přičemž poslední podvýraz regulárního výrazu pro porovnávaný
-             regulární jazyk nemusí být zcela obsažen ve vstupním řetězci a pro tento podvýraz může docházet pouze
-             k částečné shodě, 2. úroveň posledního podvýrazu shody vstupního řetězce s regulárním výrazem pro
-             regulární jazyk, 3. úrovně počtů opakování jednotlivých prvků podvýrazů regulárního výrazu ve vstupním
-             řetězci.
-    :rtype: Tuple[bool, int, List[int]]
+    :return: upravený regulární výraz, nebo prázdný řetězec, pokud úprava nemá význam.
+    :rtype: str
     """
-    match = False
-    match_level = DEFAULT_MATCH_LEVEL
-    quantifiers_levels = list()
-
     last_compared_language_element = compared_language[-1]
 
     # Pokud je posledním prvkem regulárního výrazu podvýraz v klasických závorkách, je zapotřebí zkontrolovat,
     # zda neobsahuje řetězec se dvěma nebo více symboly, takže porovnávaný jazyk je zapotřebí upravit.
-    if parentheses_expression_contains_string(last_compared_language_element):
-        extended_compared_regular_language = compared_language.copy()
+    if not parentheses_expression_contains_string(last_compared_language_element):
+        return ""
 
-        # Protože vstupní řetězec nenáležel celému porovnávanému regulárnímu výrazu, bude poslední podvýraz v závorkách
-        # transformován na výraz, který obsahuje všechny podřetězce uvedených řetězců vyjma vlastních podřetězců
-        # (podřetězců shodných s původním řetězcem). Poslední podvýraz bude nahrazen rozšiřujícím výrazem.
-        extended_compared_regular_language[-1] = \
-            convert_parentheses_expression_to_extension_string(last_compared_language_element)
+    transformed_compared_regular_language = compared_language.copy()
 
-        match_result = re.fullmatch("".join(extended_compared_regular_language), input_string)
+    # Protože vstupní řetězec nenáležel celému porovnávanému regulárnímu výrazu, bude poslední podvýraz v závorkách
+    # transformován na výraz, který obsahuje všechny podřetězce uvedených řetězců vyjma vlastních podřetězců
+    # (podřetězců shodných s původním řetězcem). Poslední podvýraz bude nahrazen rozšiřujícím výrazem.
+    transformed_compared_regular_language[-1] = \
+        convert_parentheses_expression_to_extension_string(last_compared_language_element)
 
-        if match_result:
-            match = True
-            match_level, quantifiers_levels = calculate_levels(match_result.groups(),
-                                                               compared_language,
-                                                               input_string)
+    return "".join(transformed_compared_regular_language)
 
-    return match, match_level, quantifiers_levels
 
-
-def match_transformed_language_operator(compared_language: List[str],
-                                        input_string: str) -> Tuple[bool, int, List[int]]:
-    """Pomocná funkce pro porovnání řetězce s upraveným regulárním výrazem končícím operátorem.
+def transform_language_ending_with_operator(compared_language: List[str]) -> str:
+    """Pomocná funkce pro úpravu regulárního výrazu končícího operátorem.
 
     Tato funkce slouží jako pomocná funkce pro případ, kdy regulární výraz má být upraven, pričemž končí jedním
     z operátorů: „*“ nebo „+“. Hlavní úlohou funkce je ověření, že před zmíněným operátorem se nachází výraz
     v klasických závorkách. Samotnou modifikaci porovnávaného regulárního výrazu ponechává na volané funkci
-    match_extended_language_ending_with_operator().
+    extend_language_ending_with_operator().
 
     :param compared_language: porovnávaný regulární výraz pro regulární jazyk.
     :type compared_language: List[str]
-    :param input_string: vstupní řetězec.
-    :type input_string: str
-    :return: výsledek porovnání, přičemž jednotlivé prvky trojice představují po řadě: 1. zda řetězec může náležet
-             do porovnávaného regulárního jazyka, přičemž poslední podvýraz regulárního výrazu pro porovnávaný
-             regulární jazyk nemusí být zcela obsažen ve vstupním řetězci a pro tento podvýraz může docházet pouze
-             k částečné shodě, 2. úroveň posledního podvýrazu shody vstupního řetězce s regulárním výrazem pro
-             regulární jazyk, 3. úrovně počtů opakování jednotlivých prvků podvýrazů regulárního výrazu ve vstupním
-             řetězci.
-    :rtype: Tuple[bool, int, List[int]]
+    :return: upravený regulární výraz, nebo prázdný řetězec, pokud úprava nemá význam.
+    :rtype: str
     """
-    last_but_one_compared_language_element = compared_language[-2]
-
     # Kontrola, zda předposledním prvkem porovnávaného jazyka je výraz v klasických závorkách.
-    if re.fullmatch(r"\(.+?\)", last_but_one_compared_language_element):
-        return match_extended_language_ending_with_operator(compared_language, input_string)
+    if re.fullmatch(r"\(.+?\)", compared_language[-2]):
+        return extend_language_ending_with_operator(compared_language)
 
-    return False, DEFAULT_MATCH_LEVEL, list()
+    return ""
 
 
-def match_transformed_language(compared_language: List[str], input_string: str) -> Tuple[bool, int, List[int]]:
-    """Porovnání řetězce s upraveným regulárním výrazem pro regulární jazyk.
+def create_transformed_language(compared_language: List[str]) -> str:
+    """Vytvoření upraveného regulárního výrazu pro regulární jazyk.
 
-    Tato funkce poskytuje porovnání vstupního řetězce s regulárním výrazem pro regulární jazyk. Daný regulární výraz
-    ovšem podléhá jistým úpravám. Konkrétně mohou nastat dva případy. V prvním případě může regulární výraz končit
-    operátorem „*“ nebo „+“, kterému předchází výraz v klasických závorkách. Pro takový regulární jazyk je zapotřebí
-    upravit regulární výraz tak, že budou porovnávány i všechny podřetězce řetězců obsažených v posledním podvýrazu
-    v závorkách. Na základě tohoto porovnání je možné určit, zda řetězec může i pouze částečně náležet do porovnávaného
-    regulárního jazyka. V druhém případě regulární výraz končí pouze podvýrazem v závorkách. Modifikace regulárního
-    výrazu se velmi podobá uvedenému postupu, ovšem obsahuje jisté odlišnosti na základě skutečnosti, že regulární
-    výraz nekončí jedním z dříve zmíněných operátorů.
+    Tato funkce vytváří upravený regulární výraz pro porovnání vstupního řetězce s regulárním jazykem. Konkrétně mohou
+    nastat dva případy. V prvním případě může regulární výraz končit operátorem „*“ nebo „+“, kterému předchází výraz
+    v klasických závorkách. Pro takový regulární jazyk je zapotřebí upravit regulární výraz tak, že budou porovnávány
+    i všechny podřetězce řetězců obsažených v posledním podvýrazu v závorkách. Na základě tohoto porovnání je možné
+    určit, zda řetězec může i pouze částečně náležet do porovnávaného regulárního jazyka. V druhém případě regulární
+    výraz končí pouze podvýrazem v závorkách. Modifikace regulárního výrazu se velmi podobá uvedenému postupu, ovšem
+    obsahuje jisté odlišnosti na základě skutečnosti, že regulární výraz nekončí jedním z dříve zmíněných operátorů.
 
     :param compared_language: porovnávaný regulární výraz pro regulární jazyk.
     :type compared_language: List[str]
-    :param input_string: vstupní řetězec.
-    :type input_string: str
-    :return: výsledek porovnání, přičemž jednotlivé prvky trojice představují po řadě: 1. zda řetězec může náležet
-             do porovnávaného regulárního jazyka, přičemž poslední podvýraz regulárního výrazu pro porovnávaný
-             regulární jazyk nemusí být zcela obsažen ve vstupním řetězci a pro tento podvýraz může docházet pouze
-             k částečné shodě, 2. úroveň posledního podvýrazu shody vstupního řetězce s regulárním výrazem pro
-             regulární jazyk, 3. úrovně počtů opakování jednotlivých prvků podvýrazů regulárního výrazu ve vstupním
-             řetězci.
-    :rtype: Tuple[bool, int, List[int]]
+    :return: upravený regulární výraz, nebo prázdný řetězec, pokud pro porovnávaný regulární výraz úprava nemá význam.
+    :rtype: str
     """
-    match = False
-    match_level = DEFAULT_MATCH_LEVEL
-    quantifiers_levels = list()
-
     last_compared_language_element = compared_language[-1]
 
     # Kontrola, zda je posledním prvkem porovnávaného jazyka operátor "*" nebo "+".
     if last_compared_language_element in ["*", "+"]:
         # Pokud ano, může být nutné rozšířit předchozí výraz v závorkách tak, aby také byly porovnávány jednotlivé
         # podřetězce požadovaných řetězců.
-        match, match_level, quantifiers_levels = match_transformed_language_operator(compared_language,
-                                                                                     input_string)
+        return transform_language_ending_with_operator(compared_language)
+
+    if re.fullmatch(r"\(.+?\)", last_compared_language_element):
+        return transform_language_ending_with_parentheses(compared_language)
+
+    return ""
+
+
+def compile_compared_language(compared_language: List[str]) -> Tuple[Pattern, Optional[Pattern], int]:
+    """Přeložení porovnávaného regulárního výrazu a jeho upravené varianty.
+
+    :param compared_language: porovnávaný regulární výraz pro regulární jazyk.
+    :type compared_language: List[str]
+    :return: trojice hodnot, které po řadě reprezentují:
+             1. přeložený porovnávaný regulární výraz,
+             2. přeložený upravený regulární výraz pro částečnou shodu, nebo None, pokud úprava nemá význam,
+             3. úroveň posledního podvýrazu shody pro porovnávaný regulární výraz.
+    :rtype: Tuple[Pattern, Optional[Pattern], int]
+    """
+    transformed_language = create_transformed_language(compared_language)
+
+    if transformed_language == "":
+        transformed_pattern = None
+    else:
+        transformed_pattern = re.compile(transformed_language)
+
+    return re.compile("".join(compared_language)), transformed_pattern, calculate_match_level(compared_language)
+
+
+def compile_compared_languages(regular_language: List[str],
+                               quantifier_type_greedy: bool) -> List[Tuple[Pattern, Optional[Pattern], int]]:
+    """Přeložení všech porovnávaných regulárních výrazů pro daný typ kvantifikátoru.
+
+    Pro chamtivý kvantifikátor jsou porovnávány všechny prefixy seznamu podvýrazů regulárního výrazu, přičemž
+    porovnávaný jazyk postupně roste o jeden prvek. Pro líný kvantifikátor jsou od konce regulárního výrazu postupně
+    odebírány jednotlivé podčásti, přičemž podvýraz následovaný operátorem „*“ nebo „+“ je odebrán společně s tímto
+    operátorem. Jelikož líný přístup vybírá nejkratší odpovídající porovnávaný jazyk, jsou porovnávané jazyky v obou
+    případech vráceny seřazeny od nejkratšího, aby porovnání mohlo skončit při první shodě.
+
+    :param regular_language: seznam podvýrazů regulárního výrazu pro regulární jazyk.
+    :type regular_language: List[str]
+    :param quantifier_type_greedy: typ kvantifikátoru (True — chamtivý, False — líný).
+    :type quantifier_type_greedy: bool
+    :return: seznam trojic vytvořených funkcí compile_compared_language() seřazený od nejkratšího porovnávaného jazyka.
+    :rtype: List[Tuple[Pattern, Optional[Pattern], int]]
+    """
+    compared_languages = list()
+
+    if quantifier_type_greedy:
+        for prefix_length in range(1, len(regular_language) + 1):
+            compared_languages.append(regular_language[:prefix_length])
+    else:
+        regular_language_list = regular_language.copy()
+
+        while len(regular_language_list) > 0:
+            compared_languages.append(regular_language_list)
+
+            # Pokud posledním elementem je operátor „*“ nebo „+“, je odstraněn i předcházející podvýraz regulárního
+            # výrazu pro regulární jazyk. Dle prováděných kontrol regulárního výrazu při inicializaci vymazávacího
+            # systému nemůže regulární výraz začínat jedním z uvedených operátoru.
+            if regular_language_list[-1] in ["*", "+"]:
+                regular_language_list = regular_language_list[:len(regular_language_list) - 2]
+            else:
+                regular_language_list = regular_language_list[:-1]
 
-    elif re.fullmatch(r"\(.+?\)", last_compared_language_element):
-        match, match_level, quantifiers_levels = match_transformed_language_parentheses(compared_language,
-                                                                                        input_string)
+        compared_languages.reverse()
 
-    return match, match_level, quantifiers_levels
+    return [compile_compared_language(compared_language) for compared_language in compared_languages]
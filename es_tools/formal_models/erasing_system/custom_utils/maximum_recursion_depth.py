@@ -1,14 +0,0 @@
-"""Maximální hloubka zásobníku při rekurzivních volání.
-
-Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
-
-Tento soubor obsahuje jedinou konstantu, která určuje maximální hloubku zásobníku při rekurzivních volání.
-Přesněji příslušná hodnota určuje maximální počet rekurzivních volání a zároveň dle této hodnoty je určena největší
-povolená délka vstupního řetězce vymazávacího systému.
-
-:Author: David Chocholatý
-:Contact: xchoch09@stud.fit.vutbr.cz
-:Filename: maximum_recursion_depth.py
-"""
-
-MAXIMUM_RECURSION_DEPTH = 1000
@@ -0,0 +1,154 @@
+"""Průběžně udržovaný index výskytů vymazávacích řetězců na vstupní pásce.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje třídu OccurrenceIndex, která uchovává všechny i překrývající se výskyty vymazávacích řetězců
+na vstupní pásce a po každém vymazání je aktualizuje pouze lokálně. Vymazáním řetězce z pozice p totiž mohou zaniknout
+či vzniknout pouze výskyty, které zasahují do okolí pozice p o velikosti nejdelšího vymazávacího řetězce. Každé vymazání
+lze zároveň při návratu v prohledávání vrátit, a celý index tak (společně se vstupní páskou) sdílí všechny rámce
+prohledávání.
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: occurrence_index.py
+"""
+
+from bisect import bisect_left, insort
+from typing import Dict, List, Tuple
+
+from es_tools.formal_models.erasing_system.custom_utils.aho_corasick_automaton import AhoCorasickAutomaton
+from es_tools.formal_models.erasing_system.custom_utils.erasable_tape import ErasableTape, TapeErasure
+
+Erasure = Tuple[TapeErasure, List[Tuple[str, int]], List[Tuple[str, int]]]
+
+
+class OccurrenceIndex:
+    """Index výskytů vymazávacích řetězců na vstupní pásce.
+
+    Výskyty vymazávacích řetězců jsou určeny původním indexem prvního symbolu ve vstupním řetězci (viz třída
+    ErasableTape), přičemž pořadí původních indexů odpovídá pořadí symbolů na aktuální vstupní pásce. Vymazání je
+    prováděno prostřednictvím indexu výskytů, který zároveň upravuje vstupní pásku.
+    """
+    def __init__(self, automaton: AhoCorasickAutomaton, tape: ErasableTape) -> None:
+        """**Konstruktor třídy OccurrenceIndex**
+
+        :param automaton: automat Aho-Corasick nad množinou vymazávacích řetězců.
+        :type automaton: AhoCorasickAutomaton
+        :param tape: vstupní páska v počátečním tvaru.
+        :type tape: ErasableTape
+        """
+        self.__automaton = automaton
+        self.__tape = tape
+        self.__window_size = max([len(erasing_string) for erasing_string in automaton.erasing_strings], default=1) - 1
+
+        self.occurrences: Dict[str, List[int]] = automaton.find_occurrences(str(tape))
+        self.__occurrences_at: Dict[int, List[str]] = dict()
+
+        for erasing_string, positions in self.occurrences.items():
+            for position in positions:
+                self.__occurrences_at.setdefault(position, list()).append(erasing_string)
+
+    def _add_occurrence(self, erasing_string: str, index: int) -> None:
+        insort(self.occurrences.setdefault(erasing_string, list()), index)
+        self.__occurrences_at.setdefault(index, list()).append(erasing_string)
+
+    def _remove_occurrence(self, erasing_string: str, index: int) -> None:
+        positions = self.occurrences[erasing_string]
+        del positions[bisect_left(positions, index)]
+
+        if len(positions) == 0:
+            del self.occurrences[erasing_string]
+
+        erasing_strings = self.__occurrences_at[index]
+        erasing_strings.remove(erasing_string)
+
+        if len(erasing_strings) == 0:
+            del self.__occurrences_at[index]
+
+    def erase(self, index: int, length: int) -> Erasure:
+        """Vymazání řetězce z vstupní pásky a lokální aktualizace výskytů vymazávacích řetězců.
+
+        :param index: původní index prvního symbolu vymazávaného řetězce.
+        :type index: int
+        :param length: délka vymazávaného řetězce.
+        :type length: int
+        :return: záznam o vymazání, který slouží pro jeho navrácení metodou restore().
+        :rtype: Erasure
+        """
+        tape = self.__tape
+        removed_occurrences = list()
+        added_occurrences = list()
+
+        # Zanikají všechny výskyty začínající vymazanými symboly.
+        symbol = index
+        for i in range(length):
+            if i > 0:
+                symbol = tape.next[symbol]
+
+            for erasing_string in self.__occurrences_at.get(symbol, ()):
+                removed_occurrences.append((erasing_string, symbol))
+
+        # Zanikají také výskyty začínající před vymazaným řetězcem, které do vymazaného řetězce zasahují.
+        left_symbols = list()
+        previous = tape.previous[index]
+
+        for distance in range(1, self.__window_size + 1):
+            if previous == tape.sentinel:
+                break
+
+            left_symbols.append(previous)
+
+            for erasing_string in self.__occurrences_at.get(previous, ()):
+                if len(erasing_string) > distance:
+                    removed_occurrences.append((erasing_string, previous))
+
+            previous = tape.previous[previous]
+
+        for erasing_string, occurrence_index in removed_occurrences:
+            self._remove_occurrence(erasing_string, occurrence_index)
+
+        tape_erasure = tape.erase(index, length)
+
+        # Nové výskyty mohou vzniknout pouze přes místo vymazání, a tedy v okně nejvýše window_size symbolů na obou
+        # stranách tohoto místa.
+        right_symbols = list()
+        following = tape.next[left_symbols[0]] if len(left_symbols) > 0 else tape.next[tape.sentinel]
+
+        for _ in range(self.__window_size):
+            if following == tape.sentinel:
+                break
+
+            right_symbols.append(following)
+            following = tape.next[following]
+
+        if len(left_symbols) > 0 and len(right_symbols) > 0:
+            window_symbols = left_symbols[::-1] + right_symbols
+            window = "".join(tape.symbols[symbol] for symbol in window_symbols)
+
+            for erasing_string, positions in self.__automaton.find_occurrences(window).items():
+                for position in positions:
+                    if position < len(left_symbols) < position + len(erasing_string):
+                        added_occurrences.append((erasing_string, window_symbols[position]))
+
+        for erasing_string, occurrence_index in added_occurrences:
+            self._add_occurrence(erasing_string, occurrence_index)
+
+        return tape_erasure, removed_occurrences, added_occurrences
+
+    def restore(self, erasure: Erasure) -> None:
+        """Navrácení vymazání provedeného metodou erase().
+
+        Vymazání musí být navracena v opačném pořadí, než v jakém byla provedena.
+
+        :param erasure: záznam o vymazání.
+        :type erasure: Erasure
+        """
+        tape_erasure, removed_occurrences, added_occurrences = erasure
+
+        for erasing_string, occurrence_index in added_occurrences:
+            self._remove_occurrence(erasing_string, occurrence_index)
+
+        self.__tape.restore(tape_erasure)
+
+        for erasing_string, occurrence_index in removed_occurrences:
+            self._add_occurrence(erasing_string, occurrence_index)
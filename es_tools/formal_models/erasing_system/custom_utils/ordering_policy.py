@@ -0,0 +1,137 @@
+"""Strategie pořadí prohledávání vymazávacího systému.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje abstraktní třídu OrderingPolicy a její implementace, které určují, který z rovnocenných
+aplikovatelných vymazávacích řetězců a která pozice jeho výskytu na vstupní pásce budou ověřovány jako první.
+Nedeterministický výběr hlavního algoritmu vymazávacího systému tak může být nahrazen reprodukovatelným výběrem
+(náhodným výběrem s nastaveným semínkem nebo deterministickým výběrem), díky čemuž jsou opakované běhy vymazávacího
+systému pro stejný vstupní řetězec totožné.
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: ordering_policy.py
+"""
+
+from abc import ABC, abstractmethod
+from random import Random
+from typing import Dict, List, Optional, Tuple
+
+from es_tools.formal_models.erasing_system.custom_utils.custom_constants import ERASING_STRING_TUPLE_INDEX
+
+
+class OrderingPolicy(ABC):
+    """Základní třída pro strategie pořadí prohledávání.
+
+    Strategie vybírá vymazávací řetězec z rovnocenných aplikovatelných vymazávacích řetězců (se stejnou úrovní shody
+    a úrovněmi kvantifikátorů) a pozici jeho výskytu na vstupní pásce. Před každým během vymazávacího systému je
+    volána metoda reset(), která strategii uvede do počátečního stavu.
+    """
+    def reset(self) -> None:
+        """Uvedení strategie do počátečního stavu před během vymazávacího systému."""
+        pass
+
+    @abstractmethod
+    def choose_erasing_string(self, applicable_erasing_strings: List[Tuple[str, int, Optional[List[int]], int]],
+                              occurrences: Dict[str, List[int]]) -> Tuple[str, int, Optional[List[int]], int]:
+        """Výběr vymazávacího řetězce z rovnocenných aplikovatelných vymazávacích řetězců.
+
+        :param applicable_erasing_strings: neprázdný seznam rovnocenných aplikovatelných vymazávacích řetězců.
+        :type applicable_erasing_strings: List[Tuple[str, int, Optional[List[int]], int]]
+        :param occurrences: vzestupně seřazené pozice výskytů vymazávacích řetězců na aktuální vstupní pásce.
+        :type occurrences: Dict[str, List[int]]
+        :return: vybraný aplikovatelný vymazávací řetězec.
+        :rtype: Tuple[str, int, Optional[List[int]], int]
+        """
+        pass
+
+    @abstractmethod
+    def choose_position(self, overlapping_positions: List[int]) -> int:
+        """Výběr pozice výskytu zvoleného vymazávacího řetězce na vstupní pásce.
+
+        :param overlapping_positions: neprázdný vzestupně seřazený seznam dosud neověřených pozic výskytů.
+        :type overlapping_positions: List[int]
+        :return: vybraná pozice.
+        :rtype: int
+        """
+        pass
+
+
+class SeededRandomOrderingPolicy(OrderingPolicy):
+    """Náhodný výběr s volitelným semínkem generátoru pseudonáhodných čísel.
+
+    Pokud je semínko nastaveno, je generátor před každým během vymazávacího systému inicializován stejným semínkem,
+    a opakované běhy pro stejný vstupní řetězec jsou tedy totožné. Bez semínka odpovídá výběr původnímu
+    nedeterministickému výběru hlavního algoritmu.
+    """
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """**Konstruktor třídy SeededRandomOrderingPolicy**
+
+        :param seed: semínko generátoru pseudonáhodných čísel. Hodnota None ponechává generátor bez semínka.
+        :type seed: Optional[int]
+        """
+        self.__seed = seed
+        self.__random = Random(seed)
+
+    @property
+    def seed(self) -> Optional[int]:
+        """Semínko generátoru pseudonáhodných čísel.
+
+        :getter: získání semínka generátoru pseudonáhodných čísel.
+        :type: Optional[int]
+        """
+        return self.__seed
+
+    def reset(self) -> None:
+        if self.__seed is not None:
+            self.__random.seed(self.__seed)
+
+    def choose_erasing_string(self, applicable_erasing_strings: List[Tuple[str, int, Optional[List[int]], int]],
+                              occurrences: Dict[str, List[int]]) -> Tuple[str, int, Optional[List[int]], int]:
+        return self.__random.choice(applicable_erasing_strings)
+
+    def choose_position(self, overlapping_positions: List[int]) -> int:
+        return self.__random.choice(overlapping_positions)
+
+
+class LeftmostFirstOrderingPolicy(OrderingPolicy):
+    """Výběr vymazávacího řetězce s nejlevějším výskytem na vstupní pásce a jeho nejlevější pozice."""
+    def choose_erasing_string(self, applicable_erasing_strings: List[Tuple[str, int, Optional[List[int]], int]],
+                              occurrences: Dict[str, List[int]]) -> Tuple[str, int, Optional[List[int]], int]:
+        return min(applicable_erasing_strings,
+                   key=lambda erasing_string_tuple: (
+                       occurrences[erasing_string_tuple[ERASING_STRING_TUPLE_INDEX]][0],
+                       erasing_string_tuple[ERASING_STRING_TUPLE_INDEX]))
+
+    def choose_position(self, overlapping_positions: List[int]) -> int:
+        return overlapping_positions[0]
+
+
+class RightmostFirstOrderingPolicy(OrderingPolicy):
+    """Výběr vymazávacího řetězce s nejpravějším výskytem na vstupní pásce a jeho nejpravější pozice."""
+    def choose_erasing_string(self, applicable_erasing_strings: List[Tuple[str, int, Optional[List[int]], int]],
+                              occurrences: Dict[str, List[int]]) -> Tuple[str, int, Optional[List[int]], int]:
+        return min(applicable_erasing_strings,
+                   key=lambda erasing_string_tuple: (
+                       -occurrences[erasing_string_tuple[ERASING_STRING_TUPLE_INDEX]][-1],
+                       erasing_string_tuple[ERASING_STRING_TUPLE_INDEX]))
+
+    def choose_position(self, overlapping_positions: List[int]) -> int:
+        return overlapping_positions[-1]
+
+
+class MostConstrainedFirstOrderingPolicy(OrderingPolicy):
+    """Výběr vymazávacího řetězce s nejmenším počtem výskytů na vstupní pásce a jeho nejlevější pozice.
+
+    Vymazávací řetězec s nejmenším počtem výskytů představuje nejmenší větvení prohledávání, a případný neúspěch je tak
+    odhalen co nejdříve.
+    """
+    def choose_erasing_string(self, applicable_erasing_strings: List[Tuple[str, int, Optional[List[int]], int]],
+                              occurrences: Dict[str, List[int]]) -> Tuple[str, int, Optional[List[int]], int]:
+        return min(applicable_erasing_strings,
+                   key=lambda erasing_string_tuple: (
+                       len(occurrences[erasing_string_tuple[ERASING_STRING_TUPLE_INDEX]]),
+                       erasing_string_tuple[ERASING_STRING_TUPLE_INDEX]))
+
+    def choose_position(self, overlapping_positions: List[int]) -> int:
+        return overlapping_positions[0]
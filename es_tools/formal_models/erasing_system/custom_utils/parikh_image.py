@@ -0,0 +1,177 @@
+"""Parikhův obraz regulárního jazyka vymazávacího systému.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje třídu ParikhImage, která reprezentuje množinu Parikhových vektorů (vektorů počtů jednotlivých
+symbolů) řetězců regulárního jazyka, a funkci create_parikh_image(), která ji vytváří. Pokud má každý vymazávací
+řetězec délku jedna, lze symboly vstupní pásky vymazat v libovolném pořadí a řetězec vzniklý konkatenací použitých
+vymazávacích řetězců může být libovolnou permutací vstupního řetězce. Vstupní řetězec je pak přijat právě tehdy, pokud
+jeho Parikhův vektor náleží do Parikhova obrazu regulárního jazyka, o čemž lze rozhodnout v lineárním čase vzhledem
+k délce vstupního řetězce bez jakéhokoliv prohledávání.
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: parikh_image.py
+"""
+
+from collections import Counter
+from fractions import Fraction
+from typing import Dict, List, Optional, Set, Tuple
+
+from es_tools.formal_models.erasing_system.custom_utils.custom_constants import MAXIMUM_PARIKH_IMAGE_BASES_NUMBER
+from es_tools.formal_models.erasing_system.custom_utils.search_budget import SearchBudget
+
+Vector = Tuple[int, ...]
+
+
+class ParikhImage:
+    """Parikhův obraz regulárního jazyka ve tvaru lineárních množin se společnými periodami.
+
+    Parikhův vektor řetězce regulárního jazyka je součtem jednoho z bázových vektorů a nezáporné celočíselné lineární
+    kombinace period. Periody jsou lineárně nezávislé, a koeficienty kombinace jsou tak pro každý bázový vektor určeny
+    jednoznačně řešením soustavy lineárních rovnic.
+    """
+    def __init__(self, symbols: List[str], bases: Set[Vector], periods: List[Vector]) -> None:
+        """**Konstruktor třídy ParikhImage**
+
+        :param symbols: seznam symbolů, které určují složky vektorů.
+        :type symbols: List[str]
+        :param bases: množina bázových vektorů.
+        :type bases: Set[Vector]
+        :param periods: seznam lineárně nezávislých period.
+        :type periods: List[Vector]
+        :raises ValueError: periody nejsou lineárně nezávislé.
+        """
+        self.__symbols = symbols
+        self.__bases = sorted(bases)
+        self.__periods = periods
+
+        self.__inverse_matrix = self._calculate_left_inverse_matrix()
+
+    def _calculate_left_inverse_matrix(self) -> List[List[Fraction]]:
+        """Výpočet levé inverzní matice k matici, jejíž sloupce tvoří periody.
+
+        :return: matice, jejíž řádky odpovídají periodám a sloupce složkám vektorů. Součinem matice s vektorem, který
+                 je lineární kombinací period, jsou získány koeficienty této kombinace.
+        :rtype: List[List[Fraction]]
+        :raises ValueError: periody nejsou lineárně nezávislé.
+        """
+        periods_number = len(self.__periods)
+
+        # Gaussova eliminace rozšířené matice [P^T | I] po řádcích (řádky odpovídají složkám vektorů).
+        rows = [[Fraction(period[component]) for period in self.__periods] +
+                [Fraction(int(component == column)) for column in range(len(self.__symbols))]
+                for component in range(len(self.__symbols))]
+
+        for column in range(periods_number):
+            row = next((i for i in range(column, len(rows)) if rows[i][column] != 0), None)
+
+            if row is None:
+                raise ValueError("Periods are not linearly independent.")
+
+            pivot_row = column
+            rows[pivot_row], rows[row] = rows[row], rows[pivot_row]
+            pivot = rows[pivot_row][column]
+            rows[pivot_row] = [value / pivot for value in rows[pivot_row]]
+
+            for i in range(len(rows)):
+                if i != pivot_row and rows[i][column] != 0:
+                    factor = rows[i][column]
+                    rows[i] = [value - factor * pivot_value for value, pivot_value in zip(rows[i], rows[pivot_row])]
+
+        # Levá část prvních řádků je jednotkovou maticí, a pravá část těchto řádků je tedy hledanou levou inverzní
+        # maticí.
+        return [rows[i][periods_number:] for i in range(periods_number)]
+
+    def _contains_vector(self, vector: Vector) -> bool:
+        """Ověření, zda je vektor nezápornou celočíselnou kombinací period.
+
+        :param vector: ověřovaný vektor.
+        :type vector: Vector
+        :return: True, pokud je vektor nezápornou celočíselnou kombinací period, jinak False.
+        :rtype: bool
+        """
+        coefficients = list()
+
+        for inverse_row in self.__inverse_matrix:
+            coefficient = sum(value * component for value, component in zip(inverse_row, vector) if value != 0)
+
+            if coefficient < 0 or coefficient.denominator != 1:
+                return False
+
+            coefficients.append(int(coefficient))
+
+        # Řešení soustavy musí odpovídat i ve složkách, které nebyly pro výpočet koeficientů využity.
+        return all(sum(coefficient * period[component] for coefficient, period in zip(coefficients, self.__periods))
+                   == vector[component] for component in range(len(self.__symbols)))
+
+    def contains(self, counts: Dict[str, int], budget: Optional[SearchBudget] = None) -> bool:
+        """Ověření, zda Parikhův vektor náleží do Parikhova obrazu regulárního jazyka.
+
+        :param counts: počty výskytů jednotlivých symbolů.
+        :type counts: Dict[str, int]
+        :param budget: rozpočet prohledávání, jehož doba běhu a paměť jsou ověřeny před každým bázovým vektorem, nebo
+                       None, pokud rozhodování není omezeno.
+        :type budget: Optional[SearchBudget]
+        :return: True, pokud regulární jazyk obsahuje řetězec se zadanými počty symbolů, jinak False.
+        :rtype: bool
+        :raises SearchBudgetExhaustedException: rozpočet prohledávání byl vyčerpán.
+        """
+        if any(count > 0 and symbol not in self.__symbols for symbol, count in counts.items()):
+            return False
+
+        vector = [counts.get(symbol, 0) for symbol in self.__symbols]
+
+        for base in self.__bases:
+            if budget is not None:
+                budget.check()
+
+            if self._contains_vector(tuple(count - base_count for count, base_count in zip(vector, base))):
+                return True
+
+        return False
+
+
+def create_parikh_image(elements: List[Tuple[List[str], str]]) -> Optional[ParikhImage]:
+    """Vytvoření Parikhova obrazu regulárního jazyka z prvků regulárního výrazu.
+
+    Prvek bez operátoru přispívá k bázovým vektorům Parikhovým vektorem jedné ze svých alternativ, prvek s operátorem
+    „*“ přispívá Parikhovými vektory všech alternativ k periodám a prvek s operátorem „+“ přispívá oběma způsoby
+    (opakování alespoň jednou odpovídá jedné alternativě následované libovolným počtem opakování).
+
+    :param elements: seznam prvků regulárního výrazu vytvořený funkcí parse_regular_language_elements().
+    :type elements: List[Tuple[List[str], str]]
+    :return: Parikhův obraz regulárního jazyka, nebo None, pokud periody nejsou lineárně nezávislé či je počet
+             bázových vektorů větší než MAXIMUM_PARIKH_IMAGE_BASES_NUMBER.
+    :rtype: Optional[ParikhImage]
+    """
+    symbols = sorted({symbol for alternatives, operator in elements for alternative in alternatives
+                      for symbol in alternative})
+
+    def parikh_vector(string: str) -> Vector:
+        counts = Counter(string)
+
+        return tuple(counts[symbol] for symbol in symbols)
+
+    bases = {tuple(0 for _ in symbols)}
+    periods = list()
+
+    for alternatives, operator in elements:
+        vectors = sorted({parikh_vector(alternative) for alternative in alternatives})
+
+        if operator in ["*", "+"]:
+            for vector in vectors:
+                if any(vector) and vector not in periods:
+                    periods.append(vector)
+
+        if operator in ["", "+"]:
+            bases = {tuple(base_count + count for base_count, count in zip(base, vector))
+                     for base in bases for vector in vectors}
+
+            if len(bases) > MAXIMUM_PARIKH_IMAGE_BASES_NUMBER:
+                return None
+
+    try:
+        return ParikhImage(symbols, bases, periods)
+    except ValueError:
+        return None
@@ -0,0 +1,306 @@
+"""Nutné podmínky přijetí vstupního řetězce založené na počtech symbolů.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje třídu ParikhVectorCheck a pomocné funkce, které ověřují nutné podmínky přijetí vstupního řetězce
+vymazávacím systémem na základě takzvaného Parikhova vektoru (vektoru počtů jednotlivých symbolů). Pokud je vstupní
+řetězec přijat, je jeho Parikhův vektor roven Parikhovu vektoru řetězce vzniklého konkatenací použitých vymazávacích
+řetězců. Tento vektor je tedy součtem Parikhových vektorů vymazávacích řetězců a zároveň musí odpovídat počtům symbolů
+některého řetězce regulárního jazyka. Porušení některé z podmínek lze ověřit v lineárním čase vzhledem k délce vstupního
+řetězce, a vstupní řetězec tak lze odmítnout bez prohledávání.
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: parikh_vector_check.py
+"""
+
+from collections import Counter, deque
+from fractions import Fraction
+from math import gcd
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from es_tools.formal_models.erasing_system.custom_utils.regular_language_automaton import RegularLanguageAutomaton
+from es_tools.formal_models.erasing_system.custom_utils.search_budget import SearchBudget
+
+
+def calculate_linear_invariants(erasing_strings: Iterable[str], alphabet: List[str]) -> List[Dict[str, int]]:
+    """Výpočet lineárních invariantů Parikhových vektorů vymazávacích řetězců.
+
+    Invariant je celočíselný vektor y, pro který platí, že skalární součin y s Parikhovým vektorem každého vymazávacího
+    řetězce je nulový. Skalární součin y s Parikhovým vektorem vstupního řetězce proto musí být nulový také. Invarianty
+    tvoří bázi jádra matice, jejíž řádky jsou Parikhovy vektory vymazávacích řetězců, a jsou vypočteny Gaussovou
+    eliminací nad racionálními čísly. Například pro vymazávací řetězce „Aa“ a „Bb“ jsou invarianty A - a a B - b.
+
+    :param erasing_strings: vymazávací řetězce.
+    :type erasing_strings: Iterable[str]
+    :param alphabet: seznam symbolů abecedy vymazávacího systému.
+    :type alphabet: List[str]
+    :return: seznam invariantů, přičemž každý invariant je reprezentován slovníkem nenulových koeficientů symbolů.
+    :rtype: List[Dict[str, int]]
+    """
+    rows = list()
+
+    for erasing_string in erasing_strings:
+        counts = Counter(erasing_string)
+        rows.append([Fraction(counts[symbol]) for symbol in alphabet])
+
+    # Převod matice do redukovaného odstupňovaného tvaru.
+    pivot_columns = list()
+    pivot_row = 0
+
+    for column in range(len(alphabet)):
+        row = next((i for i in range(pivot_row, len(rows)) if rows[i][column] != 0), None)
+
+        if row is None:
+            continue
+
+        rows[pivot_row], rows[row] = rows[row], rows[pivot_row]
+        pivot = rows[pivot_row][column]
+        rows[pivot_row] = [value / pivot for value in rows[pivot_row]]
+
+        for i in range(len(rows)):
+            if i != pivot_row and rows[i][column] != 0:
+                factor = rows[i][column]
+                rows[i] = [value - factor * pivot_value for value, pivot_value in zip(rows[i], rows[pivot_row])]
+
+        pivot_columns.append(column)
+        pivot_row = pivot_row + 1
+
+    # Každý sloupec bez pivotu určuje jeden vektor báze jádra.
+    invariants = list()
+
+    for free_column in range(len(alphabet)):
+        if free_column in pivot_columns:
+            continue
+
+        vector = [Fraction(0)] * len(alphabet)
+        vector[free_column] = Fraction(1)
+
+        for row, pivot_column in enumerate(pivot_columns):
+            vector[pivot_column] = -rows[row][free_column]
+
+        denominators_lcm = 1
+
+        for value in vector:
+            denominators_lcm = denominators_lcm * value.denominator // gcd(denominators_lcm, value.denominator)
+
+        invariants.append({alphabet[i]: int(value * denominators_lcm) for i, value in enumerate(vector) if value != 0})
+
+    return invariants
+
+
+def calculate_state_symbol_bounds(automaton: RegularLanguageAutomaton) \
+        -> Dict[int, Dict[str, Tuple[int, Optional[int]]]]:
+    """Výpočet minimálního a maximálního počtu výskytů jednotlivých symbolů v řetězcích, které převádí stavy automatu
+    do koncového stavu.
+
+    Minimální počty jsou pro každý symbol vypočteny prohledáváním do šířky s hranami ohodnocenými nulou či jedničkou
+    na automatu s obrácenými přechody, a to současně ze všech koncových stavů. Maximální počet je neomezený, pokud je
+    ze stavu dosažitelný cyklus mezi užitečnými stavy automatu (stavy, ze kterých je dosažitelný koncový stav), který
+    obsahuje přechod pro daný symbol. V opačném případě je vypočten jako nejdelší cesta v grafu komponent silné
+    souvislosti.
+
+    :param automaton: deterministický konečný automat pro regulární jazyk.
+    :type automaton: RegularLanguageAutomaton
+    :return: slovník, který každému užitečnému stavu automatu přiřazuje slovník dvojic minimálního a maximálního počtu
+             výskytů jednotlivých symbolů (None značí neomezený počet).
+    :rtype: Dict[int, Dict[str, Tuple[int, Optional[int]]]]
+    """
+    live_states = automaton.live_states
+    edges = {state: [(symbol, next_state) for symbol, next_state in automaton.transitions[state].items()
+                     if next_state in live_states] for state in live_states}
+    reversed_edges: Dict[int, List[Tuple[str, int]]] = {state: list() for state in live_states}
+
+    for state in live_states:
+        for symbol, next_state in edges[state]:
+            reversed_edges[next_state].append((symbol, state))
+
+    symbols = sorted({symbol for state_edges in edges.values() for symbol, next_state in state_edges})
+
+    # Komponenty silné souvislosti (iterativní Tarjanův algoritmus). Komponenty jsou nalezeny v opačném topologickém
+    # pořadí, tedy nejprve komponenty, ze kterých nevede hrana do jiné komponenty.
+    components: List[List[int]] = list()
+    component_of: Dict[int, int] = dict()
+    indexes: Dict[int, int] = dict()
+    low_links: Dict[int, int] = dict()
+    tarjan_stack: List[int] = list()
+    on_stack = set()
+
+    for root in sorted(live_states):
+        if root in indexes:
+            continue
+
+        work = [(root, 0)]
+
+        while len(work) > 0:
+            state, edge_index = work.pop()
+
+            if edge_index == 0:
+                indexes[state] = low_links[state] = len(indexes)
+                tarjan_stack.append(state)
+                on_stack.add(state)
+
+            if edge_index < len(edges[state]):
+                work.append((state, edge_index + 1))
+                next_state = edges[state][edge_index][1]
+
+                if next_state not in indexes:
+                    work.append((next_state, 0))
+                elif next_state in on_stack:
+                    low_links[state] = min(low_links[state], indexes[next_state])
+
+                continue
+
+            for symbol, next_state in edges[state]:
+                if next_state in on_stack:
+                    low_links[state] = min(low_links[state], low_links[next_state])
+
+            if low_links[state] == indexes[state]:
+                component = list()
+
+                while True:
+                    member = tarjan_stack.pop()
+                    on_stack.discard(member)
+                    component_of[member] = len(components)
+                    component.append(member)
+
+                    if member == state:
+                        break
+
+                components.append(component)
+
+    bounds: Dict[int, Dict[str, Tuple[int, Optional[int]]]] = {state: dict() for state in live_states}
+
+    for symbol in symbols:
+        # Minimální počet výskytů symbolu.
+        distances = {state: 0 for state in automaton.accepting_states if state in live_states}
+        to_process = deque(distances.keys())
+
+        while len(to_process) > 0:
+            state = to_process.popleft()
+
+            for edge_symbol, previous_state in reversed_edges[state]:
+                weight = 1 if edge_symbol == symbol else 0
+                distance = distances[state] + weight
+
+                if distance < distances.get(previous_state, distance + 1):
+                    distances[previous_state] = distance
+
+                    if weight == 0:
+                        to_process.appendleft(previous_state)
+                    else:
+                        to_process.append(previous_state)
+
+        # Maximální počet výskytů symbolu, přičemž None značí neomezený počet.
+        longest: List[Optional[int]] = list()
+        unbounded: List[bool] = list()
+
+        for component_index, component in enumerate(components):
+            component_unbounded = False
+            best = 0
+
+            for state in component:
+                for edge_symbol, next_state in edges[state]:
+                    next_component = component_of[next_state]
+
+                    if next_component == component_index:
+                        component_unbounded = component_unbounded or edge_symbol == symbol
+                    elif unbounded[next_component]:
+                        component_unbounded = True
+                    else:
+                        best = max(best, longest[next_component] + (1 if edge_symbol == symbol else 0))
+
+            longest.append(None if component_unbounded else best)
+            unbounded.append(component_unbounded)
+
+        for state in live_states:
+            bounds[state][symbol] = (distances[state], longest[component_of[state]])
+
+    return bounds
+
+
+def calculate_language_symbol_bounds(automaton: RegularLanguageAutomaton) -> Dict[str, Tuple[int, Optional[int]]]:
+    """Výpočet minimálního a maximálního počtu výskytů jednotlivých symbolů v řetězcích regulárního jazyka.
+
+    :param automaton: deterministický konečný automat pro regulární jazyk.
+    :type automaton: RegularLanguageAutomaton
+    :return: slovník, který každému symbolu automatu přiřazuje dvojici minimálního a maximálního počtu výskytů
+             (None značí neomezený počet). Pokud je regulární jazyk prázdný, je navrácen prázdný slovník.
+    :rtype: Dict[str, Tuple[int, Optional[int]]]
+    """
+    return calculate_state_symbol_bounds(automaton).get(0, dict())
+
+
+class ParikhVectorCheck:
+    """Ověření nutných podmínek přijetí vstupního řetězce na základě počtů symbolů.
+
+    Všechny podmínky jsou předem připraveny při vytvoření vymazávacího systému. Ověřováno je, zda:
+
+    1. každý symbol vstupního řetězce se vyskytuje v některém vymazávacím řetězci,
+    2. délka vstupního řetězce je dělitelná největším společným dělitelem délek vymazávacích řetězců,
+    3. Parikhův vektor vstupního řetězce splňuje všechny lineární invarianty vymazávacích řetězců,
+    4. počet výskytů každého symbolu leží mezi minimálním a maximálním počtem výskytů symbolu v řetězcích regulárního
+       jazyka (pouze pokud je pro regulární jazyk sestaven automat).
+    """
+    def __init__(self, erasing_strings: Iterable[str], automaton: Optional[RegularLanguageAutomaton]) -> None:
+        """**Konstruktor třídy ParikhVectorCheck**
+
+        :param erasing_strings: vymazávací řetězce.
+        :type erasing_strings: Iterable[str]
+        :param automaton: deterministický konečný automat pro regulární jazyk, nebo None, pokud nebyl sestaven.
+        :type automaton: Optional[RegularLanguageAutomaton]
+        """
+        erasing_strings = [erasing_string for erasing_string in erasing_strings if erasing_string != ""]
+
+        self.__alphabet = sorted(set("".join(erasing_strings)))
+        self.__lengths_gcd = 0
+
+        for erasing_string in erasing_strings:
+            self.__lengths_gcd = gcd(self.__lengths_gcd, len(erasing_string))
+
+        self.__invariants = calculate_linear_invariants(erasing_strings, self.__alphabet)
+        self.__language_bounds: Optional[Dict[str, Tuple[int, Optional[int]]]] = None
+        self.__empty_language = False
+
+        if automaton is not None:
+            self.__language_bounds = calculate_language_symbol_bounds(automaton)
+            self.__empty_language = 0 not in automaton.live_states
+
+    def is_feasible(self, input_string: str, budget: Optional[SearchBudget] = None) -> bool:
+        """Ověření nutných podmínek přijetí vstupního řetězce.
+
+        :param input_string: vstupní řetězec.
+        :type input_string: str
+        :param budget: rozpočet prohledávání, jehož doba běhu a paměť jsou ověřeny po spočítání symbolů vstupního
+                       řetězce, nebo None, pokud ověření není omezeno.
+        :type budget: Optional[SearchBudget]
+        :return: False, pokud vstupní řetězec jistě nemůže být přijat, jinak True.
+        :rtype: bool
+        :raises SearchBudgetExhaustedException: rozpočet prohledávání byl vyčerpán.
+        """
+        if self.__empty_language:
+            return False
+
+        counts = Counter(input_string)
+
+        if budget is not None:
+            budget.check()
+
+        if any(symbol not in self.__alphabet for symbol in counts):
+            return False
+
+        if self.__lengths_gcd > 0 and len(input_string) % self.__lengths_gcd != 0:
+            return False
+
+        for invariant in self.__invariants:
+            if sum(coefficient * counts[symbol] for symbol, coefficient in invariant.items()) != 0:
+                return False
+
+        if self.__language_bounds is not None:
+            for symbol in self.__alphabet:
+                minimum, maximum = self.__language_bounds.get(symbol, (0, 0))
+
+                if counts[symbol] < minimum or (maximum is not None and counts[symbol] > maximum):
+                    return False
+
+        return True
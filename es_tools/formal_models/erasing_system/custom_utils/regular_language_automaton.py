@@ -0,0 +1,299 @@
+"""Deterministický konečný automat pro regulární jazyk vymazávacího systému.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje třídu RegularLanguageAutomaton, která reprezentuje deterministický konečný automat přijímající
+regulární jazyk vymazávacího systému. Automat je sestaven ze seznamu podvýrazů regulárního výrazu (viz metoda
+ErasingSystem._set_regular_language()) a umožňuje vymazávacímu systému uchovávat místo celého řetězce vzniklého
+konkatenací použitých vymazávacích řetězců pouze stav automatu. Pro každý stav automatu je zároveň předem vypočtena
+úroveň shody řetězce s regulárním výrazem, která odpovídá úrovni vypočtené při porovnávání s využitím chamtivého
+i líného kvantifikátoru. Funkce create_regular_language_automaton() automat vytváří, pokud regulární výraz obsahuje
+pouze podporované konstrukce (symboly, výčty symbolů v hranatých závorkách, sjednocení řetězců v klasických závorkách
+a operátory „*“ a „+“).
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: regular_language_automaton.py
+"""
+
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
+
+from es_tools.formal_models.erasing_system.custom_utils.custom_constants import DEAD_STATE, \
+    MAXIMUM_AUTOMATON_STATES_NUMBER
+
+NfaState = Union[int, Tuple[int, int, int]]
+
+
+def expand_set_of_characters(expression: str) -> List[str]:
+    """Převod výčtu symbolů v hranatých závorkách na seznam symbolů.
+
+    Například výraz „[a-dx]“ je převeden na seznam ["a", "b", "c", "d", "x"].
+
+    :param expression: výraz v hranatých závorkách.
+    :type expression: str
+    :return: seznam všech symbolů, které výraz obsahuje.
+    :rtype: List[str]
+    """
+    content = expression[1:-1]
+    symbols = list()
+    i = 0
+
+    while i < len(content):
+        if i + 2 < len(content) and content[i + 1] == "-":
+            symbols.extend(chr(code) for code in range(ord(content[i]), ord(content[i + 2]) + 1))
+            i = i + 3
+        else:
+            symbols.append(content[i])
+            i = i + 1
+
+    return symbols
+
+
+def parse_regular_language_elements(regular_language: List[str]) -> Optional[List[Tuple[List[str], str]]]:
+    """Převod seznamu podvýrazů regulárního výrazu na seznam prvků pro sestavení automatu.
+
+    Každý prvek je reprezentován dvojicí obsahující seznam řetězců, které prvek přijímá (alternativy), a operátor
+    následující za prvkem („*“, „+“ nebo prázdný řetězec).
+
+    :param regular_language: seznam podvýrazů regulárního výrazu pro regulární jazyk.
+    :type regular_language: List[str]
+    :return: seznam prvků regulárního výrazu, nebo None, pokud regulární výraz obsahuje nepodporovanou konstrukci.
+    :rtype: Optional[List[Tuple[List[str], str]]]
+    """
+    elements = list()
+
+    for element in regular_language:
+        if element in ["*", "+"]:
+            if len(elements) == 0 or elements[-1][1] != "":
+                return None
+
+            elements[-1] = (elements[-1][0], element)
+        elif len(element) > 2 and element[0] == "(" and element[-1] == ")":
+            alternatives = element[1:-1].split("|")
+
+            if any(symbol in alternative for alternative in alternatives for symbol in "*+()[]"):
+                return None
+
+            elements.append((alternatives, ""))
+        elif len(element) > 2 and element[0] == "[" and element[-1] == "]":
+            elements.append((expand_set_of_characters(element), ""))
+        elif len(element) == 1 and element not in "()[]|":
+            elements.append(([element], ""))
+        else:
+            return None
+
+    return elements
+
+
+class RegularLanguageAutomaton:
+    """Deterministický konečný automat pro regulární jazyk vymazávacího systému.
+
+    Automat je nejprve sestaven jako nedeterministický, přičemž jeho stavy představují hranice mezi prvky regulárního
+    výrazu (celé číslo udávající počet již přečtených prvků) a pozice uvnitř řetězců obsažených v prvku (trojice
+    index prvku, index alternativy a pozice v alternativě). Následně je podmnožinovou konstrukcí převeden
+    na deterministický automat, jehož stavy jsou očíslovány od nuly (počáteční stav). Neexistující přechod vede
+    do takzvaného mrtvého stavu DEAD_STATE.
+    """
+    def __init__(self, elements: List[Tuple[List[str], str]]) -> None:
+        """**Konstruktor třídy RegularLanguageAutomaton**
+
+        :param elements: seznam prvků regulárního výrazu vytvořený funkcí parse_regular_language_elements().
+        :type elements: List[Tuple[List[str], str]]
+        :raises OverflowError: počet stavů deterministického automatu překračuje maximální povolený počet.
+        """
+        self.__elements = elements
+        self.transitions = list()
+        self.accepting_states = set()
+        self.live_states = set()
+        self.match_levels = list()
+
+        self._determinize()
+        self._calculate_live_states()
+
+    @property
+    def states_number(self) -> int:
+        """Počet stavů deterministického automatu (bez mrtvého stavu).
+
+        :getter: získání počtu stavů automatu.
+        :type: int
+        """
+        return len(self.transitions)
+
+    def _epsilon_closure(self, nfa_states: Set[NfaState]) -> FrozenSet[NfaState]:
+        """Výpočet epsilon-uzávěru množiny stavů nedeterministického automatu.
+
+        Epsilon-přechod vede z hranice před prvkem na hranici za prvkem, pokud prvek může přijmout prázdný řetězec.
+
+        :param nfa_states: množina stavů nedeterministického automatu.
+        :type nfa_states: Set[NfaState]
+        :return: epsilon-uzávěr množiny stavů.
+        :rtype: FrozenSet[NfaState]
+        """
+        closure = set(nfa_states)
+        to_process = [nfa_state for nfa_state in nfa_states if isinstance(nfa_state, int)]
+
+        while len(to_process) > 0:
+            boundary = to_process.pop()
+
+            if boundary < len(self.__elements):
+                alternatives, operator = self.__elements[boundary]
+
+                if (operator == "*" or "" in alternatives) and boundary + 1 not in closure:
+                    closure.add(boundary + 1)
+                    to_process.append(boundary + 1)
+
+        return frozenset(closure)
+
+    def _nfa_step(self, nfa_states: FrozenSet[NfaState], symbol: str) -> Set[NfaState]:
+        """Přechod nedeterministického automatu pro jeden symbol.
+
+        :param nfa_states: aktuální množina stavů nedeterministického automatu.
+        :type nfa_states: FrozenSet[NfaState]
+        :param symbol: přečtený symbol.
+        :type symbol: str
+        :return: množina stavů po přečtení symbolu (bez epsilon-uzávěru).
+        :rtype: Set[NfaState]
+        """
+        next_states = set()
+
+        for nfa_state in nfa_states:
+            if isinstance(nfa_state, int):
+                # Z hranice lze začít číst následující prvek nebo opakovat předchozí prvek s operátorem „*“ či „+“.
+                startable_elements = list()
+
+                if nfa_state < len(self.__elements):
+                    startable_elements.append(nfa_state)
+
+                if nfa_state > 0 and self.__elements[nfa_state - 1][1] != "":
+                    startable_elements.append(nfa_state - 1)
+
+                for element_index in startable_elements:
+                    for alternative_index, alternative in enumerate(self.__elements[element_index][0]):
+                        if alternative != "" and alternative[0] == symbol:
+                            if len(alternative) == 1:
+                                next_states.add(element_index + 1)
+                            else:
+                                next_states.add((element_index, alternative_index, 1))
+            else:
+                element_index, alternative_index, offset = nfa_state
+                alternative = self.__elements[element_index][0][alternative_index]
+
+                if alternative[offset] == symbol:
+                    if offset + 1 == len(alternative):
+                        next_states.add(element_index + 1)
+                    else:
+                        next_states.add((element_index, alternative_index, offset + 1))
+
+        return next_states
+
+    def _determinize(self) -> None:
+        """Podmnožinová konstrukce deterministického automatu.
+
+        :raises OverflowError: počet stavů deterministického automatu překračuje maximální povolený počet.
+        """
+        symbols = set()
+
+        for alternatives, operator in self.__elements:
+            for alternative in alternatives:
+                symbols.update(alternative)
+
+        initial_state = self._epsilon_closure({0})
+        state_numbers: Dict[FrozenSet[NfaState], int] = {initial_state: 0}
+        states = [initial_state]
+
+        i = 0
+        while i < len(states):
+            nfa_states = states[i]
+            state_transitions = dict()
+
+            for symbol in symbols:
+                next_nfa_states = self._nfa_step(nfa_states, symbol)
+
+                if len(next_nfa_states) == 0:
+                    continue
+
+                next_state = self._epsilon_closure(next_nfa_states)
+
+                if next_state not in state_numbers:
+                    if len(states) >= MAXIMUM_AUTOMATON_STATES_NUMBER:
+                        raise OverflowError
+
+                    state_numbers[next_state] = len(states)
+                    states.append(next_state)
+
+                state_transitions[symbol] = state_numbers[next_state]
+
+            self.transitions.append(state_transitions)
+
+            if len(self.__elements) in nfa_states:
+                self.accepting_states.add(i)
+
+            # Úroveň shody odpovídá nejkratší podčásti regulárního výrazu, do které řetězec může náležet. Hranice
+            # za k-tým prvkem představuje úroveň k, pozice uvnitř k-tého prvku (číslováno od nuly) úroveň k + 1.
+            self.match_levels.append(min(nfa_state if isinstance(nfa_state, int) else nfa_state[0] + 1
+                                         for nfa_state in nfa_states))
+
+            i = i + 1
+
+    def _calculate_live_states(self) -> None:
+        """Výpočet stavů, ze kterých je dosažitelný některý z koncových stavů."""
+        reverse_transitions = [list() for _ in range(len(self.transitions))]
+
+        for state, state_transitions in enumerate(self.transitions):
+            for next_state in state_transitions.values():
+                reverse_transitions[next_state].append(state)
+
+        self.live_states = set(self.accepting_states)
+        to_process = list(self.accepting_states)
+
+        while len(to_process) > 0:
+            state = to_process.pop()
+
+            for previous_state in reverse_transitions[state]:
+                if previous_state not in self.live_states:
+                    self.live_states.add(previous_state)
+                    to_process.append(previous_state)
+
+    def read(self, state: int, string: str) -> int:
+        """Přečtení řetězce automatem z daného stavu.
+
+        :param state: stav, ze kterého je řetězec čten.
+        :type state: int
+        :param string: čtený řetězec.
+        :type string: str
+        :return: stav po přečtení řetězce, nebo DEAD_STATE, pokud z něj není dosažitelný žádný koncový stav.
+        :rtype: int
+        """
+        transitions = self.transitions
+
+        for symbol in string:
+            state = transitions[state].get(symbol, DEAD_STATE)
+
+            if state == DEAD_STATE:
+                return DEAD_STATE
+
+        if state not in self.live_states:
+            return DEAD_STATE
+
+        return state
+
+
+def create_regular_language_automaton(regular_language: List[str]) -> Optional[RegularLanguageAutomaton]:
+    """Vytvoření deterministického konečného automatu pro regulární jazyk vymazávacího systému.
+
+    :param regular_language: seznam podvýrazů regulárního výrazu pro regulární jazyk.
+    :type regular_language: List[str]
+    :return: deterministický konečný automat, nebo None, pokud regulární výraz obsahuje nepodporovanou konstrukci nebo
+             by automat obsahoval příliš mnoho stavů. V takovém případě vymazávací systém využívá porovnávání
+             s regulárními výrazy.
+    :rtype: Optional[RegularLanguageAutomaton]
+    """
+    elements = parse_regular_language_elements(regular_language)
+
+    if elements is None:
+        return None
+
+    try:
+        return RegularLanguageAutomaton(elements)
+    except OverflowError:
+        return None
@@ -0,0 +1,137 @@
+"""Rozpočet prohledávání vymazávacího systému.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje třídu SearchBudget, která omezuje počet prohledaných konfigurací, dobu běhu a paměť alokovanou
+během prohledávání vymazávacího systému, a výčet SearchResult, který reprezentuje výsledek běhu s rozpočtem. Pokud je
+rozpočet vyčerpán, není o přijetí vstupního řetězce rozhodnuto a výsledkem je hodnota SearchResult.UNKNOWN.
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: search_budget.py
+"""
+
+import time
+import tracemalloc
+
+from enum import Enum
+from typing import Optional
+
+from es_tools.custom_exceptions.search_budget_exhausted_exception import SearchBudgetExhaustedException
+
+
+class SearchResult(Enum):
+    """Výčet výsledků běhu vymazávacího systému s rozpočtem prohledávání.
+
+    Tato třída obsahuje výčet všech možných výsledků, přičemž je zděděna od rodičovské třídy Enum.
+    """
+    ACCEPTED = 1
+    """
+    Vstupní řetězec je přijat.
+    """
+    REJECTED = 2
+    """
+    Vstupní řetězec je odmítnut.
+    """
+    UNKNOWN = 3
+    """
+    Rozpočet prohledávání byl vyčerpán před rozhodnutím o přijetí vstupního řetězce.
+    """
+
+
+class SearchBudget:
+    """Rozpočet prohledávání vymazávacího systému.
+
+    Každá prohledaná konfigurace spotřebuje jednu jednotku rozpočtu, přičemž při každém spotřebování je ověřena také
+    doba běhu a paměť. Paměť je měřena modulem tracemalloc jako velikost paměti alokované od začátku běhu. Sledování
+    alokací běh výrazně zpomaluje, a je proto zapnuto pouze tehdy, pokud je paměť omezena.
+    """
+    def __init__(self, max_nodes: Optional[int] = None,
+                 max_time: Optional[float] = None,
+                 max_memory: Optional[int] = None) -> None:
+        """**Konstruktor třídy SearchBudget**
+
+        :param max_nodes: maximální počet prohledaných konfigurací, nebo None, pokud není omezen.
+        :type max_nodes: Optional[int]
+        :param max_time: maximální doba běhu v sekundách, nebo None, pokud není omezena.
+        :type max_time: Optional[float]
+        :param max_memory: maximální velikost paměti alokované během běhu v bajtech, nebo None, pokud není omezena.
+        :type max_memory: Optional[int]
+        """
+        self.__max_nodes = max_nodes
+        self.__max_time = max_time
+        self.__max_memory = max_memory
+        self.__nodes = 0
+        self.__start_time = time.perf_counter()
+        self.__stop_time: Optional[float] = None
+        self.__start_memory = 0
+        self.__tracing_started = False
+
+    @property
+    def nodes(self) -> int:
+        """Počet konfigurací prohledaných od začátku běhu.
+
+        :getter: získání počtu prohledaných konfigurací.
+        :type: int
+        """
+        return self.__nodes
+
+    @property
+    def elapsed_time(self) -> float:
+        """Doba běhu, případně doba od začátku dosud neukončeného běhu.
+
+        :getter: získání doby běhu v sekundách.
+        :type: float
+        """
+        stop_time = time.perf_counter() if self.__stop_time is None else self.__stop_time
+
+        return stop_time - self.__start_time
+
+    def start(self) -> None:
+        """Uvedení rozpočtu do počátečního stavu na začátku běhu vymazávacího systému."""
+        self.__nodes = 0
+        self.__start_time = time.perf_counter()
+        self.__stop_time = None
+
+        if self.__max_memory is not None:
+            # Sledování alokací, které bylo zapnuto již dříve (například při ladění), není po skončení běhu vypnuto.
+            self.__tracing_started = not tracemalloc.is_tracing()
+
+            if self.__tracing_started:
+                tracemalloc.start()
+
+            self.__start_memory = tracemalloc.get_traced_memory()[0]
+
+    def stop(self) -> None:
+        """Ukončení měření doby běhu a sledování alokací na konci běhu vymazávacího systému."""
+        self.__stop_time = time.perf_counter()
+
+        if self.__tracing_started:
+            tracemalloc.stop()
+            self.__tracing_started = False
+
+    def consume(self) -> None:
+        """Spotřebování rozpočtu na prohledání jedné konfigurace.
+
+        :raises SearchBudgetExhaustedException: rozpočet prohledávání byl vyčerpán.
+        """
+        self.__nodes = self.__nodes + 1
+
+        if self.__max_nodes is not None and self.__nodes > self.__max_nodes:
+            raise SearchBudgetExhaustedException()
+
+        self.check()
+
+    def check(self) -> None:
+        """Ověření doby běhu a paměti bez spotřebování rozpočtu na prohledání konfigurace.
+
+        Ověření je využíváno rozhodovacími postupy, které konfigurace neprohledávají.
+
+        :raises SearchBudgetExhaustedException: doba běhu nebo paměť překročila rozpočet prohledávání.
+        """
+        if self.__max_time is not None and time.perf_counter() - self.__start_time > self.__max_time:
+            raise SearchBudgetExhaustedException()
+
+        if self.__max_memory is not None and \
+                tracemalloc.get_traced_memory()[0] - self.__start_memory > self.__max_memory:
+            raise SearchBudgetExhaustedException()
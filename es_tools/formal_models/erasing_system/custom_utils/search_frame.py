@@ -0,0 +1,61 @@
+"""Rámec explicitního zásobníku prohledávání vymazávacího systému.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje třídu SearchFrame, která uchovává stav jednoho uzlu prohledávání vymazávacího systému. Hlavní
+algoritmus vymazávacího systému místo rekurzivních volání využívá explicitní zásobník těchto rámců, a délka vstupního
+řetězce tak není omezena maximální hloubkou zásobníku rekurzivních volání jazyka Python.
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: search_frame.py
+"""
+
+from typing import FrozenSet, Hashable, List, Optional, Tuple
+
+from es_tools.formal_models.erasing_system.custom_utils.applicable_erasing_strings_queue \
+    import ApplicableErasingStringsQueue
+from es_tools.formal_models.erasing_system.custom_utils.occurrence_index import Erasure
+
+
+class SearchFrame:
+    """Rámec jednoho uzlu prohledávání vymazávacího systému.
+
+    Vstupní páska a řetězec vzniklý konkatenací použitých vymazávacích řetězců jsou sdíleny všemi rámci (viz třídy
+    ErasableTape a OccurrenceIndex). Rámec tedy obsahuje pouze stav automatu pro regulární jazyk, dosud neověřené
+    aplikovatelné vymazávací řetězce, právě ověřovaný vymazávací řetězec se zbývajícími pozicemi jeho výskytů
+    (původními indexy symbolů vstupní pásky) a konfiguraci, která byla z rámce naposledy prohledávána, společně
+    se záznamem o vymazání, které k ní vedlo. Při redukci nezávislých vymazání rámec obsahuje také množinu vymazání
+    (dvojic vymazávacího řetězce a aktuální pozice jeho výskytu), která z něj nemusí být prohledávána, a případně
+    množinu vymazání, která jediná z něj mají být prohledána.
+    """
+    __slots__ = ("language_state", "applicable_erasing_strings", "erasing_string_tuple", "overlapping_positions",
+                 "selected_position", "child_configuration", "child_erasure", "sleep_set", "child_sleep_set",
+                 "awake_erasures")
+
+    def __init__(self, language_state: int, applicable_erasing_strings: ApplicableErasingStringsQueue,
+                 sleep_set: FrozenSet[Tuple[str, int]] = frozenset(),
+                 awake_erasures: Optional[FrozenSet[Tuple[str, int]]] = None) -> None:
+        """**Konstruktor třídy SearchFrame**
+
+        :param language_state: stav automatu pro regulární jazyk.
+        :type language_state: int
+        :param applicable_erasing_strings: prioritní fronta aplikovatelných vymazávacích řetězců v aktuálním stavu
+                                           přijímání.
+        :type applicable_erasing_strings: ApplicableErasingStringsQueue
+        :param sleep_set: množina vymazání, která z rámce nemusí být prohledávána.
+        :type sleep_set: FrozenSet[Tuple[str, int]]
+        :param awake_erasures: množina vymazání, která jediná mají být z rámce prohledána, nebo None, pokud mají být
+                               prohledána všechna vymazání.
+        :type awake_erasures: Optional[FrozenSet[Tuple[str, int]]]
+        """
+        self.language_state = language_state
+        self.applicable_erasing_strings = applicable_erasing_strings
+        self.erasing_string_tuple: Optional[Tuple[str, int, Optional[List[int]], int]] = None
+        self.overlapping_positions: List[int] = list()
+        self.selected_position = -1
+        self.child_configuration: Optional[Hashable] = None
+        self.child_erasure: Optional[Erasure] = None
+        self.sleep_set = sleep_set
+        self.child_sleep_set: FrozenSet[Tuple[str, int]] = frozenset()
+        self.awake_erasures = awake_erasures
@@ -0,0 +1,74 @@
+"""Statistiky prohledávání vymazávacího systému.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje třídu SearchStatistics, která shrnuje průběh jednoho běhu vymazávacího systému. Čítače jsou
+během prohledávání pouze zvyšovány, a jsou tak dostupné po každém běhu vymazávacího systému bez znatelného zpomalení.
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: search_statistics.py
+"""
+
+from typing import Dict, Union
+
+
+class SearchStatistics:
+    """Statistiky jednoho běhu vymazávacího systému.
+
+    Statistiky obsahují počet prohledaných konfigurací, dobu běhu, případně rozdělenou na porovnávání s regulárním
+    jazykem a práci se vstupní páskou, počty ověřených a odfiltrovaných vymazávacích řetězců, počet návratů
+    z prohledaných konfigurací, maximální hloubku prohledávání, počet porovnání s regulárními výrazy, počty nalezení
+    a nenalezení konfigurací v transpoziční tabulce, počet ořezaných podstromů prohledávání, informaci, zda byl vstupní
+    řetězec odmítnut na základě počtů symbolů bez prohledávání, a počet nerozhodnutých výpočtů dynamického programování
+    nad intervaly.
+    """
+    __slots__ = ("expanded_nodes", "elapsed_time", "matching_time", "tape_time", "generated_candidates",
+                 "filtered_candidates", "backtracks", "maximum_depth", "regular_expression_evaluations",
+                 "transposition_table_hits", "transposition_table_misses", "viability_prunes", "parikh_vector_rejected",
+                 "interval_dynamic_programming_inconclusive")
+
+    def __init__(self) -> None:
+        """**Konstruktor třídy SearchStatistics**"""
+        self.expanded_nodes = 0
+        """Počet prohledaných konfigurací."""
+        self.elapsed_time = 0.0
+        """Doba běhu v sekundách."""
+        self.matching_time = 0.0
+        """Doba hledání aplikovatelných vymazávacích řetězců a výběru z nich (porovnávání s regulárním jazykem).
+        Měřena pouze při nastaveném rozdělení doby prohledávání (viz vlastnost ErasingSystem.detailed_timing)."""
+        self.tape_time = 0.0
+        """Doba vymazávání a obnovování vstupní pásky včetně aktualizace výskytů vymazávacích řetězců. Měřena pouze
+        při nastaveném rozdělení doby prohledávání (viz vlastnost ErasingSystem.detailed_timing)."""
+        self.generated_candidates = 0
+        """Počet vymazávacích řetězců s výskytem na vstupní pásce, které byly porovnány s regulárním jazykem."""
+        self.filtered_candidates = 0
+        """Počet vymazávacích řetězců s výskytem na vstupní pásce, které nejsou dle regulárního jazyka aplikovatelné."""
+        self.backtracks = 0
+        """Počet návratů z konfigurací, ze kterých nelze vstupní řetězec přijmout."""
+        self.maximum_depth = 0
+        """Maximální počet použitých vymazávacích řetězců v prohledávané konfiguraci."""
+        self.regular_expression_evaluations = 0
+        """Počet porovnání řetězce vzniklého konkatenací vymazávacích řetězců s regulárními výrazy."""
+        self.transposition_table_hits = 0
+        """Počet nalezení konfigurace v transpoziční tabulce."""
+        self.transposition_table_misses = 0
+        """Počet nenalezení konfigurace v transpoziční tabulce."""
+        self.viability_prunes = 0
+        """Počet ořezaných podstromů prohledávání na základě počtů symbolů zbývající vstupní pásky."""
+        self.parikh_vector_rejected = False
+        """Odmítnutí vstupního řetězce na základě počtů symbolů bez prohledávání."""
+        self.interval_dynamic_programming_inconclusive = 0
+        """Počet výpočtů dynamického programování nad intervaly, které o přijetí vstupního řetězce nerozhodly, a vstupní
+        řetězec byl proto prohledán."""
+
+    def as_dict(self) -> Dict[str, Union[int, float, bool]]:
+        """Převod statistik na slovník, například pro jejich uložení či zobrazení.
+
+        :return: slovník, jehož klíči jsou názvy statistik.
+        :rtype: Dict[str, Union[int, float, bool]]
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return "SearchStatistics(" + ", ".join(name + "=" + repr(value) for name, value in self.as_dict().items()) + ")"
@@ -0,0 +1,348 @@
+"""Strategie prohledávání stromu konfigurací vymazávacího systému.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje abstraktní třídu SearchStrategy a její implementace, které určují pořadí, ve kterém jsou
+prohledávány konfigurace vymazávacího systému (prohledávání do hloubky, do šířky s omezenou pamětí, podle heuristiky
+a iterativní prohlubování). Všechny strategie sdílí generování následníků konfigurace (viz metoda
+ErasingSystem._expand_search_node()), a liší se tedy pouze pořadím jejich prohledání. Pokud vymazávací systém nemá
+nastavenou žádnou strategii, je využito vestavěné prohledávání do hloubky (viz metoda ErasingSystem._is_accepted()),
+které sdílí jedinou vstupní pásku všemi rámci.
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: search_strategy.py
+"""
+
+import heapq
+
+from abc import ABC, abstractmethod
+from itertools import count
+from typing import Callable, Dict, Hashable, List, NamedTuple, Tuple
+
+from es_tools.formal_models.erasing_system.custom_utils.transposition_table import TranspositionTable
+
+
+class SearchNode(NamedTuple):
+    """Konfigurace vymazávacího systému v prohledávání řízeném strategií.
+
+    Konfigurace obsahuje aktuální vstupní pásku, použité vymazávací řetězce v pořadí jejich použití a pozice jejich
+    vymazání na tehdejší vstupní pásce, stav automatu pro regulární jazyk, úroveň shody naposledy použitého vymazávacího
+    řetězce s regulárním výrazem a klíč, který je shodný pro konfigurace se stejným dalším průběhem prohledávání.
+    """
+    tape: str
+    erased_strings: Tuple[str, ...]
+    positions: Tuple[int, ...]
+    language_state: int
+    match_level: int
+    key: Hashable
+
+
+Expand = Callable[[SearchNode], List[SearchNode]]
+IsAccepting = Callable[[SearchNode], bool]
+
+
+class SearchStrategy(ABC):
+    """Základní třída pro strategie prohledávání.
+
+    Strategie prohledává konfigurace dosažitelné z počáteční konfigurace, dokud nenalezne přijímající konfiguraci
+    (konfiguraci s prázdnou vstupní páskou, jejíž řetězec vzniklý konkatenací použitých vymazávacích řetězců náleží
+    do regulárního jazyka), nebo dokud neprohledá všechny konfigurace.
+    """
+    @abstractmethod
+    def search(self, root: SearchNode, expand: Expand, is_accepting: IsAccepting) -> bool:
+        """Prohledání konfigurací dosažitelných z počáteční konfigurace.
+
+        :param root: počáteční konfigurace.
+        :type root: SearchNode
+        :param expand: funkce, která pro konfiguraci vrací seznam jejích následníků.
+        :type expand: Expand
+        :param is_accepting: funkce, která ověřuje, zda je konfigurace přijímající.
+        :type is_accepting: IsAccepting
+        :return: True, pokud byla nalezena přijímající konfigurace, jinak False.
+        :rtype: bool
+        """
+        pass
+
+
+class DepthFirstSearchStrategy(SearchStrategy):
+    """Prohledávání do hloubky, přičemž každá konfigurace je prohledána nejvýše jednou."""
+    def search(self, root: SearchNode, expand: Expand, is_accepting: IsAccepting) -> bool:
+        if is_accepting(root):
+            return True
+
+        visited = {root.key}
+        stack = [iter(expand(root))]
+
+        while len(stack) != 0:
+            node = next(stack[-1], None)
+
+            if node is None:
+                stack.pop()
+                continue
+
+            if node.key in visited:
+                continue
+
+            if is_accepting(node):
+                return True
+
+            visited.add(node.key)
+            stack.append(iter(expand(node)))
+
+        return False
+
+
+class BreadthFirstSearchStrategy(SearchStrategy):
+    """Prohledávání do šířky s omezenou velikostí fronty konfigurací a omezeným počtem uchovaných konfigurací.
+
+    Pokud by počet konfigurací následující úrovně překročil maximální velikost fronty, jsou zbývající konfigurace
+    aktuální úrovně prohledány do hloubky. Nalezené konfigurace jsou uchovány v omezené transpoziční tabulce, kterou
+    sdílí i prohledávání do hloubky, a při jejím zaplnění je odstraněna nejdéle nepoužitá konfigurace. Odstraněná
+    konfigurace může být prohledána opakovaně, avšak každé vymazání zkracuje vstupní pásku, a prohledávání tak vždy
+    skončí. Paměť pro frontu i nalezené konfigurace je tak omezena, a prohledávání přitom zůstává úplné.
+    """
+    def __init__(self, max_frontier_size: int = 100000, max_visited_size: int = 1000000) -> None:
+        """**Konstruktor třídy BreadthFirstSearchStrategy**
+
+        :param max_frontier_size: maximální počet konfigurací ve frontě jedné úrovně prohledávání.
+        :type max_frontier_size: int
+        :param max_visited_size: maximální počet uchovaných nalezených konfigurací. Hodnota 0 vypíná vynechávání
+                                 opakovaně nalezených konfigurací.
+        :type max_visited_size: int
+        """
+        self.__max_frontier_size = max_frontier_size
+        self.__max_visited_size = max_visited_size
+
+    @property
+    def max_frontier_size(self) -> int:
+        """Maximální počet konfigurací ve frontě jedné úrovně prohledávání.
+
+        :getter: získání maximálního počtu konfigurací ve frontě.
+        :type: int
+        """
+        return self.__max_frontier_size
+
+    @property
+    def max_visited_size(self) -> int:
+        """Maximální počet uchovaných nalezených konfigurací.
+
+        :getter: získání maximálního počtu uchovaných konfigurací.
+        :type: int
+        """
+        return self.__max_visited_size
+
+    @staticmethod
+    def _search_depth_first(root: SearchNode, expand: Expand, is_accepting: IsAccepting,
+                            visited: TranspositionTable) -> bool:
+        """Prohledávání do hloubky zbývající konfigurace se sdílenými nalezenými konfiguracemi.
+
+        :param root: konfigurace, ze které je prohledávání zahájeno.
+        :type root: SearchNode
+        :param expand: funkce, která pro konfiguraci vrací seznam jejích následníků.
+        :type expand: Expand
+        :param is_accepting: funkce, která ověřuje, zda je konfigurace přijímající.
+        :type is_accepting: IsAccepting
+        :param visited: omezená tabulka nalezených konfigurací sdílená všemi prohledáváními.
+        :type visited: TranspositionTable
+        :return: True, pokud byla nalezena přijímající konfigurace, jinak False.
+        :rtype: bool
+        """
+        if is_accepting(root):
+            return True
+
+        stack = [iter(expand(root))]
+
+        while len(stack) != 0:
+            node = next(stack[-1], None)
+
+            if node is None:
+                stack.pop()
+                continue
+
+            if visited.contains_failed(node.key):
+                continue
+
+            if is_accepting(node):
+                return True
+
+            visited.store_failed(node.key)
+            stack.append(iter(expand(node)))
+
+        return False
+
+    def search(self, root: SearchNode, expand: Expand, is_accepting: IsAccepting) -> bool:
+        if is_accepting(root):
+            return True
+
+        # Transpoziční tabulka slouží jako omezená množina nalezených konfigurací. Opakovaně nalezená konfigurace nemusí
+        # být prohledána, neboť již je ve frontě, případně již byla prohledána.
+        visited = TranspositionTable(self.__max_visited_size)
+        visited.store_failed(root.key)
+        frontier = [root]
+
+        while len(frontier) != 0:
+            next_frontier = list()
+
+            for index, node in enumerate(frontier):
+                if len(next_frontier) >= self.__max_frontier_size:
+                    # Zbývající konfigurace (včetně již nalezených konfigurací následující úrovně) jsou prohledány
+                    # do hloubky, přičemž konfigurace nalezené jedním prohledáváním nejsou prohledávány znovu.
+                    return any(self._search_depth_first(remaining_node, expand, is_accepting, visited)
+                               for remaining_node in next_frontier + frontier[index:])
+
+                for child in expand(node):
+                    if visited.contains_failed(child.key):
+                        continue
+
+                    if is_accepting(child):
+                        return True
+
+                    visited.store_failed(child.key)
+                    next_frontier.append(child)
+
+            frontier = next_frontier
+
+        return False
+
+
+def remaining_tape_length(node: SearchNode) -> int:
+    """Heuristika prohledávání podle heuristiky, která upřednostňuje konfigurace s nejkratší vstupní páskou.
+
+    :param node: konfigurace vymazávacího systému.
+    :type node: SearchNode
+    :return: délka vstupní pásky konfigurace.
+    :rtype: int
+    """
+    return len(node.tape)
+
+
+def match_level(node: SearchNode) -> int:
+    """Heuristika prohledávání podle heuristiky, která upřednostňuje konfigurace s nejnižší úrovní shody naposledy
+    použitého vymazávacího řetězce s regulárním výrazem (odpovídá chamtivému kvantifikátoru).
+
+    :param node: konfigurace vymazávacího systému.
+    :type node: SearchNode
+    :return: úroveň shody naposledy použitého vymazávacího řetězce.
+    :rtype: int
+    """
+    return node.match_level
+
+
+class BestFirstSearchStrategy(SearchStrategy):
+    """Prohledávání podle heuristiky, přičemž jako první je vždy prohledána konfigurace s nejnižší hodnotou heuristiky.
+
+    Konfigurace se stejnou hodnotou heuristiky jsou prohledány v pořadí, ve kterém byly nalezeny.
+    """
+    def __init__(self, heuristic: Callable[[SearchNode], int] = remaining_tape_length) -> None:
+        """**Konstruktor třídy BestFirstSearchStrategy**
+
+        :param heuristic: funkce, která konfiguraci přiřazuje hodnotu heuristiky (implicitně délku vstupní pásky).
+        :type heuristic: Callable[[SearchNode], int]
+        """
+        self.__heuristic = heuristic
+
+    def search(self, root: SearchNode, expand: Expand, is_accepting: IsAccepting) -> bool:
+        if is_accepting(root):
+            return True
+
+        order = count()
+        visited = {root.key}
+        queue = [(self.__heuristic(root), next(order), root)]
+
+        while len(queue) != 0:
+            node = heapq.heappop(queue)[2]
+
+            for child in expand(node):
+                if child.key in visited:
+                    continue
+
+                if is_accepting(child):
+                    return True
+
+                visited.add(child.key)
+                heapq.heappush(queue, (self.__heuristic(child), next(order), child))
+
+        return False
+
+
+class IterativeDeepeningSearchStrategy(SearchStrategy):
+    """Iterativní prohlubování, tedy opakované prohledávání do hloubky s postupně zvyšovaným omezením hloubky.
+
+    Hloubka konfigurace odpovídá počtu použitých vymazávacích řetězců. Prohledávání končí, pokud při omezení hloubky
+    nebyla žádná konfigurace vynechána. Nalezená přijímající konfigurace má nejmenší možný počet vymazání.
+    """
+    def __init__(self, initial_depth_limit: int = 1, depth_limit_step: int = 1) -> None:
+        """**Konstruktor třídy IterativeDeepeningSearchStrategy**
+
+        :param initial_depth_limit: omezení hloubky v prvním prohledávání.
+        :type initial_depth_limit: int
+        :param depth_limit_step: zvýšení omezení hloubky v každém dalším prohledávání.
+        :type depth_limit_step: int
+        """
+        self.__initial_depth_limit = initial_depth_limit
+        self.__depth_limit_step = depth_limit_step
+
+    def _search_limited(self, root: SearchNode, expand: Expand, is_accepting: IsAccepting,
+                        depth_limit: int) -> Tuple[bool, bool]:
+        """Prohledávání do hloubky s omezením hloubky.
+
+        :param root: počáteční konfigurace.
+        :type root: SearchNode
+        :param expand: funkce, která pro konfiguraci vrací seznam jejích následníků.
+        :type expand: Expand
+        :param is_accepting: funkce, která ověřuje, zda je konfigurace přijímající.
+        :type is_accepting: IsAccepting
+        :param depth_limit: maximální hloubka prohledávaných konfigurací.
+        :type depth_limit: int
+        :return: dvojice pravdivostních hodnot, zda byla nalezena přijímající konfigurace a zda byla některá
+                 konfigurace vynechána z důvodu omezení hloubky.
+        :rtype: Tuple[bool, bool]
+        """
+        # Pro každou konfiguraci je uchována největší zbývající hloubka, se kterou již byla prohledána.
+        explored_depths: Dict[Hashable, int] = {root.key: depth_limit}
+        cut_off = False
+        stack = [(iter(expand(root)), depth_limit - 1)]
+
+        while len(stack) != 0:
+            children, remaining_depth = stack[-1]
+            node = next(children, None)
+
+            if node is None:
+                stack.pop()
+                continue
+
+            if explored_depths.get(node.key, -1) >= remaining_depth:
+                continue
+
+            if is_accepting(node):
+                return True, cut_off
+
+            explored_depths[node.key] = remaining_depth
+
+            if remaining_depth == 0:
+                if node.tape != "":
+                    cut_off = True
+
+                continue
+
+            stack.append((iter(expand(node)), remaining_depth - 1))
+
+        return False, cut_off
+
+    def search(self, root: SearchNode, expand: Expand, is_accepting: IsAccepting) -> bool:
+        if is_accepting(root):
+            return True
+
+        depth_limit = max(self.__initial_depth_limit, 1)
+        cut_off = True
+
+        while cut_off:
+            accepted, cut_off = self._search_limited(root, expand, is_accepting, depth_limit)
+
+            if accepted:
+                return True
+
+            depth_limit = depth_limit + max(self.__depth_limit_step, 1)
+
+        return False
@@ -0,0 +1,261 @@
+"""Sledování průběhu prohledávání vymazávacího systému.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje třídu SearchTracer, jejíž metody jsou volány při událostech prohledávání vymazávacího systému
+(začátek a konec běhu, prohledání konfigurace, vymazání, návrat z konfigurace a přijetí), a její implementace. Pokud
+vymazávací systém nemá nastaveno žádné sledování, nejsou události vůbec vytvářeny. Třída PrintSearchTracer odpovídá
+podrobnému výpisu na standardní výstup, třída BufferedFileSearchTracer zapisuje události do souboru a třída
+SamplingSearchTracer předává jinému sledování pouze každou n-tou událost, a umožňuje tak sledovat i velmi dlouhé běhy.
+Obsah vstupní pásky je událostem předáván bez sestavení řetězce, a sestaven je tak pouze pro skutečně zpracované
+události.
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: search_tracer.py
+"""
+
+from typing import List, Optional, Sequence, Set, TextIO, Union
+
+from es_tools.formal_models.erasing_system.custom_utils.erasable_tape import ErasableTape
+
+Tape = Union[str, ErasableTape]
+
+RUN_SEPARATOR = "------------------------------------------------------------------------------------"
+"""Oddělovač výpisu jednotlivých běhů vymazávacího systému."""
+
+
+class SearchTracer:
+    """Základní třída pro sledování průběhu prohledávání.
+
+    Všechny metody ve výchozím stavu nic neprovádí, a odvozené třídy tak implementují pouze metody pro sledované
+    události. Vstupní páska je předávána jako řetězec, nebo jako vstupní páska hlavního algoritmu (viz třída
+    ErasableTape), jejíž obsah je získán funkcí str(). Vstupní páska i seznam použitých vymazávacích řetězců jsou během
+    prohledávání měněny, a pokud mají být uchovány, musí být jejich obsah získán, případně zkopírován, již při události.
+    """
+    def run_started(self, erasing_strings: Set[str], regular_language: str, input_string: str) -> None:
+        """Začátek běhu vymazávacího systému.
+
+        :param erasing_strings: množina vymazávacích řetězců.
+        :type erasing_strings: Set[str]
+        :param regular_language: regulární výraz reprezentující regulární jazyk.
+        :type regular_language: str
+        :param input_string: vstupní řetězec.
+        :type input_string: str
+        """
+        pass
+
+    def node_entered(self, tape: Tape, erased_strings: Sequence[str]) -> None:
+        """Prohledání nové konfigurace.
+
+        :param tape: vstupní páska konfigurace.
+        :type tape: Tape
+        :param erased_strings: použité vymazávací řetězce v pořadí jejich použití.
+        :type erased_strings: Sequence[str]
+        """
+        pass
+
+    def erasure(self, tape: Tape, position: int, erasing_string: str, erased_strings: Sequence[str]) -> None:
+        """Vymazání vymazávacího řetězce ze vstupní pásky.
+
+        :param tape: vstupní páska před vymazáním.
+        :type tape: Tape
+        :param position: pozice vymazávacího řetězce na vstupní pásce.
+        :type position: int
+        :param erasing_string: vymazávací řetězec.
+        :type erasing_string: str
+        :param erased_strings: vymazávací řetězce použité před tímto vymazáním.
+        :type erased_strings: Sequence[str]
+        """
+        pass
+
+    def backtrack(self, tape: Tape, erased_strings: Sequence[str]) -> None:
+        """Návrat z konfigurace, ze které nelze vstupní řetězec přijmout.
+
+        :param tape: vstupní páska konfigurace.
+        :type tape: Tape
+        :param erased_strings: použité vymazávací řetězce v pořadí jejich použití.
+        :type erased_strings: Sequence[str]
+        """
+        pass
+
+    def accept(self, erased_strings: Sequence[str]) -> None:
+        """Nalezení přijímající konfigurace.
+
+        :param erased_strings: použité vymazávací řetězce v pořadí jejich použití.
+        :type erased_strings: Sequence[str]
+        """
+        pass
+
+    def run_finished(self, input_string: str, accepted: bool) -> None:
+        """Konec běhu vymazávacího systému.
+
+        :param input_string: vstupní řetězec.
+        :type input_string: str
+        :param accepted: pravdivostní hodnota, zda byl vstupní řetězec přijat.
+        :type accepted: bool
+        """
+        pass
+
+
+class PrintSearchTracer(SearchTracer):
+    """Podrobný výpis průběhu prohledávání, který je využit při nastavení podrobného výpisu vymazávacího systému."""
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        """**Konstruktor třídy PrintSearchTracer**
+
+        :param stream: výstupní proud. Pokud není zadán, je využit standardní výstup.
+        :type stream: Optional[TextIO]
+        """
+        self.__stream = stream
+
+    def run_started(self, erasing_strings: Set[str], regular_language: str, input_string: str) -> None:
+        print(RUN_SEPARATOR + "\n", file=self.__stream)
+        print("#####################", file=self.__stream)
+        print("Start erasing system:", file=self.__stream)
+        print("#####################", file=self.__stream)
+        print("Erasing strings: " + str(erasing_strings)[1:-1], file=self.__stream)
+        print("Regular language (expression): " + regular_language + "\n", file=self.__stream)
+        print("Input string: " + input_string + "\n\n", file=self.__stream)
+
+    def erasure(self, tape: Tape, position: int, erasing_string: str, erased_strings: Sequence[str]) -> None:
+        if len(erased_strings) == 0:
+            print_erased_strings_concatenation = "\"epsilon\""
+        else:
+            print_erased_strings_concatenation = "".join(erased_strings)
+
+        tape = str(tape)
+
+        print("----------------------", file=self.__stream)
+        print("Chosen erasing string: " + erasing_string, file=self.__stream)
+        print("Input tape: " + tape[:position] + "#" + tape[position:], file=self.__stream)
+        print("Erased strings concatenation: " + print_erased_strings_concatenation, file=self.__stream)
+        print("----------------------\n", file=self.__stream)
+
+    def run_finished(self, input_string: str, accepted: bool) -> None:
+        if accepted:
+            print("-> Input string accepted by the erasing system", file=self.__stream)
+        else:
+            print("-> Input string rejected by the erasing system", file=self.__stream)
+
+        print("###############################################\n", file=self.__stream)
+        print(RUN_SEPARATOR, file=self.__stream)
+
+
+class BufferedFileSearchTracer(SearchTracer):
+    """Zápis událostí prohledávání do souboru.
+
+    Každá událost je zapsána na samostatný řádek, jehož položky jsou odděleny tabulátorem a první položkou je název
+    události. Řádky jsou zapisovány po dávkách, a to vždy po naplnění vyrovnávací paměti, na konci běhu vymazávacího
+    systému a při uzavření souboru. Sledování lze využít i jako správce kontextu, který soubor na konci uzavře.
+    """
+    def __init__(self, file_path: str, buffer_size: int = 1024) -> None:
+        """**Konstruktor třídy BufferedFileSearchTracer**
+
+        :param file_path: cesta k souboru, který je vytvořen, případně přepsán.
+        :type file_path: str
+        :param buffer_size: maximální počet řádků uchovaných před zápisem do souboru.
+        :type buffer_size: int
+        """
+        self.__file = open(file_path, "w", encoding="utf-8")
+        self.__buffer: List[str] = list()
+        self.__buffer_size = max(buffer_size, 1)
+
+    def _write(self, *fields: object) -> None:
+        """Uložení řádku s událostí do vyrovnávací paměti.
+
+        :param fields: položky řádku.
+        :type fields: object
+        """
+        self.__buffer.append("\t".join(str(field) for field in fields) + "\n")
+
+        if len(self.__buffer) >= self.__buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Zápis řádků z vyrovnávací paměti do souboru."""
+        self.__file.writelines(self.__buffer)
+        self.__buffer.clear()
+        self.__file.flush()
+
+    def close(self) -> None:
+        """Zápis zbývajících řádků a uzavření souboru."""
+        if not self.__file.closed:
+            self.flush()
+            self.__file.close()
+
+    def __enter__(self) -> "BufferedFileSearchTracer":
+        return self
+
+    def __exit__(self, *exception_info: object) -> None:
+        self.close()
+
+    def run_started(self, erasing_strings: Set[str], regular_language: str, input_string: str) -> None:
+        self._write("run_started", input_string)
+
+    def node_entered(self, tape: Tape, erased_strings: Sequence[str]) -> None:
+        self._write("node_entered", len(erased_strings), tape)
+
+    def erasure(self, tape: Tape, position: int, erasing_string: str, erased_strings: Sequence[str]) -> None:
+        self._write("erasure", len(erased_strings), erasing_string, position, tape)
+
+    def backtrack(self, tape: Tape, erased_strings: Sequence[str]) -> None:
+        self._write("backtrack", len(erased_strings), tape)
+
+    def accept(self, erased_strings: Sequence[str]) -> None:
+        self._write("accept", len(erased_strings), "".join(erased_strings))
+
+    def run_finished(self, input_string: str, accepted: bool) -> None:
+        self._write("run_finished", "accepted" if accepted else "rejected")
+        self.flush()
+
+
+class SamplingSearchTracer(SearchTracer):
+    """Předávání každé n-té události prohledávání jinému sledování.
+
+    Vzorkovány jsou pouze časté události (prohledání konfigurace, vymazání a návrat z konfigurace), a to společným
+    čítačem, který je na začátku každého běhu vynulován. Začátek a konec běhu a nalezení přijímající konfigurace jsou
+    předány vždy. Obsah vstupní pásky nepředaných událostí není sestaven.
+    """
+    def __init__(self, tracer: SearchTracer, interval: int) -> None:
+        """**Konstruktor třídy SamplingSearchTracer**
+
+        :param tracer: sledování, kterému jsou události předávány.
+        :type tracer: SearchTracer
+        :param interval: předána je každá interval-tá událost (hodnota 1 předává všechny události).
+        :type interval: int
+        """
+        self.__tracer = tracer
+        self.__interval = max(interval, 1)
+        self.__events = 0
+
+    def _sample(self) -> bool:
+        """Započítání události a určení, zda má být předána.
+
+        :return: True, pokud má být událost předána, jinak False.
+        :rtype: bool
+        """
+        self.__events = self.__events + 1
+
+        return self.__events % self.__interval == 0
+
+    def run_started(self, erasing_strings: Set[str], regular_language: str, input_string: str) -> None:
+        self.__events = 0
+        self.__tracer.run_started(erasing_strings, regular_language, input_string)
+
+    def node_entered(self, tape: Tape, erased_strings: Sequence[str]) -> None:
+        if self._sample():
+            self.__tracer.node_entered(tape, erased_strings)
+
+    def erasure(self, tape: Tape, position: int, erasing_string: str, erased_strings: Sequence[str]) -> None:
+        if self._sample():
+            self.__tracer.erasure(tape, position, erasing_string, erased_strings)
+
+    def backtrack(self, tape: Tape, erased_strings: Sequence[str]) -> None:
+        if self._sample():
+            self.__tracer.backtrack(tape, erased_strings)
+
+    def accept(self, erased_strings: Sequence[str]) -> None:
+        self.__tracer.accept(erased_strings)
+
+    def run_finished(self, input_string: str, accepted: bool) -> None:
+        self.__tracer.run_finished(input_string, accepted)
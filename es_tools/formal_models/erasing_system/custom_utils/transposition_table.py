@@ -0,0 +1,165 @@
+"""Transpoziční tabulka konfigurací vymazávacího systému.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje třídu TranspositionTable, která slouží pro uchování konfigurací vymazávacího systému, u nichž
+již bylo prokázáno, že z nich nelze vstupní řetězec přijmout. Různá pořadí vymazávání totiž velmi často vedou
+k totožné konfiguraci (stejnému tvaru vstupní pásky a řetězce vzniklého konkatenací použitých vymazávacích řetězců),
+a tudíž by byl celý podstrom prohledávání zbytečně procházen opakovaně. Velikost tabulky je omezena, přičemž při jejím
+zaplnění je odstraněna nejdéle nepoužitá konfigurace.
+
+Konfigurace může být v tabulce určena pouze hashem obsahu vstupní pásky. Různé konfigurace se shodným hashem by pak byly
+zaměněny, a spolu s konfigurací je proto uložen i její přesný obsah, který je porovnán při každém nalezení konfigurace.
+Obsah je získáván funkcí, která je volána pouze tehdy, pokud je konfigurace se shodným hashem nalezena.
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: transposition_table.py
+"""
+
+from collections import OrderedDict
+from typing import Callable, FrozenSet, Hashable, Optional
+
+
+class TranspositionTable:
+    """Omezená transpoziční tabulka neúspěšných konfigurací.
+
+    Tato třída uchovává konfigurace, ze kterých nelze vstupní řetězec přijmout. Při dotazu na konfiguraci je
+    zaznamenáván počet úspěšných (hits) a neúspěšných (misses) vyhledání. Pokud je počet uložených konfigurací roven
+    maximální velikosti tabulky, je před vložením nové konfigurace odstraněna nejdéle nepoužitá konfigurace. Pro každou
+    konfiguraci (případně hash konfigurace) je uložen nejvýše jeden přesný obsah, a konfigurace se shodným hashem
+    a různým obsahem se tak v tabulce nahrazují.
+    """
+    def __init__(self, max_size: int) -> None:
+        """**Konstruktor třídy TranspositionTable**
+
+        :param max_size: maximální počet uložených konfigurací. Hodnota 0 tabulku zcela vypíná.
+        :type max_size: int
+        """
+        self.__max_size = max_size
+        self.__failed_configurations = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_size(self) -> int:
+        """Maximální počet uložených konfigurací.
+
+        :getter: získání maximálního počtu uložených konfigurací.
+        :type: int
+        """
+        return self.__max_size
+
+    def __len__(self) -> int:
+        return len(self.__failed_configurations)
+
+    def _find(self, configuration: Hashable,
+              content: Optional[Callable[[], Hashable]]) -> Optional[FrozenSet[Hashable]]:
+        """Nalezení uložené konfigurace se shodným přesným obsahem.
+
+        :param configuration: konfigurace vymazávacího systému.
+        :type configuration: Hashable
+        :param content: funkce vracející přesný obsah konfigurace, nebo None, pokud je konfigurace určena přesně.
+        :type content: Optional[Callable[[], Hashable]]
+        :return: uložená množina vynechávaných vymazání, nebo None, pokud konfigurace se shodným obsahem není uložena.
+        :rtype: Optional[FrozenSet[Hashable]]
+        """
+        stored = self.__failed_configurations.get(configuration)
+
+        if stored is None:
+            return None
+
+        stored_content, stored_sleep_set = stored
+
+        if stored_content != (None if content is None else content()):
+            return None
+
+        return stored_sleep_set
+
+    def contains_failed(self, configuration: Hashable, sleep_set: FrozenSet[Hashable] = frozenset(),
+                        content: Optional[Callable[[], Hashable]] = None) -> bool:
+        """Ověření, zda je konfigurace uložena jako neúspěšná.
+
+        Při nalezení konfigurace je tato konfigurace označena jako naposledy použitá, aby nebyla při zaplnění tabulky
+        odstraněna jako první. Pokud je při prohledávání využita redukce nezávislých vymazání (viz metoda
+        ErasingSystem._calculate_child_sleep_set()), je konfigurace považována za neúspěšnou pouze tehdy, pokud byla
+        prohledána s podmnožinou aktuální množiny vynechávaných vymazání.
+
+        :param configuration: ověřovaná konfigurace vymazávacího systému.
+        :type configuration: Hashable
+        :param sleep_set: množina vymazání, která nemusí být z konfigurace prohledávána.
+        :type sleep_set: FrozenSet[Hashable]
+        :param content: funkce vracející přesný obsah konfigurace, nebo None, pokud je konfigurace určena přesně.
+        :type content: Optional[Callable[[], Hashable]]
+        :return: True, pokud již bylo prokázáno, že z konfigurace nelze vstupní řetězec přijmout, jinak False.
+        :rtype: bool
+        """
+        stored_sleep_set = self._find(configuration, content)
+
+        if stored_sleep_set is not None and stored_sleep_set <= sleep_set:
+            self.__failed_configurations.move_to_end(configuration)
+            self.hits = self.hits + 1
+
+            return True
+
+        self.misses = self.misses + 1
+
+        return False
+
+    def failed_sleep_set(self, configuration: Hashable,
+                         content: Optional[Callable[[], Hashable]] = None) -> Optional[FrozenSet[Hashable]]:
+        """Získání množiny vynechávaných vymazání, se kterou byla konfigurace neúspěšně prohledána.
+
+        Dotaz není započítán do počtu úspěšných ani neúspěšných vyhledání.
+
+        :param configuration: konfigurace vymazávacího systému.
+        :type configuration: Hashable
+        :param content: funkce vracející přesný obsah konfigurace, nebo None, pokud je konfigurace určena přesně.
+        :type content: Optional[Callable[[], Hashable]]
+        :return: uložená množina vynechávaných vymazání, nebo None, pokud konfigurace není uložena.
+        :rtype: Optional[FrozenSet[Hashable]]
+        """
+        return self._find(configuration, content)
+
+    def store_failed(self, configuration: Hashable, sleep_set: FrozenSet[Hashable] = frozenset(),
+                     content: Optional[Hashable] = None) -> None:
+        """Uložení neúspěšné konfigurace.
+
+        Pokud již konfigurace se shodným obsahem byla uložena s jinou množinou vynechávaných vymazání, je uložen jejich
+        průnik. Konfigurace se shodným hashem a jiným obsahem je nahrazena.
+
+        :param configuration: konfigurace, ze které nelze vstupní řetězec přijmout.
+        :type configuration: Hashable
+        :param sleep_set: množina vymazání, která nebyla z konfigurace prohledávána.
+        :type sleep_set: FrozenSet[Hashable]
+        :param content: přesný obsah konfigurace, nebo None, pokud je konfigurace určena přesně.
+        :type content: Optional[Hashable]
+        """
+        if self.__max_size <= 0:
+            return
+
+        stored = self.__failed_configurations.get(configuration)
+
+        if stored is not None:
+            stored_content, stored_sleep_set = stored
+
+            # Již uložená konfigurace se shodným obsahem je pouze aktualizována, jinak je nahrazena. V obou případech
+            # je označena jako naposledy použitá.
+            if stored_content == content:
+                sleep_set = stored_sleep_set & sleep_set
+
+            self.__failed_configurations[configuration] = (content, sleep_set)
+            self.__failed_configurations.move_to_end(configuration)
+
+            return
+
+        if len(self.__failed_configurations) >= self.__max_size:
+            self.__failed_configurations.popitem(last=False)
+
+        self.__failed_configurations[configuration] = (content, sleep_set)
+
+    def clear(self) -> None:
+        """Odstranění všech uložených konfigurací a vynulování počítadel."""
+        self.__failed_configurations.clear()
+        self.hits = 0
+        self.misses = 0
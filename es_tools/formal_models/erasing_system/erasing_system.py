@@ -13,24 +13,49 @@ třídy ErasingSystem a pomocných funkcí.
 
 
 import re
+import time
 
-from random import choice
-from typing import List, Set, Tuple
+from collections import Counter
+from functools import partial
+from typing import FrozenSet, List, Optional, Set, Tuple
 
 from es_tools.custom_exceptions.illegal_symbol_occurrence_exception import IllegalSymbolOccurrenceException
 from es_tools.custom_exceptions.invalid_regular_language_pattern_exception import InvalidRegularLanguagePatternException
-from es_tools.custom_exceptions.maximum_input_string_length_exceeded_exception \
-    import MaximumInputStringLengthExceededException
-from es_tools.formal_models.erasing_system.custom_utils.custom_constants import DEFAULT_MATCH_LEVEL, \
-    ERASING_STRING_TUPLE_INDEX, MATCH_LEVEL_TUPLE_INDEX
-from es_tools.formal_models.erasing_system.custom_utils.filter_tools import filter_applicable_erasing_strings, \
-    filter_quantifier_levels
-from es_tools.formal_models.erasing_system.custom_utils.match_language_tools \
-    import calculate_levels, match_transformed_language
-from es_tools.formal_models.erasing_system.custom_utils.maximum_recursion_depth import MAXIMUM_RECURSION_DEPTH
+from es_tools.custom_exceptions.search_budget_exhausted_exception import SearchBudgetExhaustedException
+from es_tools.formal_models.erasing_system.custom_utils.aho_corasick_automaton import AhoCorasickAutomaton
+from es_tools.formal_models.erasing_system.custom_utils.applicable_erasing_strings_queue \
+    import ApplicableErasingStringsQueue
+from es_tools.formal_models.erasing_system.custom_utils.bracket_matching import create_bracket_matching
+from es_tools.formal_models.erasing_system.custom_utils.compared_languages_matcher import ComparedLanguagesMatcher
+from es_tools.formal_models.erasing_system.custom_utils.custom_constants import DEAD_STATE, DEFAULT_MATCH_LEVEL, \
+    DEFAULT_TRANSPOSITION_TABLE_SIZE, ERASING_STRING_TUPLE_INDEX, INITIAL_LANGUAGE_STATE, MATCH_LEVEL_TUPLE_INDEX, \
+    NEXT_LANGUAGE_STATE_TUPLE_INDEX
+from es_tools.formal_models.erasing_system.custom_utils.derivation_counting import DerivationCounting
+from es_tools.formal_models.erasing_system.custom_utils.derivation_witness import Witness, apply_witness, \
+    original_positions
+from es_tools.formal_models.erasing_system.custom_utils.erasable_tape import ErasableTape
+from es_tools.formal_models.erasing_system.custom_utils.finite_language_search import FiniteLanguageSearch, \
+    enumerate_finite_language
+from es_tools.formal_models.erasing_system.custom_utils.interval_dynamic_programming \
+    import IntervalDynamicProgramming
+from es_tools.formal_models.erasing_system.custom_utils.match_language_tools import compile_compared_languages
 from es_tools.formal_models.erasing_system.custom_utils.not_allowed_erasing_string_symbols \
     import not_allowed_erasing_string_symbols
+from es_tools.formal_models.erasing_system.custom_utils.occurrence_index import OccurrenceIndex
+from es_tools.formal_models.erasing_system.custom_utils.ordering_policy import OrderingPolicy, \
+    SeededRandomOrderingPolicy
+from es_tools.formal_models.erasing_system.custom_utils.parikh_image import create_parikh_image
+from es_tools.formal_models.erasing_system.custom_utils.parikh_vector_check import ParikhVectorCheck, \
+    calculate_state_symbol_bounds
+from es_tools.formal_models.erasing_system.custom_utils.regular_language_automaton \
+    import create_regular_language_automaton, parse_regular_language_elements
 from es_tools.formal_models.erasing_system.custom_utils.regular_language_checking_tools import is_valid_regular_language
+from es_tools.formal_models.erasing_system.custom_utils.search_budget import SearchBudget, SearchResult
+from es_tools.formal_models.erasing_system.custom_utils.search_frame import SearchFrame
+from es_tools.formal_models.erasing_system.custom_utils.search_statistics import SearchStatistics
+from es_tools.formal_models.erasing_system.custom_utils.search_strategy import SearchNode, SearchStrategy
+from es_tools.formal_models.erasing_system.custom_utils.search_tracer import PrintSearchTracer, SearchTracer
+from es_tools.formal_models.erasing_system.custom_utils.transposition_table import TranspositionTable
 from es_tools.formal_models.formal_model import FormalModel
 
 
@@ -48,7 +73,14 @@ class ErasingSystem(FormalModel):
                  regular_language: str,
                  test_all_overlapping_positions: bool = False,
                  quantifier_type_greedy: bool = True,
-                 verbose: bool = False) -> None:
+                 verbose: bool = False,
+                 transposition_table_size: int = DEFAULT_TRANSPOSITION_TABLE_SIZE,
+                 ordering_policy: Optional[OrderingPolicy] = None,
+                 interval_dynamic_programming: bool = False,
+                 partial_order_reduction: bool = False,
+                 search_strategy: Optional[SearchStrategy] = None,
+                 tracer: Optional[SearchTracer] = None,
+                 detailed_timing: bool = False) -> None:
         """**Konstruktor třídy ErasingSystem**
 
         Konstruktor slouží především pro nastavení základních entit konečného převodníku, jako je například množina
@@ -71,18 +103,81 @@ class ErasingSystem(FormalModel):
         :param verbose: definování, zdá mají být při provádění algoritmu vypisovány na standardní výstup dodatečné
                         podrobné informace (aktuální stav vstupní pásky, použitý vymazávací řetězec, řetězec vzniklý
                         konkatenací dříve využitých vymazávacích řetězců). Pokud obsahuje hodnotu True, informace
-                        jsou vypisovány.
+                        jsou vypisovány (viz třída PrintSearchTracer). Pokud je zadáno sledování prohledávání, je
+                        tento parametr ignorován.
         :type verbose: bool
+        :param transposition_table_size: maximální počet konfigurací uložených v transpoziční tabulce konfigurací,
+                                         ze kterých nelze vstupní řetězec přijmout. Hodnota 0 tabulku vypíná.
+        :type transposition_table_size: int
+        :param ordering_policy: strategie výběru z rovnocenných vymazávacích řetězců a pozic jejich výskytů. Pokud není
+                                zadána, je použit náhodný výběr bez semínka (viz třída SeededRandomOrderingPolicy).
+        :type ordering_policy: Optional[OrderingPolicy]
+        :param interval_dynamic_programming: pravdivostní hodnota, zda má být o přijetí vstupního řetězce nejprve
+                                             rozhodováno dynamickým programováním nad intervaly vstupní pásky (viz
+                                             třída IntervalDynamicProgramming). Výsledek pak vždy odpovídá režimu
+                                             ověřování všech pozic vymazávacích řetězců. Polynomiální dobu běhu
+                                             nezaručuje (viz vlastnost interval_dynamic_programming).
+        :type interval_dynamic_programming: bool
+        :param partial_order_reduction: pravdivostní hodnota, zda mají být při ověřování všech pozic vymazávacích
+                                        řetězců vynechána pořadí nezávislých vymazání, která vedou k již prohledaným
+                                        konfiguracím. Výsledek přijetí vstupního řetězce se tím nemění.
+        :type partial_order_reduction: bool
+        :param search_strategy: strategie prohledávání konfigurací (viz třída SearchStrategy). Pokud není zadána, je
+                                použit hlavní algoritmus vymazávacího systému, tedy prohledávání do hloubky nad sdílenou
+                                vstupní páskou (viz metoda _is_accepted()).
+        :type search_strategy: Optional[SearchStrategy]
+        :param tracer: sledování průběhu prohledávání (viz třída SearchTracer). Pokud není zadáno a není nastaven
+                       podrobný výpis, nejsou události prohledávání vytvářeny.
+        :type tracer: Optional[SearchTracer]
+        :param detailed_timing: pravdivostní hodnota, zda má být doba prohledávání rozdělena na porovnávání
+                                s regulárním jazykem a práci se vstupní páskou (viz vlastnost detailed_timing).
+        :type detailed_timing: bool
         :raises IllegalSymbolOccurrenceException: výskyt nepovoleného symbolu ve vymazávacím řetězci.
         :raises InvalidRegularLanguagePatternException: nevalidní nebo nepovolený tvar regulárního výrazu
                                                         pro regulární jazyk.
         """
         self.__alphabet = set()
         self.__erasing_strings = set()
+        self.__ordered_erasing_strings = list()
+        self.__erasing_string_ids = dict()
+        self.__occurrences_automaton = None
         self.__regular_language = list()
+        self.__regular_language_pattern = None
+        self.__greedy_language_matcher = None
+        self.__lazy_language_matcher = None
+        self.__automaton = None
+        self.__erasing_string_transitions = dict()
+        self.__erasing_strings_symbol_counts = dict()
+        self.__state_symbol_bounds = None
+        self.__statistics = SearchStatistics()
         self.__test_all_overlapping_positions = test_all_overlapping_positions
         self.__quantifier_type_greedy = quantifier_type_greedy
-        self.__verbose = verbose
+        self.__transposition_table = TranspositionTable(transposition_table_size)
+        self.__parikh_vector_check = None
+        self.__parikh_vector_rejected = False
+        self.__interval_dynamic_programming = None
+        self.__parikh_image = None
+        self.__bracket_matching = None
+        self.__finite_language_search = None
+        self.__derivation_counting = None
+        self.__interval_dynamic_programming_enabled = interval_dynamic_programming
+        self.__partial_order_reduction = partial_order_reduction
+        self.__commuting_erasing_strings = dict()
+        self.__search_strategy = search_strategy
+        self.__search_budget = None
+        self.__witness = None
+        self.__witness_required = False
+        self.__detailed_timing = detailed_timing
+
+        if tracer is None and verbose:
+            tracer = PrintSearchTracer()
+
+        self.__tracer = tracer
+
+        if ordering_policy is None:
+            ordering_policy = SeededRandomOrderingPolicy()
+
+        self.__ordering_policy = ordering_policy
 
         try:
             self._set_erasing_strings(erasing_strings)
@@ -155,6 +250,178 @@ class ErasingSystem(FormalModel):
     def quantifier_type_greedy(self, quantifier_type_greedy: bool) -> None:
         self.__quantifier_type_greedy = quantifier_type_greedy
 
+    @property
+    def ordering_policy(self) -> OrderingPolicy:
+        """Strategie pořadí prohledávání.
+
+        Strategie určuje, který z rovnocenných aplikovatelných vymazávacích řetězců a která pozice jeho výskytu budou
+        ověřovány jako první.
+
+        :getter: získání strategie pořadí prohledávání.
+        :setter: nastavení strategie pořadí prohledávání.
+        :type: OrderingPolicy
+        """
+        return self.__ordering_policy
+
+    @ordering_policy.setter
+    def ordering_policy(self, ordering_policy: OrderingPolicy) -> None:
+        self.__ordering_policy = ordering_policy
+
+    @property
+    def interval_dynamic_programming(self) -> bool:
+        """Rozhodování o přijetí vstupního řetězce dynamickým programováním nad intervaly vstupní pásky.
+
+        Dynamické programování probíhá v polynomiálním čase, avšak rozhoduje pouze o některých vstupních řetězcích.
+        Pokud o přijetí vstupního řetězce nerozhodne (například pokud přijetí vyžaduje prokládání vymazání různých
+        intervalů), je vstupní řetězec prohledán v režimu ověřování všech pozic vymazávacích řetězců, jehož doba běhu
+        může být vzhledem k délce vstupního řetězce exponenciální. Polynomiální doba běhu tak není zaručena. Počet
+        takto nerozhodnutých výpočtů je uveden ve statistikách prohledávání (viz třída SearchStatistics).
+
+        :getter: získání pravdivostní hodnoty, zda je dynamické programování použito.
+        :setter: nastavení pravdivostní hodnoty, zda je dynamické programování použito.
+        :type: bool
+        """
+        return self.__interval_dynamic_programming_enabled
+
+    @interval_dynamic_programming.setter
+    def interval_dynamic_programming(self, interval_dynamic_programming: bool) -> None:
+        self.__interval_dynamic_programming_enabled = interval_dynamic_programming
+
+    @property
+    def partial_order_reduction(self) -> bool:
+        """Redukce pořadí nezávislých vymazání.
+
+        Dvě vymazání výskytů vymazávacích řetězců, které se na vstupní pásce nepřekrývají, vedou v libovolném pořadí
+        ke stejné vstupní pásce. Pokud navíc oba vymazávací řetězce převádí automat pro regulární jazyk v obou pořadích
+        do stejného stavu, vedou obě pořadí ke stejné konfiguraci, a prohledáváno je tak pouze jedno z nich. Redukce
+        je využita pouze v režimu ověřování všech pozic vymazávacích řetězců.
+
+        :getter: získání pravdivostní hodnoty, zda je redukce pořadí nezávislých vymazání použita.
+        :setter: nastavení pravdivostní hodnoty, zda je redukce pořadí nezávislých vymazání použita.
+        :type: bool
+        """
+        return self.__partial_order_reduction
+
+    @partial_order_reduction.setter
+    def partial_order_reduction(self, partial_order_reduction: bool) -> None:
+        self.__partial_order_reduction = partial_order_reduction
+
+    @property
+    def search_strategy(self) -> Optional[SearchStrategy]:
+        """Strategie prohledávání konfigurací vymazávacího systému.
+
+        Všechny strategie sdílí generování následníků konfigurace (viz metoda _expand_search_node()) a liší se pouze
+        pořadím prohledávání. Hodnota None odpovídá hlavnímu algoritmu vymazávacího systému (viz metoda _is_accepted()).
+
+        :getter: získání strategie prohledávání.
+        :setter: nastavení strategie prohledávání.
+        :type: Optional[SearchStrategy]
+        """
+        return self.__search_strategy
+
+    @search_strategy.setter
+    def search_strategy(self, search_strategy: Optional[SearchStrategy]) -> None:
+        self.__search_strategy = search_strategy
+
+    @property
+    def tracer(self) -> Optional[SearchTracer]:
+        """Sledování průběhu prohledávání vymazávacího systému.
+
+        Metody sledování jsou volány při událostech prohledávání (viz třída SearchTracer). Hodnota None sledování
+        vypíná, a události pak nejsou vůbec vytvářeny. Rozhodnutí, která události prohledávání nevytvářejí, jsou
+        při nastaveném sledování nahrazena prohledáváním se stejným výsledkem.
+
+        :getter: získání sledování průběhu prohledávání.
+        :setter: nastavení sledování průběhu prohledávání.
+        :type: Optional[SearchTracer]
+        """
+        return self.__tracer
+
+    @tracer.setter
+    def tracer(self, tracer: Optional[SearchTracer]) -> None:
+        self.__tracer = tracer
+
+    @property
+    def detailed_timing(self) -> bool:
+        """Rozdělení doby prohledávání na porovnávání s regulárním jazykem a práci se vstupní páskou.
+
+        Měření vyžaduje při každém prohledání konfigurace, vymazání i obnovení vstupní pásky zjištění aktuálního času,
+        a je proto ve výchozím stavu vypnuto. Pokud je vypnuto, obsahují statistiky matching_time a tape_time nulovou
+        dobu (viz třída SearchStatistics). Ostatní statistiky jsou zaznamenávány vždy.
+
+        :getter: získání pravdivostní hodnoty, zda je doba prohledávání rozdělována.
+        :setter: nastavení pravdivostní hodnoty, zda je doba prohledávání rozdělována.
+        :type: bool
+        """
+        return self.__detailed_timing
+
+    @detailed_timing.setter
+    def detailed_timing(self, detailed_timing: bool) -> None:
+        self.__detailed_timing = detailed_timing
+
+    @property
+    def witness(self) -> Optional[Witness]:
+        """Svědek přijetí vstupního řetězce během posledního běhu vymazávacího systému.
+
+        Svědek je n-tice dvojic identifikátoru vymazávacího řetězce (indexu v seřazeném seznamu vymazávacích řetězců)
+        a původního indexu prvního vymazaného symbolu ve vstupním řetězci v pořadí vymazání (viz metoda
+        verify_witness()). Svědek je zaznamenán vždy, pokud byl vstupní řetězec přijat prohledáváním. Rozhodnutí
+        na základě Parikhova obrazu a dynamickým programováním nad intervaly svědka neposkytují (viz metoda
+        run_with_witness()).
+
+        :getter: získání svědka, nebo None, pokud vstupní řetězec nebyl přijat nebo svědek není k dispozici.
+        :type: Optional[Witness]
+        """
+        return self.__witness
+
+    @property
+    def parikh_vector_rejected(self) -> bool:
+        """Odmítnutí vstupního řetězce během posledního běhu vymazávacího systému na základě počtů symbolů.
+
+        :getter: získání pravdivostní hodnoty, zda byl vstupní řetězec odmítnut ověřením nutných podmínek na základě
+                 Parikhova vektoru (počtů symbolů), a tedy bez prohledávání.
+        :type: bool
+        """
+        return self.__parikh_vector_rejected
+
+    @property
+    def transposition_table_hits(self) -> int:
+        """Počet nalezení konfigurace v transpoziční tabulce během posledního běhu vymazávacího systému.
+
+        :getter: získání počtu konfigurací, jejichž opakované prohledávání bylo díky transpoziční tabulce vynecháno.
+        :type: int
+        """
+        return self.__transposition_table.hits
+
+    @property
+    def transposition_table_misses(self) -> int:
+        """Počet nenalezení konfigurace v transpoziční tabulce během posledního běhu vymazávacího systému.
+
+        :getter: získání počtu konfigurací, které nebyly v transpoziční tabulce nalezeny, a byly tedy prohledány.
+        :type: int
+        """
+        return self.__transposition_table.misses
+
+    @property
+    def viability_prunes(self) -> int:
+        """Počet konfigurací, které nebyly během posledního běhu vymazávacího systému prohledány, neboť počty symbolů
+        zbývající vstupní pásky nemohou odpovídat žádnému řetězci, který převádí aktuální stav automatu pro regulární
+        jazyk do koncového stavu.
+
+        :getter: získání počtu ořezaných podstromů prohledávání.
+        :type: int
+        """
+        return self.__statistics.viability_prunes
+
+    @property
+    def statistics(self) -> SearchStatistics:
+        """Statistiky posledního běhu vymazávacího systému.
+
+        :getter: získání statistik prohledávání (viz třída SearchStatistics).
+        :type: SearchStatistics
+        """
+        return self.__statistics
+
     def _set_erasing_strings(self, erasing_strings: Set[str]) -> None:
         """Nastavení množiny vymazávacích řetězců vymazávacího systému.
 
@@ -173,6 +440,14 @@ class ErasingSystem(FormalModel):
             self.__alphabet.update(set(erasing_string))
 
         self.__erasing_strings = erasing_strings
+        self.__erasing_strings_symbol_counts = {erasing_string: Counter(erasing_string)
+                                                for erasing_string in erasing_strings}
+        # Vymazávací řetězce jsou procházeny v seřazeném pořadí, které na rozdíl od pořadí prvků množiny nezávisí
+        # na hodnotách hašovací funkce.
+        self.__ordered_erasing_strings = sorted(erasing_strings)
+        self.__erasing_string_ids = {erasing_string: erasing_string_id
+                                     for erasing_string_id, erasing_string in enumerate(self.__ordered_erasing_strings)}
+        self.__occurrences_automaton = AhoCorasickAutomaton(self.__ordered_erasing_strings)
 
     def _set_regular_language(self, regular_language: str) -> None:
         """Nastavení regulárního výrazu pro regulární jazyk vymazávacího systému.
@@ -193,12 +468,70 @@ class ErasingSystem(FormalModel):
 
         self.__regular_language = re.findall(r"(\(.+?\)|\[.+?]|.+?)", regular_language)
 
+        # Přeložení všech regulárních výrazů, které jsou při porovnávání využívány, aby při samotném běhu vymazávacího
+        # systému nebylo nutné regulární výrazy opakovaně sestavovat ani překládat.
+        try:
+            self.__regular_language_pattern = re.compile(regular_language)
+        except re.error:
+            raise InvalidRegularLanguagePatternException
+
+        self.__greedy_language_matcher = ComparedLanguagesMatcher(
+            compile_compared_languages(self.__regular_language, True), 0)
+        self.__lazy_language_matcher = ComparedLanguagesMatcher(
+            compile_compared_languages(self.__regular_language, False), DEFAULT_MATCH_LEVEL)
+
+        # Sestavení deterministického konečného automatu pro regulární jazyk. Během prohledávání je poté uchováván
+        # pouze stav automatu pro řetězec vzniklý konkatenací použitých vymazávacích řetězců a připojení vymazávacího
+        # řetězce vyžaduje pouze přečtení jeho symbolů.
+        self.__automaton = create_regular_language_automaton(self.__regular_language)
+        self.__erasing_string_transitions = dict()
+        self.__commuting_erasing_strings = dict()
+
+        # Pro každý stav automatu jsou uchovány pouze netriviální meze počtů výskytů symbolů ve zbývající části řetězce
+        # (viz metoda _is_viable()).
+        self.__state_symbol_bounds = None
+
+        if self.__automaton is not None:
+            self.__state_symbol_bounds = {
+                state: [(symbol, minimum, maximum) for symbol, (minimum, maximum) in state_bounds.items()
+                        if minimum > 0 or maximum is not None]
+                for state, state_bounds in calculate_state_symbol_bounds(self.__automaton).items()}
+
+        # Příprava nutných podmínek přijetí vstupního řetězce na základě počtů symbolů, které závisí jak na vymazávacích
+        # řetězcích, tak na regulárním jazyku.
+        self.__parikh_vector_check = ParikhVectorCheck(self.__ordered_erasing_strings, self.__automaton)
+        self.__interval_dynamic_programming = IntervalDynamicProgramming(self.__ordered_erasing_strings,
+                                                                         self.__automaton)
+        self.__derivation_counting = DerivationCounting(self.__occurrences_automaton, self.__automaton,
+                                                        self.__regular_language_pattern)
+
+        # Pokud má každý vymazávací řetězec délku jedna, lze symboly vstupní pásky vymazat v libovolném pořadí
+        # a o přijetí vstupního řetězce rozhodují pouze počty jeho symbolů (viz třída ParikhImage). Pokud má vymazávací
+        # systém tvar Dyckova jazyka, je o přijetí rozhodnuto zásobníkovým algoritmem (viz třída BracketMatching).
+        # Pro konečný regulární jazyk je využito prohledávání řízené jeho řetězci (viz třída FiniteLanguageSearch).
+        elements = parse_regular_language_elements(self.__regular_language)
+        self.__parikh_image = None
+
+        if elements is not None and all(len(erasing_string) <= 1 for erasing_string in self.__ordered_erasing_strings):
+            self.__parikh_image = create_parikh_image(elements)
+
+        self.__bracket_matching = create_bracket_matching(self.__ordered_erasing_strings, elements)
+        self.__finite_language_search = None
+
+        if elements is not None:
+            words = enumerate_finite_language(elements)
+
+            if words is not None:
+                self.__finite_language_search = FiniteLanguageSearch(words, self.__occurrences_automaton)
+
     def _match_using_greedy_approach(self, input_string: str) -> Tuple[bool, int, List[int]]:
         """Oveření, zda řetězec může náležet do regulárního jazyka s využitím chamtivého kvantifikátoru.
 
         Tato metoda slouží pro ověření, zda řetězec vzniklý konkatenací použitých vymazávacích řetězců by po libovolném
         počtu jednoho a více vymazávacích kroků mohl náležet do reguláního jazyka s využitím přístupu chamtivého
-        kvantifikátoru.
+        kvantifikátoru. Porovnávané prefixy regulárního výrazu i jejich upravené varianty jsou předem spojeny
+        do jediného přeloženého regulárního výrazu (viz třída ComparedLanguagesMatcher), a řetězec je tak porovnán
+        pouze jedním během regulárního výrazu.
 
         :param input_string: vstupní řetězec vzniklý konkatenací použitých vymazávacích řetězců.
         :type input_string: str
@@ -208,50 +541,20 @@ class ErasingSystem(FormalModel):
                  3. seznam obsahující počty opakování jednotlivých podvýrazů regulárního výrazu ve vstupním řetězci.
         :rtype: Tuple[bool, int, List[int]]
         """
-        # Nastavení výchozích hodnot pro zaznamenávané parametry porovnání.
-        match = False
-        match_level = DEFAULT_MATCH_LEVEL
-        quantifiers_levels = list()
-
-        # Nastavení počátečního tvaru porovnávaného regulárního výrazu (regulárního jazyku), přičemž porovnávaný jazyk
-        # (compared_language) je nastaven jako první prvek seznamu podvýrazů regulárního výrazu.
-        regular_language_list = self.__regular_language.copy()
-        compared_language = [regular_language_list[0]]
-        regular_language_list.pop(0)
-
-        while match_level == DEFAULT_MATCH_LEVEL:
-            # Kontrola, zda vstupní řetězec náleží do regulárního jazyka bez potřebných úprav porovnávaného regulárního
-            # výrazu.
-            match_result = re.fullmatch("".join(compared_language), input_string)
-
-            if match_result:
-                # Pokud ano, jsou nastaveny parametry pro provedené porovnání.
-                match = True
-                match_level, quantifiers_levels = calculate_levels(match_result.groups(),
-                                                                   compared_language,
-                                                                   input_string)
-            else:
-                # V opačném případě je zapotřebí provést určité úpravy porovnávaného regulárního jazyka pro ověření
-                # všech možností porovnání. Pokud ani po modifikaci zmíněného výrazu nenáleží vstupní řetězec
-                # do podčásti regulárního jazyka, poté, pokud je to možné, je přidána k porovnávanému regulárnímu
-                # výrazu další podčást regulárního jazyka.
-                match, match_level, quantifiers_levels = match_transformed_language(compared_language, input_string)
-
-                if not match:
-                    if len(regular_language_list) > 0:
-                        compared_language.append(regular_language_list[0])
-                        regular_language_list.pop(0)
-                    else:
-                        match_level = 0
-
-        return match, match_level, quantifiers_levels
+        # Porovnávaný jazyk postupně roste o jeden prvek seznamu podvýrazů regulárního výrazu. Pokud vstupní řetězec
+        # nenáleží do podčásti regulárního jazyka bez úprav, je porovnán s upraveným porovnávaným jazykem. Pokud ani
+        # po modifikaci zmíněného výrazu nenáleží vstupní řetězec do podčásti regulárního jazyka, je porovnán další
+        # prefix regulárního výrazu. Toto pořadí odpovídá pořadí alternativ spojeného regulárního výrazu.
+        return self.__greedy_language_matcher.match(input_string)
 
     def _match_using_lazy_approach(self, input_string: str) -> Tuple[bool, int, List[int]]:
         """Oveření, zda řetězec může náležet do regulárního jazyka s využitím líného kvantifikátoru.
 
         Tato metoda slouží pro ověření, zda řetězec vzniklý konkatenací použitých vymazávacích řetězců by po libovolném
         počtu jednoho a více vymazávacích kroků mohl náležet do reguláního jazyka s využitím přístupu líného
-        kvantifikátoru.
+        kvantifikátoru. Líný přístup hledá nejkratší podčást regulárního výrazu (od jeho začátku), do které řetězec
+        může náležet. Porovnávané podčásti jsou proto předem seřazeny od nejkratší a spojeny do jediného přeloženého
+        regulárního výrazu, jehož první shodující se alternativa odpovídá nejkratší takové podčásti.
 
         :param input_string: vstupní řetězec vzniklý konkatenací použitých vymazávacích řetězců.
         :type input_string: str
@@ -261,50 +564,7 @@ class ErasingSystem(FormalModel):
                  3. seznam obsahující počty opakování jednotlivých podvýrazů regulárního výrazu ve vstupním řetězci.
         :rtype: Tuple[bool, int, List[int]]
         """
-        # Nastavení výchozích hodnot pro zaznamenávané parametry porovnání.
-        saved_tuple = (False, DEFAULT_MATCH_LEVEL, list())
-
-        # Nastavení počátečního tvaru porovnávaného regulárního výrazu (regulárního jazyku), přičemž se začíná
-        # od původního tvaru regulárního výrazu a postupně jsou od jeho konce odebírány jednotlivé podčásti
-        # regulárního jazyka.
-        regular_language_list = self.__regular_language.copy()
-
-        while len(regular_language_list) > 0:
-            # Kontrola, zda vstupní řetězec náleží do regulárního jazyka bez potřebných úprav porovnávaného regulárního
-            # výrazu.
-            match_result = re.fullmatch("".join(regular_language_list), input_string)
-
-            if match_result:
-                # Pokud ano, jsou nastaveny parametry pro provedené porovnání.
-                match = True
-                match_level, quantifiers_levels = calculate_levels(match_result.groups(),
-                                                                   regular_language_list,
-                                                                   input_string)
-            else:
-                # V opačném případě je zapotřebí provést určité úpravy porovnávaného regulárního jazyka pro ověření
-                # všech možností porovnání. Pokud ani po modifikaci zmíněného výrazu nenáleží vstupní řetězec
-                # do podčásti regulárního jazyka.
-                match, match_level, quantifiers_levels = match_transformed_language(regular_language_list,
-                                                                                    input_string)
-
-            # Pokud řetězec může náležet do regulárního jazyka, jsou uloženy aktuální parametry porovnání.
-            # Pokud v následujícím bude opět moci náležet řetězec do regulárního jazyka s využitím menšího počtu
-            # podvýrazů regulárního výrazu, bude aktulně uložená hodnota nahrazena novou hodnotou.
-            if match:
-                saved_tuple = (match, match_level, quantifiers_levels)
-
-            # Od porovnávaného regulárního jazyka je odebrána jeho další podčást. Pokud posledním elementem je operátor
-            # „*“ nebo „+“, může být odstraněn i předcházející podvýraz regulárního výrazu pro regulární jazyk.
-            # Zároveň dle prováděných kontrol regulárního výrazu při inicializaci vymazávacího systému nemůže regulární
-            # výraz začínat jedním z uvedených operátoru. Z toho vyplývá, že délka seznamu, který končí uvedeným
-            # operátorem, je větší nebo rovna dvěma prvkům. Tudíž pro minimalizaci kontrol při iteraci není prováděna
-            # kontrola délky seznamu.
-            if regular_language_list[-1] in ["*", "+"]:
-                regular_language_list = regular_language_list[:len(regular_language_list) - 2]
-            else:
-                regular_language_list.pop()
-
-        return saved_tuple
+        return self.__lazy_language_matcher.match(input_string)
 
     def _match_regular_language(self, input_string: str,
                                 full_match: bool = False) -> Tuple[bool, int, List[int]]:
@@ -326,7 +586,9 @@ class ErasingSystem(FormalModel):
                  3. seznam obsahující počty opakování jednotlivých podvýrazů regulárního výrazu ve vstupním řetězci.
         :rtype: Tuple[bool, int, List[int]]
         """
-        if full_match and re.fullmatch("".join(self.__regular_language), input_string) is None:
+        self.__statistics.regular_expression_evaluations = self.__statistics.regular_expression_evaluations + 1
+
+        if full_match and self.__regular_language_pattern.fullmatch(input_string) is None:
             return False, 0, list()
 
         if self.__quantifier_type_greedy:
@@ -336,163 +598,903 @@ class ErasingSystem(FormalModel):
 
         return match, match_level, quantifiers_levels
 
-    def _is_accepted(self, input_tape: str, erased_strings_concatenation: str) -> bool:
-        """Hlavní algoritmus činnosti vymazávacího systému.
+    def _apply_erasing_string(self, language_state: int,
+                              erased_strings_concatenation: str,
+                              erasing_string: str) -> Tuple[bool, int, Optional[List[int]], int]:
+        """Ověření, zda může být vymazávací řetězec připojen k řetězci vzniklému konkatenací použitých řetězců.
 
-        Tato metoda implementuje hlavní algoritmus vymazávacího systému, který je v textu představen v sekci 7.1 a
-        zapsán pomocí výpisu a pseudokódu v příloze E.
+        Pokud je pro regulární jazyk sestaven deterministický konečný automat, je vymazávací řetězec pouze přečten
+        z aktuálního stavu automatu, a úroveň shody je tak získána bez opětovného porovnávání celého řetězce vzniklého
+        konkatenací. Úrovně počtu opakování podvýrazů nelze z konečného počtu stavů automatu určit, a proto jsou
+        v takovém případě vypočteny až tehdy, kdy jsou skutečně potřeba (viz metoda _complete_quantifiers_levels()).
+        Bez automatu je využito porovnání s regulárními výrazy.
 
-        :param input_tape: vstupní páska v aktuálním stavu přijímání.
-        :type input_tape: str
-        :param erased_strings_concatenation: řetězec vzniklý konkatenací použitých vymazávacích řetězců v aktuálním
-                                             stavu přijímání.
+        :param language_state: stav automatu po přečtení řetězce vzniklého konkatenací použitých vymazávacích řetězců.
+        :type language_state: int
+        :param erased_strings_concatenation: řetězec vzniklý konkatenací použitých vymazávacích řetězců.
         :type erased_strings_concatenation: str
-        :return: pravdivostní hodnota, zda vstupní řetězec je přijat vymazávacím systémem (True) či nikoliv (False)
-                 pro daný tvar vstupní pásky a řetězce vzniklého konkatenací použitých vymazávacích řetězců.
-                 Tato navrácená hodnota je využívána při rekurzivních volání metody.
+        :param erasing_string: ověřovaný vymazávací řetězec.
+        :type erasing_string: str
+        :return: čtveřice hodnot, které po řadě reprezentují:
+                 1. zda řetězec po připojení vymazávacího řetězce může náležet do regulárního jazyka,
+                 2. úroveň shody řetězce s regulárním výrazem,
+                 3. seznam obsahující počty opakování jednotlivých podvýrazů, nebo None, pokud dosud nebyl vypočten,
+                 4. stav automatu po přečtení vymazávacího řetězce.
+        :rtype: Tuple[bool, int, Optional[List[int]], int]
+        """
+        if self.__automaton is None:
+            match, match_level, quantifiers_levels = self._match_regular_language(erased_strings_concatenation +
+                                                                                  erasing_string)
+
+            return match, match_level, quantifiers_levels, DEAD_STATE
+
+        next_language_state = self._read_erasing_string(language_state, erasing_string)
+
+        if next_language_state == DEAD_STATE:
+            return False, DEFAULT_MATCH_LEVEL, None, DEAD_STATE
+
+        return True, self.__automaton.match_levels[next_language_state], None, next_language_state
+
+    def _complete_quantifiers_levels(self, group: List[Tuple[str, int, Optional[List[int]], int]],
+                                     erased_strings: List[str]) -> None:
+        """Doplnění dosud nevypočtených úrovní počtu opakování podvýrazů.
+
+        Úrovně počtu opakování podvýrazů slouží pouze pro výběr mezi aplikovatelnými vymazávacími řetězci se shodnou
+        vybranou úrovní shody. Jsou proto vypočteny pouze tehdy, pokud takových vymazávacích řetězců existuje více.
+
+        :param group: skupina aplikovatelných vymazávacích řetězců s vybranou úrovní shody, která je upravena na místě.
+        :type group: List[Tuple[str, int, Optional[List[int]], int]]
+        :param erased_strings: použité vymazávací řetězce v pořadí jejich použití.
+        :type erased_strings: List[str]
+        """
+        if len(group) < 2:
+            return
+
+        erased_strings_concatenation = "".join(erased_strings)
+
+        for i, (erasing_string, match_level, quantifiers_levels, next_language_state) in enumerate(group):
+            if quantifiers_levels is None:
+                match, match_level, quantifiers_levels = self._match_regular_language(erased_strings_concatenation +
+                                                                                      erasing_string)
+                group[i] = (erasing_string, match_level, quantifiers_levels, next_language_state)
+
+    def _is_final_configuration_accepted(self, erased_strings: List[str], language_state: int) -> bool:
+        """Ověření, zda řetězec vzniklý konkatenací vymazávacích řetězců náleží do regulárního jazyka.
+
+        Tato metoda je využívána v okamžiku, kdy je vstupní páska prázdná.
+
+        :param erased_strings: použité vymazávací řetězce v pořadí jejich použití.
+        :type erased_strings: List[str]
+        :param language_state: stav automatu pro regulární jazyk po přečtení řetězce vzniklého konkatenací.
+        :type language_state: int
+        :return: True, pokud řetězec náleží do regulárního jazyka, jinak False.
         :rtype: bool
         """
-        # Pokud je v aktuálním stavu přijímání vstupního řetězce vstupní páska prázdná, je ověřeno, zda řetězec vzniklý
-        # konkatenací vymazávacích řetězců náleží do regulárního jazyka.
-        if input_tape == "":
-            match, match_level, quantifiers_levels = self._match_regular_language(erased_strings_concatenation, True)
+        if self.__automaton is not None:
+            return language_state in self.__automaton.accepting_states
+
+        match, match_level, quantifiers_levels = self._match_regular_language("".join(erased_strings), True)
+
+        return match
+
+    def _find_applicable_erasing_strings(self, occurrence_index: OccurrenceIndex,
+                                         erased_strings: List[str],
+                                         language_state: int) -> List[Tuple[str, int, Optional[List[int]], int]]:
+        """Nalezení aplikovatelných vymazávacích řetězců v aktuálním stavu přijímání vstupního řetězce.
+
+        :param occurrence_index: index výskytů vymazávacích řetězců na vstupní pásce v aktuálním stavu přijímání.
+        :type occurrence_index: OccurrenceIndex
+        :param erased_strings: použité vymazávací řetězce v pořadí jejich použití.
+        :type erased_strings: List[str]
+        :param language_state: stav automatu pro regulární jazyk po přečtení řetězce vzniklého konkatenací.
+        :type language_state: int
+        :return: seznam aplikovatelných vymazávacích řetězců společně s úrovněmi shody a následujícím stavem automatu.
+        :rtype: List[Tuple[str, int, Optional[List[int]], int]]
+        """
+        detailed_timing = self.__detailed_timing
 
-            return match
+        if detailed_timing:
+            start_time = time.perf_counter()
 
-        # Uchování aplikovatelných vymazávacích řetězců v aktuálním stavu přijímání vstupního řetězce.
+        statistics = self.__statistics
         applicable_erasing_strings = list()
 
         # 1. Nalezení všech vymazávacích řetězců, které jsou podřetězci řetězce definovaného na vstupní pásce.
         # 2. Zároveň všechny vymazávací řetězce musí být aplikovatelné na základě řídícího regulárního jazyka.
-        for erasing_string in self.__erasing_strings:
-            if erasing_string in input_tape:
-                match, match_level, quantifiers_levels = self._match_regular_language(
-                    erased_strings_concatenation + erasing_string)
+        occurrences = occurrence_index.occurrences
+
+        # Řetězec vzniklý konkatenací je nutné sestavit pouze tehdy, pokud pro regulární jazyk není sestaven automat.
+        erased_strings_concatenation = "".join(erased_strings) if self.__automaton is None else ""
+
+        for erasing_string in self.__ordered_erasing_strings:
+            if erasing_string in occurrences:
+                match, match_level, quantifiers_levels, next_language_state = self._apply_erasing_string(
+                    language_state, erased_strings_concatenation, erasing_string)
+                statistics.generated_candidates = statistics.generated_candidates + 1
 
                 if match:
-                    applicable_erasing_strings.append((erasing_string, match_level, quantifiers_levels))
+                    applicable_erasing_strings.append((erasing_string, match_level, quantifiers_levels,
+                                                       next_language_state))
+                else:
+                    statistics.filtered_candidates = statistics.filtered_candidates + 1
+
+        if detailed_timing:
+            statistics.matching_time = statistics.matching_time + time.perf_counter() - start_time
+
+        return applicable_erasing_strings
+
+    def _choose_erasing_string(self, applicable_erasing_strings: ApplicableErasingStringsQueue,
+                               occurrence_index: OccurrenceIndex,
+                               erased_strings: List[str]) -> Tuple[str, int, Optional[List[int]], int]:
+        """Výběr vymazávacího řetězce, který bude v aktuálním stavu přijímání ověřován.
+
+        :param applicable_erasing_strings: prioritní fronta dosud neověřených aplikovatelných vymazávacích řetězců.
+        :type applicable_erasing_strings: ApplicableErasingStringsQueue
+        :param occurrence_index: index výskytů vymazávacích řetězců na vstupní pásce v aktuálním stavu přijímání.
+        :type occurrence_index: OccurrenceIndex
+        :param erased_strings: použité vymazávací řetězce v pořadí jejich použití.
+        :type erased_strings: List[str]
+        :return: vybraný aplikovatelný vymazávací řetězec.
+        :rtype: Tuple[str, int, Optional[List[int]], int]
+        """
+        # Výběr vymazávacích řetězců s nejlepší úrovní shody pro zvolený typ kvantifikátoru (nejnižší pro chamtivý
+        # a nejvyšší pro líný kvantifikátor) a následně s nejlepšími úrovněmi počtu opakování podvýrazů.
+        detailed_timing = self.__detailed_timing
+
+        if detailed_timing:
+            start_time = time.perf_counter()
+
+        group = applicable_erasing_strings.best_group()
+        self._complete_quantifiers_levels(group, erased_strings)
+        quantifier_based_applicable_strings = applicable_erasing_strings.filter_best_quantifiers_levels(group)
+
+        if detailed_timing:
+            self.__statistics.matching_time = self.__statistics.matching_time + time.perf_counter() - start_time
+
+        # 3. Nedeterministický výběr jednoho vymazávacího řetězce (dle zvolené strategie pořadí prohledávání).
+        return self.__ordering_policy.choose_erasing_string(quantifier_based_applicable_strings,
+                                                            occurrence_index.occurrences)
+
+    def _read_erasing_string(self, language_state: int, erasing_string: str) -> int:
+        """Přečtení vymazávacího řetězce automatem pro regulární jazyk s využitím dříve vypočtených přechodů.
+
+        :param language_state: stav automatu, ze kterého je vymazávací řetězec čten.
+        :type language_state: int
+        :param erasing_string: čtený vymazávací řetězec.
+        :type erasing_string: str
+        :return: stav automatu po přečtení vymazávacího řetězce, nebo DEAD_STATE.
+        :rtype: int
+        """
+        if language_state == DEAD_STATE:
+            return DEAD_STATE
+
+        transition = (language_state, erasing_string)
+        next_language_state = self.__erasing_string_transitions.get(transition)
+
+        if next_language_state is None:
+            next_language_state = self.__automaton.read(language_state, erasing_string)
+            self.__erasing_string_transitions[transition] = next_language_state
+
+        return next_language_state
+
+    def _erasing_strings_commute(self, language_state: int, first_erasing_string: str,
+                                 second_erasing_string: str) -> bool:
+        """Ověření, zda připojení dvou vymazávacích řetězců v libovolném pořadí vede ke stejnému stavu přijímání.
+
+        :param language_state: stav automatu pro regulární jazyk před připojením vymazávacích řetězců.
+        :type language_state: int
+        :param first_erasing_string: první vymazávací řetězec.
+        :type first_erasing_string: str
+        :param second_erasing_string: druhý vymazávací řetězec.
+        :type second_erasing_string: str
+        :return: True, pokud obě pořadí vedou ke stejnému živému stavu automatu (bez automatu ke stejnému řetězci),
+                 jinak False.
+        :rtype: bool
+        """
+        if self.__automaton is None:
+            return first_erasing_string + second_erasing_string == second_erasing_string + first_erasing_string
+
+        key = (language_state, first_erasing_string, second_erasing_string)
+        commute = self.__commuting_erasing_strings.get(key)
+
+        if commute is None:
+            first_order_state = self._read_erasing_string(
+                self._read_erasing_string(language_state, first_erasing_string), second_erasing_string)
+            second_order_state = self._read_erasing_string(
+                self._read_erasing_string(language_state, second_erasing_string), first_erasing_string)
+            commute = first_order_state != DEAD_STATE and first_order_state == second_order_state
+            self.__commuting_erasing_strings[key] = commute
+
+        return commute
+
+    def _calculate_child_sleep_set(self, tape: ErasableTape, frame: SearchFrame, erasing_string: str,
+                                   position: int) -> FrozenSet[Tuple[str, int]]:
+        """Výpočet množiny vynechávaných vymazání pro konfiguraci vzniklou vymazáním vymazávacího řetězce.
+
+        Implementace odpovídá takzvaným sleep sets. Vymazání, která již byla z rámce prohledána nebo která z rámce
+        nemusí být prohledávána, nemusí být prohledávána ani z nové konfigurace, pokud jsou nezávislá s provedeným
+        vymazáním. Pořadí obou vymazání totiž vede ke stejné konfiguraci, která je prohledávána v jiné větvi. Nezávislá
+        vymazání se na vstupní pásce nepřekrývají a jejich vymazávací řetězce komutují vzhledem ke stavu přijímání.
+        Vymazání jsou určena aktuální pozicí výskytu na vstupní pásce (nikoliv původním indexem), neboť konfigurace
+        se stejným obsahem vstupní pásky mohou vzniknout vymazáním různých symbolů vstupního řetězce.
+
+        :param tape: vstupní páska v konfiguraci rámce.
+        :type tape: ErasableTape
+        :param frame: rámec, ze kterého je vymazávací řetězec vymazán.
+        :type frame: SearchFrame
+        :param erasing_string: vymazávaný vymazávací řetězec.
+        :type erasing_string: str
+        :param position: původní index prvního symbolu vymazávaného výskytu.
+        :type position: int
+        :return: množina vynechávaných vymazání pro novou konfiguraci.
+        :rtype: FrozenSet[Tuple[str, int]]
+        """
+        if len(frame.sleep_set) == 0:
+            return frame.sleep_set
+
+        start = tape.position(position)
+        end = start + len(erasing_string)
+        child_sleep_set = list()
+
+        for sleeping_erasing_string, sleeping_start in frame.sleep_set:
+            if not self._erasing_strings_commute(frame.language_state, erasing_string, sleeping_erasing_string):
+                continue
+
+            # Pozice vymazání za vymazaným výskytem se na nové vstupní pásce posouvají o délku vymazávacího řetězce.
+            if sleeping_start + len(sleeping_erasing_string) <= start:
+                child_sleep_set.append((sleeping_erasing_string, sleeping_start))
+            elif end <= sleeping_start:
+                child_sleep_set.append((sleeping_erasing_string, sleeping_start - len(erasing_string)))
+
+        return frozenset(child_sleep_set)
+
+    def _is_viable(self, language_state: int, remaining_symbol_counts: Counter, erasing_string: str) -> bool:
+        """Ověření, zda z konfigurace vzniklé vymazáním vymazávacího řetězce může být vstupní řetězec přijat.
+
+        Symboly zbývající vstupní pásky budou vymazány zbývajícími vymazávacími řetězci, jejichž konkatenace musí
+        převádět stav automatu pro regulární jazyk do koncového stavu. Počet výskytů každého symbolu na zbývající
+        vstupní pásce proto musí ležet mezi minimálním a maximálním počtem výskytů symbolu v takových řetězcích.
+
+        :param language_state: stav automatu pro regulární jazyk po připojení vymazávacího řetězce.
+        :type language_state: int
+        :param remaining_symbol_counts: počty symbolů vstupní pásky před vymazáním vymazávacího řetězce.
+        :type remaining_symbol_counts: Counter
+        :param erasing_string: vymazávaný vymazávací řetězec.
+        :type erasing_string: str
+        :return: False, pokud vstupní řetězec z nové konfigurace jistě nemůže být přijat, jinak True.
+        :rtype: bool
+        """
+        erasing_string_symbol_counts = self.__erasing_strings_symbol_counts[erasing_string]
+
+        for symbol, minimum, maximum in self.__state_symbol_bounds[language_state]:
+            count = remaining_symbol_counts[symbol] - erasing_string_symbol_counts[symbol]
+
+            if count < minimum or (maximum is not None and count > maximum):
+                return False
+
+        return True
+
+    def _is_accepted(self, input_string: str, test_all_overlapping_positions: bool) -> bool:
+        """Hlavní algoritmus činnosti vymazávacího systému.
+
+        Tato metoda implementuje hlavní algoritmus vymazávacího systému, který je v textu představen v sekci 7.1 a
+        zapsán pomocí výpisu a pseudokódu v příloze E. Místo rekurzivních volání je využit explicitní zásobník rámců
+        (viz třída SearchFrame), přičemž pořadí prohledávání i všech nedeterministických výběrů odpovídá rekurzivnímu
+        zápisu algoritmu. Délka vstupního řetězce tak není omezena maximální hloubkou rekurze.
+
+        :param input_string: vstupní řetězec, přičemž se jedná o počáteční tvar vstupní pásky.
+        :type input_string: str
+        :param test_all_overlapping_positions: pravdivostní hodnota, zda mají být ověřovány všechny pozice vymazávacích
+                                               řetězců.
+        :type test_all_overlapping_positions: bool
+        :return: pravdivostní hodnota, zda vstupní řetězec je přijat vymazávacím systémem (True) či nikoliv (False).
+        :rtype: bool
+        :raises SearchBudgetExhaustedException: rozpočet prohledávání byl vyčerpán.
+        """
+        # Pokud je vstupní páska prázdná, je ověřeno, zda řetězec vzniklý konkatenací vymazávacích řetězců (prázdný
+        # řetězec) náleží do regulárního jazyka.
+        tracer = self.__tracer
+
+        if input_string == "":
+            accepted = self._is_final_configuration_accepted([], INITIAL_LANGUAGE_STATE)
+
+            if accepted:
+                self.__witness = ()
+
+                if tracer is not None:
+                    tracer.accept([])
+
+            return accepted
+
+        # Vstupní páska i výskyty vymazávacích řetězců jsou sdíleny všemi rámci. Při každém vymazání jsou upraveny pouze
+        # lokálně a při návratu z prohledávané konfigurace jsou obnoveny. Obdobně je řetězec vzniklý konkatenací
+        # použitých vymazávacích řetězců reprezentován seznamem vymazávacích řetězců, který odpovídá cestě k rámci
+        # na vrcholu zásobníku, a sestaven je pouze v případě potřeby.
+        statistics = self.__statistics
+        detailed_timing = self.__detailed_timing
+        tape = ErasableTape(input_string)
+        occurrence_index = OccurrenceIndex(self.__occurrences_automaton, tape)
+        erased_strings = list()
+        remaining_symbol_counts = Counter(input_string)
+        statistics.expanded_nodes = statistics.expanded_nodes + 1
+
+        if self.__search_budget is not None:
+            self.__search_budget.consume()
+
+        if tracer is not None:
+            tracer.node_entered(input_string, erased_strings)
+
+        stack = [SearchFrame(INITIAL_LANGUAGE_STATE, ApplicableErasingStringsQueue(
+            self._find_applicable_erasing_strings(occurrence_index, erased_strings, INITIAL_LANGUAGE_STATE),
+            self.__quantifier_type_greedy))]
+
+        # Výsledek prohledání naposledy odebraného rámce, který je zpracován v rodičovském rámci.
+        child_accepted = None
+        partial_order_reduction = test_all_overlapping_positions and self.__partial_order_reduction
+
+        while len(stack) != 0:
+            frame = stack[-1]
+
+            if child_accepted is not None:
+                # Zpracování výsledku prohledání konfigurace vzniklé vymazáním zvoleného vymazávacího řetězce.
+                if child_accepted:
+                    # Rámce na zásobníku odpovídají cestě k přijímající konfiguraci a každý z nich uchovává zvolený
+                    # vymazávací řetězec a původní index jeho vymazání.
+                    self.__witness = self._create_witness(
+                        [(stack_frame.erasing_string_tuple[ERASING_STRING_TUPLE_INDEX], stack_frame.selected_position)
+                         for stack_frame in stack])
 
-        while len(applicable_erasing_strings) != 0:
-            if self.__quantifier_type_greedy:
-                # Výběr příslušných hodnot pro chamtivý kvantifikátor.
-                chosen_match_level = min([erasing_string_tuple[MATCH_LEVEL_TUPLE_INDEX]
-                                          for erasing_string_tuple in applicable_erasing_strings])
-                chosen_quantifiers_levels = filter_quantifier_levels(applicable_erasing_strings,
-                                                                     chosen_match_level,
-                                                                     True)
-            else:
-                # Výběr příslušných hodnot pro líný kvantifikátor.
-                chosen_match_level = max([erasing_string_tuple[MATCH_LEVEL_TUPLE_INDEX]
-                                          for erasing_string_tuple in applicable_erasing_strings])
-
-                chosen_quantifiers_levels = filter_quantifier_levels(applicable_erasing_strings,
-                                                                     chosen_match_level,
-                                                                     False)
-
-            # 3. Nedeterministický výběr jednoho vymazávacího řetězce.
-            quantifier_based_applicable_strings = filter_applicable_erasing_strings(applicable_erasing_strings,
-                                                                                    chosen_quantifiers_levels,
-                                                                                    chosen_match_level)
-            erasing_string_to_application_tuple = choice(quantifier_based_applicable_strings)
-
-            erasing_string_to_application = erasing_string_to_application_tuple[ERASING_STRING_TUPLE_INDEX]
-
-            # 4. Nalezení všech i překrývajících se výskytů zvoleného vymazávacího řetězce na vstupní pásce.
-
-            # Následující řádek kódu je převzat:
-            #
-            # Zdrojový web: Stack Overflow.
-            # Odkaz na původní otázku: https://stackoverflow.com/questions/4664850/how-to-find-all-occurrences-of-a-substring
-            # Autor otázky: nukl (https://stackoverflow.com/users/277262/nukl).
-            # Otázka upravena: Karl Knechtel (https://stackoverflow.com/users/523612/karl-knechtel).
-            # Autor odpovědi: moinudin (https://stackoverflow.com/users/89806/moinudin).
-            # Odpověď upravena: David Leon (https://stackoverflow.com/users/3941704/david-leon).
-            #
-            # *** Začátek převzatého kódu. ***
-            all_overlapping_positions = [m.start() for m in re.finditer("(?=" + erasing_string_to_application + ")",
-                                                                        input_tape)]
-            # *** Konec převzatého kódu. ***
-
-            while len(all_overlapping_positions) != 0:
-                # 5. Nedeterministický výběr jedné pozice výskytu zvoleného vymazávacího řetězce.
-                selected_position = choice(all_overlapping_positions)
-
-                if self.__verbose:
-                    if erased_strings_concatenation == "":
-                        print_erased_strings_concatenation = "\"epsilon\""
-                    else:
-                        print_erased_strings_concatenation = erased_strings_concatenation
-
-                    if self.__verbose:
-                        print("----------------------")
-                        print("Chosen erasing string: " +
-                              erasing_string_to_application_tuple[ERASING_STRING_TUPLE_INDEX])
-                        print("Input tape: " + input_tape[:selected_position] + "#" + input_tape[selected_position:])
-                        print("Erased strings concatenation: " + print_erased_strings_concatenation)
-                        print("----------------------\n")
-
-                # 6. Vymazání zvoleného vymazávacího řetězce z určené pozice na vstupní pásce.
-                input_tape_after_erasing = input_tape[:selected_position] + \
-                                           input_tape[selected_position + len(erasing_string_to_application):]  # noqa: E127
-
-                # Rekurzivní volání metody s novými hodnotami pro aktuální tvar vstupní pásky a řetězce vzniklého
-                # konkatenací použitých vymazávacích řetězců.
-                if self._is_accepted(input_tape_after_erasing,
-                                     erased_strings_concatenation + erasing_string_to_application):
                     return True
-                elif self.__test_all_overlapping_positions:
+
+                # Hash obsahu vstupní pásky neprokazuje její obsah, a proto je spolu s konfigurací uložen i obsah.
+                # Vstupní páska je ve stavu nové konfigurace pouze tehdy, pokud nová konfigurace byla prohledána.
+                if frame.child_erasure is not None:
+                    child_tape_content = str(tape)
+                else:
+                    child_tape_content = tape.erased_content(
+                        frame.selected_position, len(frame.erasing_string_tuple[ERASING_STRING_TUPLE_INDEX]))
+
+                self.__transposition_table.store_failed(frame.child_configuration, frame.child_sleep_set,
+                                                        child_tape_content)
+                child_accepted = None
+
+                if frame.child_erasure is not None:
+                    if detailed_timing:
+                        start_time = time.perf_counter()
+
+                    occurrence_index.restore(frame.child_erasure)
+                    remaining_symbol_counts.update(self.__erasing_strings_symbol_counts[erased_strings.pop()])
+                    frame.child_erasure = None
+
+                    if detailed_timing:
+                        statistics.tape_time = statistics.tape_time + time.perf_counter() - start_time
+
+                if partial_order_reduction:
+                    # Prohledané vymazání nemusí být prohledáváno z konfigurací, které vzniknou nezávislými vymazáními
+                    # z aktuální konfigurace.
+                    frame.sleep_set = frame.sleep_set | {(frame.erasing_string_tuple[ERASING_STRING_TUPLE_INDEX],
+                                                          tape.position(frame.selected_position))}
+
+                if test_all_overlapping_positions:
                     # Algoritmus pracuje v režimu testování všech pozic vymazávacích řetězců. Pokud tedy pro daný
                     # vymazávací řetězec odstraněný z určené pozice na vstupní pásce není možné přimout vstupní
                     # řetězec, bude z množiny všech aplikovatelných pozic odstraněna zvolená pozice. Dále pro totožný
                     # vymazávací řetězec se následně v další iteraci nedeterministicky zvolí jiná pozice.
-                    all_overlapping_positions.remove(selected_position)
+                    frame.overlapping_positions.remove(frame.selected_position)
                 else:
                     # Pokud algoritmus nepracuje v režimu testování všech pozic, je množina všech aplikovatelných pozic
                     # nastavena jako prázdná množina a v další iteraci bude ověrován jiný vymazávací řetězec.
-                    all_overlapping_positions.clear()
+                    frame.overlapping_positions.clear()
+
+            if len(frame.overlapping_positions) == 0:
+                # V daném kroku přijímání vstupního řetězce zvolení ověřovaného vymazávací řetězec nevedlo k přijetí
+                # vstupního řetězce. Daný řetězec tedy bude odstraněn z množiny všech aplikovatelných vymazávacích
+                # řetězců. Následně se pro aktuální tvar vstupní pásky zvolí jiný vymazávací řetězec.
+                if frame.erasing_string_tuple is not None:
+                    frame.applicable_erasing_strings.remove(frame.erasing_string_tuple)
+                    frame.erasing_string_tuple = None
+
+                if len(frame.applicable_erasing_strings) == 0:
+                    # Z aktuální konfigurace nelze vstupní řetězec přijmout.
+                    if tracer is not None:
+                        tracer.backtrack(tape, erased_strings)
+
+                    stack.pop()
+                    statistics.backtracks = statistics.backtracks + 1
+                    child_accepted = False
+                    continue
+
+                frame.erasing_string_tuple = self._choose_erasing_string(frame.applicable_erasing_strings,
+                                                                         occurrence_index,
+                                                                         erased_strings)
+
+                # 4. Všechny i překrývající se výskyty zvoleného vymazávacího řetězce na vstupní pásce jsou uchovány
+                # v indexu výskytů.
+                frame.overlapping_positions = list(
+                    occurrence_index.occurrences[frame.erasing_string_tuple[ERASING_STRING_TUPLE_INDEX]])
+
+                if partial_order_reduction and (len(frame.sleep_set) > 0 or frame.awake_erasures is not None):
+                    erasing_string = frame.erasing_string_tuple[ERASING_STRING_TUPLE_INDEX]
+                    erasures = [(position, (erasing_string, tape.position(position)))
+                                for position in frame.overlapping_positions]
+                    frame.overlapping_positions = [position for position, erasure in erasures
+                                                   if erasure not in frame.sleep_set and
+                                                   (frame.awake_erasures is None or erasure in frame.awake_erasures)]
+
+                    if len(frame.overlapping_positions) == 0:
+                        continue
+
+            erasing_string_to_application = frame.erasing_string_tuple[ERASING_STRING_TUPLE_INDEX]
+            next_language_state = frame.erasing_string_tuple[NEXT_LANGUAGE_STATE_TUPLE_INDEX]
+
+            # 5. Nedeterministický výběr jedné pozice výskytu zvoleného vymazávacího řetězce.
+            frame.selected_position = self.__ordering_policy.choose_position(frame.overlapping_positions)
+
+            if tracer is not None:
+                tracer.erasure(tape, tape.position(frame.selected_position), erasing_string_to_application,
+                               erased_strings)
+
+            # Konfigurace, u kterých již bylo prokázáno, že z nich nelze vstupní řetězec přijmout, nejsou opakovaně
+            # prohledávány. Vstupní páska je v konfiguraci reprezentována hashem jejího obsahu po vymazání, přičemž
+            # přesný obsah je sestaven až při nalezení konfigurace se shodným hashem. Pokud je sestaven automat pro
+            # regulární jazyk, závisí přijetí vstupního řetězce pouze na stavu automatu, a nikoliv na celém řetězci
+            # vzniklém konkatenací použitých vymazávacích řetězců.
+            tape_content_hash = tape.erased_content_hash(frame.selected_position, len(erasing_string_to_application))
+            child_content = partial(tape.erased_content, frame.selected_position, len(erasing_string_to_application))
+
+            if partial_order_reduction and len(tape) != len(erasing_string_to_application):
+                frame.child_sleep_set = self._calculate_child_sleep_set(tape, frame, erasing_string_to_application,
+                                                                        frame.selected_position)
+            else:
+                frame.child_sleep_set = frozenset()
+
+            if self.__automaton is None:
+                frame.child_configuration = (tape_content_hash,
+                                             "".join(erased_strings) + erasing_string_to_application)
+            else:
+                frame.child_configuration = (tape_content_hash, next_language_state)
+
+            # Pokud byla konfigurace dříve neúspěšně prohledána s jinou množinou vynechávaných vymazání, jsou z ní
+            # prohledávána pouze ta vymazání, která byla dříve vynechána a nyní vynechána nejsou.
+            child_awake_erasures = None
+
+            if partial_order_reduction:
+                stored_sleep_set = self.__transposition_table.failed_sleep_set(frame.child_configuration, child_content)
+
+                if stored_sleep_set is not None:
+                    child_awake_erasures = stored_sleep_set - frame.child_sleep_set
+
+            if self.__transposition_table.contains_failed(frame.child_configuration, frame.child_sleep_set,
+                                                          child_content):
+                child_accepted = False
+            elif len(tape) == len(erasing_string_to_application):
+                erased_strings.append(erasing_string_to_application)
+                child_accepted = self._is_final_configuration_accepted(erased_strings, next_language_state)
+
+                if child_accepted and tracer is not None:
+                    tracer.accept(erased_strings)
+
+                erased_strings.pop()
+            elif self.__automaton is not None and \
+                    not self._is_viable(next_language_state, remaining_symbol_counts, erasing_string_to_application):
+                # Podstrom prohledávání, ze kterého nelze vstupní řetězec přijmout, není prohledáván.
+                statistics.viability_prunes = statistics.viability_prunes + 1
+                child_accepted = False
+            else:
+                # 6. Vymazání zvoleného vymazávacího řetězce z určené pozice na vstupní pásce a prohledání nové
+                # konfigurace, které odpovídá rekurzivnímu volání hlavního algoritmu.
+                statistics.expanded_nodes = statistics.expanded_nodes + 1
+
+                if self.__search_budget is not None:
+                    self.__search_budget.consume()
+
+                if detailed_timing:
+                    start_time = time.perf_counter()
 
-            # V daném kroku přijímání vstupního řetězce zvolení ověřovaného vymazávací řetězec nevedlo k přijetí
-            # vstupního řetězce. Daný řetězec tedy bude odstraněn z množiny všech aplikovatelných vymazávacích řetězců.
-            # Následně se v další iteraci zvolí pro aktuální tvar vstupní pásky jiný vymazávací řetězec.
-            applicable_erasing_strings.remove(erasing_string_to_application_tuple)
+                frame.child_erasure = occurrence_index.erase(frame.selected_position,
+                                                             len(erasing_string_to_application))
+                erased_strings.append(erasing_string_to_application)
+                remaining_symbol_counts.subtract(self.__erasing_strings_symbol_counts[erasing_string_to_application])
+
+                if detailed_timing:
+                    statistics.tape_time = statistics.tape_time + time.perf_counter() - start_time
+
+                if len(erased_strings) > statistics.maximum_depth:
+                    statistics.maximum_depth = len(erased_strings)
+
+                if tracer is not None:
+                    tracer.node_entered(tape, erased_strings)
+
+                stack.append(SearchFrame(next_language_state, ApplicableErasingStringsQueue(
+                    self._find_applicable_erasing_strings(occurrence_index, erased_strings, next_language_state),
+                    self.__quantifier_type_greedy), frame.child_sleep_set, child_awake_erasures))
 
         return False
 
+    def _create_search_node(self, tape: str, erased_strings: Tuple[str, ...], positions: Tuple[int, ...],
+                            language_state: int, match_level: int) -> SearchNode:
+        """Vytvoření konfigurace pro prohledávání řízené strategií.
+
+        :param tape: obsah vstupní pásky.
+        :type tape: str
+        :param erased_strings: použité vymazávací řetězce v pořadí jejich použití.
+        :type erased_strings: Tuple[str, ...]
+        :param positions: pozice vymazání použitých vymazávacích řetězců na tehdejší vstupní pásce.
+        :type positions: Tuple[int, ...]
+        :param language_state: stav automatu pro regulární jazyk po přečtení řetězce vzniklého konkatenací.
+        :type language_state: int
+        :param match_level: úroveň shody naposledy použitého vymazávacího řetězce s regulárním výrazem.
+        :type match_level: int
+        :return: konfigurace vymazávacího systému.
+        :rtype: SearchNode
+        """
+        # Klíč konfigurace odpovídá konfiguraci v transpoziční tabulce hlavního algoritmu.
+        if self.__automaton is None:
+            key = (tape, "".join(erased_strings))
+        else:
+            key = (tape, language_state)
+
+        return SearchNode(tape, erased_strings, positions, language_state, match_level, key)
+
+    def _expand_search_node(self, node: SearchNode, test_all_overlapping_positions: bool) -> List[SearchNode]:
+        """Nalezení následníků konfigurace pro prohledávání řízené strategií.
+
+        Aplikovatelné vymazávací řetězce jsou seřazeny stejně jako v hlavním algoritmu vymazávacího systému, tedy podle
+        úrovně shody, úrovní počtu opakování podvýrazů a zvolené strategie pořadí prohledávání.
+
+        :param node: konfigurace vymazávacího systému.
+        :type node: SearchNode
+        :param test_all_overlapping_positions: pravdivostní hodnota, zda mají být ověřovány všechny pozice vymazávacích
+                                               řetězců. V opačném případě je pro každý vymazávací řetězec vytvořen
+                                               pouze jeden následník.
+        :type test_all_overlapping_positions: bool
+        :return: seznam následníků konfigurace v pořadí, ve kterém mají být prohledány.
+        :rtype: List[SearchNode]
+        :raises SearchBudgetExhaustedException: rozpočet prohledávání byl vyčerpán.
+        """
+        statistics = self.__statistics
+        statistics.expanded_nodes = statistics.expanded_nodes + 1
+        statistics.maximum_depth = max(statistics.maximum_depth, len(node.erased_strings))
+        tracer = self.__tracer
+
+        if self.__search_budget is not None:
+            self.__search_budget.consume()
+
+        if tracer is not None:
+            tracer.node_entered(node.tape, node.erased_strings)
+
+        if self.__detailed_timing:
+            start_time = time.perf_counter()
+            occurrence_index = OccurrenceIndex(self.__occurrences_automaton, ErasableTape(node.tape))
+            statistics.tape_time = statistics.tape_time + time.perf_counter() - start_time
+        else:
+            occurrence_index = OccurrenceIndex(self.__occurrences_automaton, ErasableTape(node.tape))
+        erased_strings = list(node.erased_strings)
+        applicable_erasing_strings = ApplicableErasingStringsQueue(
+            self._find_applicable_erasing_strings(occurrence_index, erased_strings, node.language_state),
+            self.__quantifier_type_greedy)
+        remaining_symbol_counts = Counter(node.tape)
+        children = list()
+
+        while len(applicable_erasing_strings) != 0:
+            erasing_string_tuple = self._choose_erasing_string(applicable_erasing_strings, occurrence_index,
+                                                               erased_strings)
+            applicable_erasing_strings.remove(erasing_string_tuple)
+            erasing_string = erasing_string_tuple[ERASING_STRING_TUPLE_INDEX]
+            next_language_state = erasing_string_tuple[NEXT_LANGUAGE_STATE_TUPLE_INDEX]
+
+            if self.__automaton is not None and len(node.tape) != len(erasing_string) and \
+                    not self._is_viable(next_language_state, remaining_symbol_counts, erasing_string):
+                statistics.viability_prunes = statistics.viability_prunes + 1
+                continue
+
+            positions = list(occurrence_index.occurrences[erasing_string])
+
+            if not test_all_overlapping_positions:
+                positions = [self.__ordering_policy.choose_position(positions)]
+
+            for position in positions:
+                if tracer is not None:
+                    tracer.erasure(node.tape, position, erasing_string, node.erased_strings)
+
+                tape = node.tape[:position] + node.tape[position + len(erasing_string):]
+                children.append(self._create_search_node(tape, node.erased_strings + (erasing_string,),
+                                                         node.positions + (position,), next_language_state,
+                                                         erasing_string_tuple[MATCH_LEVEL_TUPLE_INDEX]))
+
+        if len(children) == 0:
+            statistics.backtracks = statistics.backtracks + 1
+
+            if tracer is not None:
+                tracer.backtrack(node.tape, node.erased_strings)
+
+        return children
+
+    def _search(self, input_string: str, test_all_overlapping_positions: bool) -> bool:
+        """Prohledání konfigurací vymazávacího systému nastavenou strategií prohledávání.
+
+        :param input_string: vstupní řetězec, přičemž se jedná o počáteční tvar vstupní pásky.
+        :type input_string: str
+        :param test_all_overlapping_positions: pravdivostní hodnota, zda mají být ověřovány všechny pozice vymazávacích
+                                               řetězců.
+        :type test_all_overlapping_positions: bool
+        :return: pravdivostní hodnota, zda vstupní řetězec je přijat vymazávacím systémem (True) či nikoliv (False).
+        :rtype: bool
+        """
+        if self.__search_strategy is None:
+            return self._is_accepted(input_string, test_all_overlapping_positions)
+
+        root = self._create_search_node(input_string, (), (), INITIAL_LANGUAGE_STATE, DEFAULT_MATCH_LEVEL)
+
+        return self.__search_strategy.search(
+            root,
+            lambda node: self._expand_search_node(node, test_all_overlapping_positions),
+            self._is_accepting_search_node)
+
+    def _is_accepting_search_node(self, node: SearchNode) -> bool:
+        """Ověření, zda je konfigurace prohledávání řízeného strategií přijímající.
+
+        :param node: konfigurace vymazávacího systému.
+        :type node: SearchNode
+        :return: True, pokud je vstupní páska prázdná a řetězec vzniklý konkatenací použitých vymazávacích řetězců
+                 náleží do regulárního jazyka, jinak False.
+        :rtype: bool
+        """
+        accepted = node.tape == "" and self._is_final_configuration_accepted(list(node.erased_strings),
+                                                                             node.language_state)
+
+        if accepted:
+            positions = original_positions(sum(len(erased_string) for erased_string in node.erased_strings),
+                                           [(position, len(erased_string))
+                                            for erased_string, position in zip(node.erased_strings, node.positions)])
+            self.__witness = self._create_witness(list(zip(node.erased_strings, positions)))
+
+            if self.__tracer is not None:
+                self.__tracer.accept(node.erased_strings)
+
+        return accepted
+
     def run(self, input_string: str) -> bool:
         """Spuštění hlavního algoritmu činnosti vymazávacího systému.
 
-        Tato metoda slouží především pro spuštění hlavního algoritmu činnosti vymazávacího systému, který využívá
-        rekurzivních volání metody _is_accepted(). Dále před spuštěním samotné funkcionality vymazávacího systému
-        metoda ověřuje, zda délka vstupní řetězec nepřesahuje maximální povolenou délku.
+        Tato metoda slouží především pro spuštění hlavního algoritmu činnosti vymazávacího systému, který implementuje
+        metoda _is_accepted(). Jelikož algoritmus nevyužívá rekurzivní volání, délka vstupního řetězce je omezena pouze
+        dostupnou pamětí.
 
         :param input_string: vstupní řetězec, přičemž se jedná o počáteční tvar vstupní pásky.
         :return: pravdivostní hodnota, zda vstupní řetězec je přijat vymazávacím systémem (True) či nikoliv (False).
         :rtype: bool
-        :raises MaximumInputStringLengthExceededException: překročena maximální povolená délka vstupního řetězce pro
-                                                           vymazávací systém.
         """
-        if len(input_string) > MAXIMUM_RECURSION_DEPTH:
-            raise MaximumInputStringLengthExceededException
+        if self.__tracer is not None:
+            self.__tracer.run_started(self.erasing_strings, "".join(self.__regular_language), input_string)
 
-        if self.__verbose:
-            print("------------------------------------------------------------------------------------\n")
-            print("#####################")
-            print("Start erasing system:")
-            print("#####################")
-            print("Erasing strings: " + str(self.erasing_strings)[1:-1])
-            print("Regular language (expression): " + "".join(self.__regular_language) + "\n")
-            print("Input string: " + input_string + "\n\n")
+        # Konfigurace uložené při předchozím běhu nemusí odpovídat aktuálnímu nastavení vymazávacího systému (například
+        # ověřování všech pozic vymazávacích řetězců), a proto je transpoziční tabulka před každým během vyprázdněna.
+        self.__transposition_table.clear()
+        self.__statistics = SearchStatistics()
+        self.__witness = None
+        self.__ordering_policy.reset()
+        start_time = time.perf_counter()
 
-        accepted = self._is_accepted(input_string, "")
+        try:
+            accepted = self._decide(input_string)
+        finally:
+            # Statistiky jsou doplněny i tehdy, pokud byl rozpočet prohledávání vyčerpán.
+            self.__statistics.elapsed_time = time.perf_counter() - start_time
+            self.__statistics.transposition_table_hits = self.__transposition_table.hits
+            self.__statistics.transposition_table_misses = self.__transposition_table.misses
+            self.__statistics.parikh_vector_rejected = self.__parikh_vector_rejected
 
-        if self.__verbose:
-            if accepted:
-                print("-> Input string accepted by the erasing system")
-                print("###############################################\n")
-                print("------------------------------------------------------------------------------------")
-            else:
-                print("-> Input string rejected by the erasing system")
-                print("###############################################\n")
-                print("------------------------------------------------------------------------------------")
+        if self.__tracer is not None:
+            self.__tracer.run_finished(input_string, accepted)
+
+        return accepted
+
+    def _decide(self, input_string: str) -> bool:
+        """Rozhodnutí o přijetí vstupního řetězce nejvhodnějším dostupným postupem.
+
+        :param input_string: vstupní řetězec, přičemž se jedná o počáteční tvar vstupní pásky.
+        :type input_string: str
+        :return: pravdivostní hodnota, zda vstupní řetězec je přijat vymazávacím systémem (True) či nikoliv (False).
+        :rtype: bool
+        :raises SearchBudgetExhaustedException: rozpočet prohledávání byl vyčerpán.
+        """
+
+        # Vstupní řetězec, jehož počty symbolů nemohou odpovídat žádnému řetězci vzniklému konkatenací vymazávacích
+        # řetězců v regulárním jazyce, je odmítnut bez prohledávání.
+        self.__parikh_vector_rejected = not self.__parikh_vector_check.is_feasible(input_string,
+                                                                                    self.__search_budget)
+
+        # Rozhodnutí, která neposkytují svědka přijetí, jsou při požadavku na svědka nahrazena prohledáváním se stejným
+        # výsledkem.
+        derivation = list() if self.__witness_required else None
+
+        if self.__parikh_vector_rejected:
+            accepted = False
+        elif self.__parikh_image is not None and not self.__witness_required and self.__tracer is None:
+            # Vymazávací řetězce délky jedna lze vymazat v libovolném pořadí, a vstupní řetězec je tak přijat právě
+            # tehdy, pokud regulární jazyk obsahuje řetězec se stejnými počty symbolů. Tento výpočet nevytváří události
+            # prohledávání, a při nastaveném sledování či požadavku na svědka je proto nahrazen prohledáváním. Podstromy
+            # prohledávání po vymazání různých výskytů téhož symbolu se shodují, a prohledávání tak rozhodne stejně
+            # i bez ověřování všech pozic vymazávacích řetězců.
+            accepted = self.__parikh_image.contains(Counter(input_string), self.__search_budget)
+        elif self.__bracket_matching is not None and self.__tracer is None:
+            # Vstupní řetězec vymazávacího systému tvaru Dyckova jazyka je přijat právě tehdy, pokud jsou jeho závorky
+            # vyvážené. Zásobníkový algoritmus nevytváří události prohledávání, a při nastaveném sledování je proto
+            # vstupní řetězec zpracován prohledáváním. Vymazání páru závorek nemění výsledek vymazání ostatních párů,
+            # a prohledávání tak rozhodne stejně i bez ověřování všech pozic vymazávacích řetězců.
+            accepted = self.__bracket_matching.is_accepted(input_string, derivation, self.__search_budget)
+
+            if accepted and derivation is not None:
+                self.__witness = self._create_witness(derivation)
+        elif self.__finite_language_search is not None:
+            # Řetězec vzniklý konkatenací použitých vymazávacích řetězců musí být jedním z řetězců konečného
+            # regulárního jazyka, a prohledávání je tak řízeno přímo těmito řetězci.
+            accepted = self.__finite_language_search.is_accepted(input_string, self.__search_budget,
+                                                                 self.__statistics, derivation, self.__tracer)
+
+            if accepted and derivation is not None:
+                self.__witness = self._create_witness(derivation)
+        elif self.__interval_dynamic_programming_enabled and not self.__witness_required and self.__tracer is None:
+            # Dynamické programování rozhoduje pouze o některých vstupních řetězcích. O ostatních je rozhodnuto
+            # prohledáním všech pozic vymazávacích řetězců, aby výsledek nezávisel na tom, zda o něm rozhodlo dynamické
+            # programování či prohledávání. Dynamické programování nevytváří události prohledávání, a při nastaveném
+            # sledování je proto o všech vstupních řetězcích rozhodnuto prohledáváním.
+            accepted = self.__interval_dynamic_programming.is_accepted(input_string, self.__search_budget)
+
+            if accepted is None:
+                self.__statistics.interval_dynamic_programming_inconclusive = \
+                    self.__statistics.interval_dynamic_programming_inconclusive + 1
+                accepted = self._search(input_string, True)
+        elif self.__interval_dynamic_programming_enabled:
+            accepted = self._search(input_string, True)
+        else:
+            accepted = self._search(input_string, self.__test_all_overlapping_positions)
 
         return accepted
+
+    def _create_witness(self, derivation: List[Tuple[str, int]]) -> Witness:
+        """Vytvoření svědka přijetí z posloupnosti vymazání.
+
+        :param derivation: dvojice vymazávacího řetězce a původního indexu jeho prvního symbolu ve vstupním řetězci
+                           v pořadí vymazání.
+        :type derivation: List[Tuple[str, int]]
+        :return: svědek přijetí vstupního řetězce.
+        :rtype: Witness
+        """
+        return tuple((self.__erasing_string_ids[erasing_string], position) for erasing_string, position in derivation)
+
+    def run_with_witness(self, input_string: str) -> Tuple[bool, Optional[Witness]]:
+        """Spuštění hlavního algoritmu činnosti vymazávacího systému se záznamem svědka přijetí.
+
+        Rozhodování na základě Parikhova obrazu a dynamické programování nad intervaly svědka neposkytují, a jsou proto
+        nahrazena prohledáváním se stejným výsledkem. Svědka lze ověřit v lineárním čase metodou verify_witness().
+
+        :param input_string: vstupní řetězec, přičemž se jedná o počáteční tvar vstupní pásky.
+        :type input_string: str
+        :return: dvojice obsahující pravdivostní hodnotu, zda vstupní řetězec je přijat, a svědka přijetí, nebo None,
+                 pokud vstupní řetězec nebyl přijat.
+        :rtype: Tuple[bool, Optional[Witness]]
+        """
+        self.__witness_required = True
+
+        try:
+            accepted = self.run(input_string)
+        finally:
+            self.__witness_required = False
+
+        return accepted, self.__witness
+
+    def verify_witness(self, input_string: str, witness: Witness) -> bool:
+        """Ověření svědka přijetí vstupního řetězce tímto vymazávacím systémem.
+
+        Vymazání svědka jsou provedena v lineárním čase vzhledem k délce vstupního řetězce (viz funkce apply_witness())
+        a řetězec vzniklý konkatenací použitých vymazávacích řetězců je přečten již sestaveným automatem pro regulární
+        jazyk, případně porovnán s regulárním výrazem, pokud automat nebyl sestaven.
+
+        :param input_string: vstupní řetězec.
+        :type input_string: str
+        :param witness: ověřovaný svědek.
+        :type witness: Witness
+        :return: True, pokud svědek vymaže celý vstupní řetězec a řetězec vzniklý konkatenací použitých vymazávacích
+                 řetězců náleží do regulárního jazyka, jinak False.
+        :rtype: bool
+        """
+        erased_strings_concatenation = apply_witness(self.__ordered_erasing_strings, input_string, witness)
+
+        if erased_strings_concatenation is None:
+            return False
+
+        language_state = INITIAL_LANGUAGE_STATE
+
+        if self.__automaton is not None:
+            language_state = self.__automaton.read(INITIAL_LANGUAGE_STATE, erased_strings_concatenation)
+
+        return self._is_final_configuration_accepted([erased_strings_concatenation], language_state)
+
+    def run_with_budget(self, input_string: str, budget: SearchBudget) -> Tuple[SearchResult, SearchStatistics]:
+        """Spuštění hlavního algoritmu činnosti vymazávacího systému s rozpočtem prohledávání.
+
+        Pokud je rozpočet prohledávání vyčerpán, je prohledávání ukončeno a o přijetí vstupního řetězce není
+        rozhodnuto. Rozpočet je spotřebováván prohledáváním konfigurací (viz metody _is_accepted() a
+        _expand_search_node() a třída FiniteLanguageSearch) a každým intervalem zpracovaným dynamickým programováním
+        nad intervaly. Rozhodování na základě počtů symbolů, Parikhova obrazu a vyváženosti závorek konfigurace
+        neprohledává, a ověřuje proto pouze dobu běhu a paměť (viz metoda SearchBudget.check()).
+
+        :param input_string: vstupní řetězec, přičemž se jedná o počáteční tvar vstupní pásky.
+        :type input_string: str
+        :param budget: rozpočet prohledávání.
+        :type budget: SearchBudget
+        :return: dvojice obsahující výsledek běhu a statistiky prohledávání.
+        :rtype: Tuple[SearchResult, SearchStatistics]
+        """
+        budget.start()
+        self.__search_budget = budget
+
+        try:
+            result = SearchResult.ACCEPTED if self.run(input_string) else SearchResult.REJECTED
+        except SearchBudgetExhaustedException:
+            result = SearchResult.UNKNOWN
+        finally:
+            self.__search_budget = None
+            budget.stop()
+
+        return result, self.__statistics
+
+    def count_accepting_derivations(self, input_string: str, budget: Optional[SearchBudget] = None) -> int:
+        """Výpočet počtu různých posloupností vymazání, které přijímají vstupní řetězec.
+
+        Na rozdíl od hlavního algoritmu vymazávacího systému výpočet nekončí prvním přijetím a uvažuje všechny pozice
+        všech vymazávacích řetězců. Počet je vypočten nad sdílenými podproblémy (viz třída DerivationCounting),
+        a posloupnosti vymazání tak nejsou jednotlivě procházeny. Každý řešený podproblém spotřebuje jednu jednotku
+        rozpočtu prohledávání.
+
+        :param input_string: vstupní řetězec, přičemž se jedná o počáteční tvar vstupní pásky.
+        :type input_string: str
+        :param budget: rozpočet prohledávání, nebo None, pokud výpočet není omezen.
+        :type budget: Optional[SearchBudget]
+        :return: počet přijímajících posloupností vymazání.
+        :rtype: int
+        :raises SearchBudgetExhaustedException: rozpočet prohledávání byl vyčerpán.
+        """
+        if budget is not None:
+            budget.start()
+
+        try:
+            if not self.__parikh_vector_check.is_feasible(input_string, budget):
+                return 0
+
+            return self.__derivation_counting.count_derivations(input_string, budget)
+        finally:
+            if budget is not None:
+                budget.stop()
+
+    def enumerate_erased_strings_concatenations(self, input_string: str, max_results: Optional[int] = None,
+                                                budget: Optional[SearchBudget] = None) -> List[str]:
+        """Výčet různých řetězců vzniklých konkatenací použitých vymazávacích řetězců, které přijímají vstupní řetězec.
+
+        Každý řešený podproblém spotřebuje jednu jednotku rozpočtu prohledávání (viz metoda
+        count_accepting_derivations()).
+
+        :param input_string: vstupní řetězec, přičemž se jedná o počáteční tvar vstupní pásky.
+        :type input_string: str
+        :param max_results: maximální počet vrácených řetězců, nebo None, pokud počet není omezen.
+        :type max_results: Optional[int]
+        :param budget: rozpočet prohledávání, nebo None, pokud výpočet není omezen.
+        :type budget: Optional[SearchBudget]
+        :return: lexikograficky seřazený seznam řetězců vzniklých konkatenací, přičemž při omezení počtu výsledků jsou
+                 vráceny lexikograficky nejmenší řetězce.
+        :rtype: List[str]
+        :raises SearchBudgetExhaustedException: rozpočet prohledávání byl vyčerpán.
+        """
+        if budget is not None:
+            budget.start()
+
+        try:
+            if not self.__parikh_vector_check.is_feasible(input_string, budget):
+                return list()
+
+            return self.__derivation_counting.enumerate_concatenations(input_string, max_results, budget)
+        finally:
+            if budget is not None:
+                budget.stop()
@@ -0,0 +1,237 @@
+"""Souběžné spuštění více konfigurací vymazávacího systému.
+
+Projekt: Bakalářská práce Regulované jazykové operace a jejich užití, Brno 2023.
+
+Tento soubor obsahuje třídu PortfolioSolver, která pro vstupní řetězec spouští více konfigurací vymazávacího systému
+(typ kvantifikátoru, strategie pořadí prohledávání včetně semínka, strategie prohledávání) v samostatných procesech.
+Doba běhu vymazávacího systému závisí především na nedeterministických výběrech, a proto je výsledek převzat od první
+konfigurace, která rozhodla s jistotou, a ostatní procesy jsou ukončeny. Výjimka vyvolaná v procesu konfigurace je
+předána hlavnímu procesu a vyvolána v něm.
+
+:Author: David Chocholatý
+:Contact: xchoch09@stud.fit.vutbr.cz
+:Filename: portfolio_solver.py
+"""
+
+import multiprocessing
+
+from multiprocessing.connection import Connection, wait
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from es_tools.custom_exceptions.internal_error_exception import InternalErrorException
+from es_tools.formal_models.erasing_system.custom_utils.ordering_policy import OrderingPolicy, \
+    SeededRandomOrderingPolicy
+from es_tools.formal_models.erasing_system.custom_utils.search_budget import SearchResult
+from es_tools.formal_models.erasing_system.custom_utils.search_strategy import BestFirstSearchStrategy, \
+    SearchStrategy
+from es_tools.formal_models.erasing_system.erasing_system import ErasingSystem
+
+
+class PortfolioConfiguration(NamedTuple):
+    """Konfigurace vymazávacího systému spouštěná v rámci portfolia.
+
+    Strategie pořadí prohledávání i strategie prohledávání jsou předávány do samostatných procesů, a musí tak být
+    serializovatelné modulem pickle (například heuristika prohledávání nesmí být lambda funkcí).
+    """
+    test_all_overlapping_positions: bool = True
+    quantifier_type_greedy: bool = True
+    ordering_policy: Optional[OrderingPolicy] = None
+    search_strategy: Optional[SearchStrategy] = None
+    partial_order_reduction: bool = False
+
+
+def create_default_portfolio(test_all_overlapping_positions: bool,
+                             configurations_number: int) -> List[PortfolioConfiguration]:
+    """Vytvoření výchozího portfolia konfigurací.
+
+    Konfigurace se střídají v typu kvantifikátoru a liší se semínkem náhodného výběru. Každá čtvrtá konfigurace navíc
+    místo hlavního algoritmu využívá prohledávání podle heuristiky.
+
+    :param test_all_overlapping_positions: pravdivostní hodnota, zda mají být ověřovány všechny pozice vymazávacích
+                                           řetězců.
+    :type test_all_overlapping_positions: bool
+    :param configurations_number: počet konfigurací.
+    :type configurations_number: int
+    :return: seznam konfigurací.
+    :rtype: List[PortfolioConfiguration]
+    """
+    configurations = list()
+
+    for index in range(configurations_number):
+        search_strategy = BestFirstSearchStrategy() if index % 4 == 3 else None
+        configurations.append(PortfolioConfiguration(test_all_overlapping_positions, index % 2 == 0,
+                                                     SeededRandomOrderingPolicy(index), search_strategy))
+
+    return configurations
+
+
+def _run_configuration(connection: Connection, erasing_strings: Set[str], regular_language: str,
+                       configuration: PortfolioConfiguration, input_string: str) -> None:
+    """Spuštění jedné konfigurace vymazávacího systému v samostatném procesu.
+
+    Hlavnímu procesu je odeslán výsledek běhu, přičemž odmítnutí, které není jisté, je odesláno jako
+    SearchResult.UNKNOWN. Pokud běh vyvolá výjimku, je hlavnímu procesu odeslána tato výjimka.
+
+    :param connection: spojení, kterým je výsledek odeslán hlavnímu procesu.
+    :type connection: Connection
+    :param erasing_strings: množina vymazávacích řetězců.
+    :type erasing_strings: Set[str]
+    :param regular_language: řetězec obsahující regulární výraz reprezentující regulární jazyk.
+    :type regular_language: str
+    :param configuration: konfigurace vymazávacího systému.
+    :type configuration: PortfolioConfiguration
+    :param input_string: vstupní řetězec.
+    :type input_string: str
+    """
+    try:
+        erasing_system = ErasingSystem(erasing_strings, regular_language,
+                                       configuration.test_all_overlapping_positions,
+                                       configuration.quantifier_type_greedy,
+                                       ordering_policy=configuration.ordering_policy,
+                                       partial_order_reduction=configuration.partial_order_reduction,
+                                       search_strategy=configuration.search_strategy)
+
+        # Přijetí je vždy doloženo nalezeným vymazáním vstupního řetězce. Odmítnutí je jisté pouze tehdy, pokud byly
+        # ověřovány všechny pozice vymazávacích řetězců, případně pokud byl vstupní řetězec odmítnut bez prohledávání.
+        if erasing_system.run(input_string):
+            result = SearchResult.ACCEPTED
+        elif configuration.test_all_overlapping_positions or erasing_system.parikh_vector_rejected:
+            result = SearchResult.REJECTED
+        else:
+            result = SearchResult.UNKNOWN
+    except Exception as error:
+        connection.send(error)
+    else:
+        connection.send(result)
+    finally:
+        connection.close()
+
+
+class PortfolioSolver:
+    """Souběžné spuštění portfolia konfigurací vymazávacího systému v samostatných procesech.
+
+    Výsledkem je první výsledek rozhodnutý s jistotou. Pokud žádná konfigurace s jistotou nerozhodne (všechny
+    konfigurace bez ověřování všech pozic vymazávacích řetězců vstupní řetězec odmítly), není o přijetí vstupního
+    řetězce rozhodnuto.
+    """
+    def __init__(self, erasing_strings: Set[str],
+                 regular_language: str,
+                 configurations: Optional[List[PortfolioConfiguration]] = None,
+                 processes: Optional[int] = None) -> None:
+        """**Konstruktor třídy PortfolioSolver**
+
+        :param erasing_strings: množina vymazávacích řetězců.
+        :type erasing_strings: Set[str]
+        :param regular_language: řetězec obsahující regulární výraz reprezentující regulární jazyk.
+        :type regular_language: str
+        :param configurations: seznam konfigurací. Pokud není zadán, je vytvořeno výchozí portfolio s ověřováním všech
+                               pozic vymazávacích řetězců o počtu konfigurací odpovídajícímu počtu procesů.
+        :type configurations: Optional[List[PortfolioConfiguration]]
+        :param processes: počet souběžně spuštěných procesů. Pokud není zadán, odpovídá počtu procesorů.
+        :type processes: Optional[int]
+        :raises IllegalSymbolOccurrenceException: výskyt nepovoleného symbolu ve vymazávacím řetězci.
+        :raises InvalidRegularLanguagePatternException: nevalidní nebo nepovolený tvar regulárního výrazu
+                                                        pro regulární jazyk.
+        :raises ValueError: prázdný seznam konfigurací.
+        """
+        # Vymazávací systém je sestaven i v hlavním procesu, aby byly chyby vymazávacích řetězců a regulárního výrazu
+        # odhaleny již při vytvoření portfolia.
+        ErasingSystem(erasing_strings, regular_language)
+
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+
+        if configurations is None:
+            configurations = create_default_portfolio(True, processes)
+
+        if len(configurations) == 0:
+            raise ValueError("Portfolio must contain at least one configuration.")
+
+        self.__erasing_strings = set(erasing_strings)
+        self.__regular_language = regular_language
+        self.__configurations = list(configurations)
+        self.__processes = min(processes, len(self.__configurations))
+        self.__winning_configuration = None
+
+    @property
+    def configurations(self) -> List[PortfolioConfiguration]:
+        """Konfigurace vymazávacího systému v portfoliu.
+
+        :getter: získání seznamu konfigurací.
+        :type: List[PortfolioConfiguration]
+        """
+        return self.__configurations
+
+    @property
+    def winning_configuration(self) -> Optional[int]:
+        """Index konfigurace, která během posledního běhu jako první rozhodla s jistotou.
+
+        :getter: získání indexu konfigurace, nebo None, pokud žádná konfigurace s jistotou nerozhodla.
+        :type: Optional[int]
+        """
+        return self.__winning_configuration
+
+    def run(self, input_string: str) -> SearchResult:
+        """Rozhodnutí o přijetí vstupního řetězce portfoliem konfigurací.
+
+        Výjimka vyvolaná během běhu některé konfigurace je vyvolána znovu, a ostatní procesy jsou ukončeny.
+
+        :param input_string: vstupní řetězec, přičemž se jedná o počáteční tvar vstupní pásky.
+        :type input_string: str
+        :return: SearchResult.ACCEPTED nebo SearchResult.REJECTED podle první konfigurace, která rozhodla s jistotou,
+                 a SearchResult.UNKNOWN, pokud žádná konfigurace s jistotou nerozhodla.
+        :rtype: SearchResult
+        :raises InternalErrorException: proces konfigurace byl ukončen bez odeslání výsledku a žádná jiná konfigurace
+                                        s jistotou nerozhodla.
+        """
+        self.__winning_configuration = None
+        pending_configurations = list(enumerate(self.__configurations))
+        running_processes: Dict[Connection, Tuple[int, multiprocessing.Process]] = dict()
+        terminated_configuration = None
+
+        try:
+            while len(pending_configurations) != 0 or len(running_processes) != 0:
+                while len(pending_configurations) != 0 and len(running_processes) < self.__processes:
+                    index, configuration = pending_configurations.pop(0)
+                    receiver, sender = multiprocessing.Pipe(duplex=False)
+                    process = multiprocessing.Process(target=_run_configuration,
+                                                      args=(sender, self.__erasing_strings, self.__regular_language,
+                                                            configuration, input_string),
+                                                      daemon=True)
+                    process.start()
+                    sender.close()
+                    running_processes[receiver] = (index, process)
+
+                for receiver in wait(list(running_processes)):
+                    index, process = running_processes.pop(receiver)
+
+                    try:
+                        result = receiver.recv()
+                    except EOFError:
+                        # Proces byl ukončen bez odeslání výsledku (například operačním systémem z důvodu nedostatku
+                        # paměti). Výsledek mohou přesto poskytnout ostatní konfigurace.
+                        result = None
+                        terminated_configuration = index
+                    finally:
+                        receiver.close()
+                        process.join()
+
+                    if isinstance(result, Exception):
+                        raise result
+
+                    if result is not None and result != SearchResult.UNKNOWN:
+                        self.__winning_configuration = index
+
+                        return result
+        finally:
+            # Procesy zbývajících konfigurací jsou po rozhodnutí ukončeny, aniž by byly dokončeny.
+            for receiver, (index, process) in running_processes.items():
+                process.terminate()
+                process.join()
+                receiver.close()
+
+        if terminated_configuration is not None:
+            raise InternalErrorException("Portfolio configuration " + str(terminated_configuration) +
+                                         " has terminated without a result.")
+
+        return SearchResult.UNKNOWN
@@ -9,10 +9,25 @@ Tento soubor obsahuje testy pro ověření správnosti implementace vymazávací
 :Filename: erasing_system_test.py
 """
 
+import contextlib
+import io
+import os
+import tempfile
 import unittest
 
 from es_tools.custom_exceptions.invalid_regular_language_pattern_exception import InvalidRegularLanguagePatternException
+from es_tools.custom_exceptions.search_budget_exhausted_exception import SearchBudgetExhaustedException
+from es_tools.formal_models.erasing_system.custom_utils.derivation_witness import verify_witness
+from es_tools.formal_models.erasing_system.custom_utils.ordering_policy import LeftmostFirstOrderingPolicy, \
+    MostConstrainedFirstOrderingPolicy, RightmostFirstOrderingPolicy, SeededRandomOrderingPolicy
+from es_tools.formal_models.erasing_system.custom_utils.search_budget import SearchBudget, SearchResult
+from es_tools.formal_models.erasing_system.custom_utils.search_strategy import BestFirstSearchStrategy, \
+    BreadthFirstSearchStrategy, DepthFirstSearchStrategy, IterativeDeepeningSearchStrategy, match_level
+from es_tools.formal_models.erasing_system.custom_utils.search_tracer import BufferedFileSearchTracer, \
+    SamplingSearchTracer
+from es_tools.formal_models.erasing_system.custom_utils.transposition_table import TranspositionTable
 from es_tools.formal_models.erasing_system.erasing_system import ErasingSystem
+from es_tools.formal_models.erasing_system.portfolio_solver import PortfolioConfiguration, PortfolioSolver
 
 
 class ErasingSystemTest(unittest.TestCase):
@@ -265,6 +280,575 @@ class ErasingSystemTest(unittest.TestCase):
         self.assertFalse(erasing_system.run("cd"))
         self.assertFalse(erasing_system.run("cab"))
 
+    def test_transposition_table(self):
+        """Testování transpoziční tabulky neúspěšných konfigurací, přičemž její použití nesmí změnit výsledek."""
+        erasing_strings = {"a", "b", "c", "ab"}
+        regular_language = "(abc)*"
+
+        erasing_system = ErasingSystem(erasing_strings, regular_language, True)
+        erasing_system_without_table = ErasingSystem(erasing_strings, regular_language, True,
+                                                     transposition_table_size=0)
+
+        for input_string in ["cabbacacbabc", "cabbacacbac", "aabbcc", "abcabcab"]:
+            self.assertEqual(erasing_system.run(input_string), erasing_system_without_table.run(input_string))
+
+        self.assertFalse(erasing_system.run("aaabbbccca"))
+        self.assertGreater(erasing_system.transposition_table_hits, 0)
+        self.assertGreater(erasing_system.transposition_table_misses, 0)
+        self.assertEqual(erasing_system_without_table.transposition_table_hits, 0)
+
+        # Opětovné uložení konfigurace nesmí odstranit jinou konfiguraci a konfiguraci označí jako naposledy použitou.
+        transposition_table = TranspositionTable(2)
+        transposition_table.store_failed("first")
+        transposition_table.store_failed("second")
+        transposition_table.store_failed("first")
+
+        self.assertEqual(len(transposition_table), 2)
+        self.assertTrue(transposition_table.contains_failed("second"))
+
+        transposition_table.store_failed("first")
+        transposition_table.store_failed("third")
+
+        self.assertTrue(transposition_table.contains_failed("first"))
+        self.assertFalse(transposition_table.contains_failed("second"))
+        self.assertTrue(transposition_table.contains_failed("third"))
+
+        # Konfigurace se shodným hashem a různým obsahem nesmí být zaměněny.
+        transposition_table.store_failed("hash", content="abc")
+
+        self.assertTrue(transposition_table.contains_failed("hash", content=lambda: "abc"))
+        self.assertFalse(transposition_table.contains_failed("hash", content=lambda: "acb"))
+        self.assertIsNone(transposition_table.failed_sleep_set("hash", lambda: "acb"))
+
+    def test_single_symbol_erasing_strings(self):
+        """Testování vymazávacích řetězců délky jedna, kdy je o přijetí vstupního řetězce rozhodnuto pouze na základě
+        počtů jeho symbolů."""
+        erasing_strings = {"P", "U"}
+        regular_language = "(UP)*P*"
+        erasing_system = ErasingSystem(erasing_strings, regular_language)
+
+        self.assertTrue(erasing_system.run(""))
+        self.assertTrue(erasing_system.run("PPUP"))
+        self.assertTrue(erasing_system.run("PU" * 1000000 + "P"))
+
+        self.assertFalse(erasing_system.run("UUP"))
+        self.assertFalse(erasing_system.run("PU" * 1000000 + "U"))
+
+        # Při podrobném výpisu je vstupní řetězec zpracován prohledáváním, jehož vymazání jsou vypsána.
+        verbose_erasing_system = ErasingSystem(erasing_strings, regular_language, False, True, True)
+        output = io.StringIO()
+
+        with contextlib.redirect_stdout(output):
+            self.assertTrue(verbose_erasing_system.run("PPUP"))
+
+        self.assertEqual(output.getvalue().count("Chosen erasing string"), 4)
+
+        erasing_strings = {"a", "b", "c"}
+        regular_language = "(a|bc)+c"
+        erasing_system = ErasingSystem(erasing_strings, regular_language)
+
+        self.assertTrue(erasing_system.run("ac"))
+        self.assertTrue(erasing_system.run("cbc"))
+        self.assertTrue(erasing_system.run("ccbaa"))
+
+        self.assertFalse(erasing_system.run("c"))
+        self.assertFalse(erasing_system.run("cca"))
+        self.assertFalse(erasing_system.run("cbcb"))
+
+    def test_finite_regular_language(self):
+        """Testování konečného regulárního jazyka, kdy je prohledávání řízeno řetězci regulárního jazyka."""
+        erasing_strings = {"ab", "ba", "abc", "c"}
+        regular_language = "(ab|ba)c(abc|ab)"
+        erasing_system = ErasingSystem(erasing_strings, regular_language)
+
+        self.assertTrue(erasing_system.run("acbab"))
+        self.assertTrue(erasing_system.run("cabab"))
+        self.assertTrue(erasing_system.run("baabcc"))
+
+        self.assertFalse(erasing_system.run(""))
+        self.assertFalse(erasing_system.run("aabcbcab"))
+        self.assertFalse(erasing_system.run("abcbaabc"))
+
+        # Prohledávání řízené řetězci regulárního jazyka předává události nastavenému sledování.
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "trace.tsv")
+
+            with BufferedFileSearchTracer(file_path) as tracer:
+                erasing_system.tracer = tracer
+
+                self.assertTrue(erasing_system.run("acbab"))
+
+            with open(file_path, encoding="utf-8") as trace_file:
+                events = [line.rstrip("\n").split("\t") for line in trace_file]
+
+        erasing_system.tracer = None
+
+        self.assertEqual(events[1], ["node_entered", "0", "acbab"])
+        self.assertEqual(sum(event[0] == "node_entered" for event in events), erasing_system.statistics.expanded_nodes)
+        self.assertEqual(events[-2], ["accept", "3", "bacab"])
+
+        erasing_strings = {"ab", "a", "b"}
+        regular_language = "abaabb"
+        erasing_system = ErasingSystem(erasing_strings, regular_language)
+
+        self.assertTrue(erasing_system.run("aabbab"))
+        self.assertTrue(erasing_system.run("bbaaba"))
+
+        self.assertFalse(erasing_system.run("aabba"))
+
+    def test_regular_language_without_automaton(self):
+        """Testování regulárního jazyka s nepodporovanou konstrukcí pro automat, kdy je využito porovnání s regulárními
+        výrazy."""
+        erasing_strings = {"ab", "c"}
+        regular_language = "abc|cab"
+        erasing_system = ErasingSystem(erasing_strings, regular_language, True)
+
+        self.assertTrue(erasing_system.run("abc"))
+        self.assertTrue(erasing_system.run("acb"))
+
+        self.assertFalse(erasing_system.run("ab"))
+        self.assertFalse(erasing_system.run("bac"))
+
+    def test_long_input_string(self):
+        """Testování vstupního řetězce, jehož délka přesahuje maximální hloubku rekurze jazyka Python."""
+        erasing_strings = {"Aa", "Bb", "Cc"}
+        regular_language = "(Aa|Bb)*Cc"
+        erasing_system = ErasingSystem(erasing_strings, regular_language)
+
+        self.assertTrue(erasing_system.run("AB" * 400 + "ba" * 400 + "Cc"))
+        self.assertTrue(erasing_system.run("AaBb" * 1000 + "Cc"))
+
+        self.assertFalse(erasing_system.run("AB" * 400 + "ab" * 400 + "Cc"))
+
+    def test_balanced_brackets(self):
+        """Testování vymazávacího systému tvaru Dyckova jazyka, o jehož přijetí je rozhodnuto zásobníkovým
+        algoritmem."""
+        erasing_strings = {"Aa", "Bb", "Cc"}
+        regular_language = "(Aa|Bb|Cc)*"
+        erasing_system = ErasingSystem(erasing_strings, regular_language)
+
+        # Ekvivalentní regulární jazyk, který nemá tvar iterace sjednocení vymazávacích řetězců, je zpracován
+        # prohledáváním.
+        search_erasing_system = ErasingSystem(erasing_strings, regular_language + "(Aa)*", True)
+
+        for input_string in ["", "Aa", "aA", "ABba", "ABab", "ACcBba", "AaBbCc", "ACBcba", "AABbCcaBb", "AaB"]:
+            self.assertEqual(erasing_system.run(input_string), search_erasing_system.run(input_string))
+
+        self.assertTrue(erasing_system.run("ABC" * 100000 + "cba" * 100000))
+        self.assertFalse(erasing_system.run("ABC" * 100000 + "cab" * 100000))
+
+        # Při podrobném výpisu je vstupní řetězec zpracován prohledáváním, jehož vymazání jsou vypsána.
+        verbose_erasing_system = ErasingSystem(erasing_strings, regular_language, False, True, True)
+        output = io.StringIO()
+
+        with contextlib.redirect_stdout(output):
+            self.assertTrue(verbose_erasing_system.run("ABba"))
+            self.assertFalse(verbose_erasing_system.run("ABab"))
+
+        self.assertEqual(output.getvalue().count("Chosen erasing string"), 2)
+
+    def test_overlapping_erasing_strings(self):
+        """Testování vymazávacích řetězců, které jsou vzájemně svými podřetězci a jejichž výskyty se překrývají."""
+        erasing_strings = {"aba", "ba", "a", "b"}
+        regular_language = "(aba)+(ba)*"
+        erasing_system = ErasingSystem(erasing_strings, regular_language, True)
+
+        self.assertTrue(erasing_system.run("ababa"))
+        self.assertTrue(erasing_system.run("abababa"))
+        self.assertTrue(erasing_system.run("abbaaab"))
+        self.assertTrue(erasing_system.run("baaab"))
+
+        self.assertFalse(erasing_system.run("abab"))
+        self.assertFalse(erasing_system.run("babab"))
+
+    def test_parikh_vector_rejection(self):
+        """Testování odmítnutí vstupního řetězce na základě počtů symbolů bez prohledávání."""
+        erasing_strings = {"Aa", "Bb", "Cc"}
+        regular_language = "(Aa|Bb|Cc)*"
+        erasing_system = ErasingSystem(erasing_strings, regular_language)
+
+        self.assertFalse(erasing_system.run("AB" * 500 + "ab" * 499 + "c"))
+        self.assertTrue(erasing_system.parikh_vector_rejected)
+
+        self.assertFalse(erasing_system.run("ABba" + "d"))
+        self.assertTrue(erasing_system.parikh_vector_rejected)
+
+        self.assertFalse(erasing_system.run("aA"))
+        self.assertFalse(erasing_system.parikh_vector_rejected)
+
+        self.assertTrue(erasing_system.run("ABba"))
+        self.assertFalse(erasing_system.parikh_vector_rejected)
+
+        erasing_strings = {"ab", "cd"}
+        regular_language = "(ab)(cd)*"
+        erasing_system = ErasingSystem(erasing_strings, regular_language)
+
+        self.assertFalse(erasing_system.run("cdcd"))
+        self.assertTrue(erasing_system.parikh_vector_rejected)
+
+    def test_viability_pruning(self):
+        """Testování ořezání podstromů prohledávání, ve kterých počty symbolů zbývající vstupní pásky neodpovídají
+        žádnému řetězci, který převádí aktuální stav automatu do koncového stavu."""
+        erasing_strings = {"ab", "ba", "c"}
+        regular_language = "c*(ab|ba)*c"
+        erasing_system = ErasingSystem(erasing_strings, regular_language, True)
+
+        self.assertTrue(erasing_system.run("cabbacab"))
+        self.assertGreater(erasing_system.viability_prunes, 0)
+
+        self.assertFalse(erasing_system.run("aabccb"))
+        self.assertFalse(erasing_system.parikh_vector_rejected)
+        self.assertGreater(erasing_system.viability_prunes, 0)
+
+        self.assertFalse(erasing_system.run("ab"))
+        self.assertTrue(erasing_system.parikh_vector_rejected)
+        self.assertEqual(erasing_system.viability_prunes, 0)
+
+    def test_ordering_policies(self):
+        """Testování strategií pořadí prohledávání, přičemž při testování všech pozic nesmí změnit výsledek a běhy
+        s nastaveným semínkem musí být reprodukovatelné."""
+        erasing_strings = {"a", "b", "c"}
+        regular_language = "(abc)*"
+
+        for ordering_policy in [SeededRandomOrderingPolicy(42), LeftmostFirstOrderingPolicy(),
+                                RightmostFirstOrderingPolicy(), MostConstrainedFirstOrderingPolicy()]:
+            erasing_system = ErasingSystem(erasing_strings, regular_language, True, ordering_policy=ordering_policy)
+
+            self.assertTrue(erasing_system.run("cabbacacbabc"))
+            self.assertTrue(erasing_system.run("aabbcc"))
+
+            self.assertFalse(erasing_system.run("cabbacacbac"))
+            self.assertFalse(erasing_system.run("abcabcab"))
+
+        erasing_system = ErasingSystem(erasing_strings, regular_language, True,
+                                       ordering_policy=SeededRandomOrderingPolicy(7))
+        statistics = list()
+
+        for _ in range(3):
+            erasing_system.run("aaabbbccca")
+            statistics.append((erasing_system.transposition_table_hits, erasing_system.transposition_table_misses))
+
+        self.assertEqual(len(set(statistics)), 1)
+
+    def test_interval_dynamic_programming(self):
+        """Testování rozhodování dynamickým programováním nad intervaly, přičemž výsledek musí odpovídat režimu
+        ověřování všech pozic vymazávacích řetězců."""
+        for erasing_strings, regular_language in [({"ab", "cd"}, "(ab)*(cd)"), ({"a", "b", "c"}, "(abc)*"),
+                                                  ({"ab", "ba", "a"}, "(ab|ba)*a*"), ({"ab", "cd"}, "(ab)(cd)*")]:
+            erasing_system = ErasingSystem(erasing_strings, regular_language, True)
+            dynamic_programming_system = ErasingSystem(erasing_strings, regular_language,
+                                                       interval_dynamic_programming=True)
+
+            for input_string in ["", "abcd", "acdb", "cdab", "aabbcc", "cabbacacbabc", "abcabcab", "abaab", "baaba",
+                                 "acbd", "abcdcd", "ab"]:
+                self.assertEqual(dynamic_programming_system.run(input_string), erasing_system.run(input_string))
+
+        erasing_strings = {"ab", "cd"}
+        regular_language = "(ab|cd)*"
+        erasing_system = ErasingSystem(erasing_strings, regular_language, interval_dynamic_programming=True)
+
+        self.assertTrue(erasing_system.run("acabdb" * 100))
+        self.assertEqual(erasing_system.statistics.interval_dynamic_programming_inconclusive, 0)
+        self.assertFalse(erasing_system.run("acabdb" * 100 + "ba"))
+
+        # Nerozhodnutý výpočet dynamického programování je doplněn prohledáváním a zaznamenán ve statistikách.
+        erasing_system = ErasingSystem({"ab", "cd"}, "(ab)*(cd)", interval_dynamic_programming=True)
+
+        self.assertFalse(erasing_system.run("acdb"))
+        self.assertEqual(erasing_system.statistics.interval_dynamic_programming_inconclusive, 1)
+        self.assertGreater(erasing_system.statistics.expanded_nodes, 0)
+
+    def test_partial_order_reduction(self):
+        """Testování redukce pořadí nezávislých vymazání, přičemž výsledek nesmí být redukcí ovlivněn."""
+        for erasing_strings, regular_language in [({"a", "b", "cd"}, "(a|b)*cd(a|b)*"), ({"a", "b", "c"}, "(abc)*"),
+                                                  ({"ab", "ba", "a"}, "(ab|ba)*a*"), ({"ab", "c"}, "ab|c")]:
+            erasing_system = ErasingSystem(erasing_strings, regular_language, True)
+            reduced_erasing_system = ErasingSystem(erasing_strings, regular_language, True,
+                                                   partial_order_reduction=True)
+
+            for input_string in ["", "ab", "c", "dababc", "acdbab", "cabbacacbabc", "abcabcab", "abaab", "baaba",
+                                 "abacbab"]:
+                self.assertEqual(reduced_erasing_system.run(input_string), erasing_system.run(input_string))
+
+        erasing_system = ErasingSystem({"a", "b", "cd"}, "(a|b)*cd(a|b)*", True, partial_order_reduction=True)
+        self.assertFalse(erasing_system.run("d" + "ab" * 5 + "c"))
+        reduced_hits = erasing_system.transposition_table_hits
+
+        erasing_system.partial_order_reduction = False
+        self.assertFalse(erasing_system.run("d" + "ab" * 5 + "c"))
+        self.assertLess(reduced_hits, erasing_system.transposition_table_hits)
+
+    def test_search_strategies(self):
+        """Testování strategií prohledávání, přičemž při testování všech pozic nesmí změnit výsledek."""
+        search_strategies = [DepthFirstSearchStrategy(), BreadthFirstSearchStrategy(), BreadthFirstSearchStrategy(2),
+                             BreadthFirstSearchStrategy(2, 3), BreadthFirstSearchStrategy(max_visited_size=0),
+                             BestFirstSearchStrategy(), BestFirstSearchStrategy(match_level),
+                             IterativeDeepeningSearchStrategy()]
+
+        for erasing_strings, regular_language in [({"ab", "cd"}, "(ab)*(cd)"), ({"ab", "ba", "a"}, "(ab|ba)*a*"),
+                                                  ({"a", "b", "cd"}, "(a|b)*cd(a|b)*")]:
+            erasing_system = ErasingSystem(erasing_strings, regular_language, True)
+
+            for input_string in ["", "abcd", "acdb", "cdab", "abaab", "baaba", "acbd", "abcdcd", "dababc", "acdbab"]:
+                accepted = erasing_system.run(input_string)
+
+                for search_strategy in search_strategies:
+                    erasing_system.search_strategy = search_strategy
+                    self.assertEqual(erasing_system.run(input_string), accepted)
+
+                erasing_system.search_strategy = None
+
+    def test_portfolio_solver(self):
+        """Testování souběžného spuštění portfolia konfigurací, přičemž výsledek musí odpovídat režimu ověřování všech
+        pozic vymazávacích řetězců."""
+        erasing_strings = {"ab", "ba", "a"}
+        regular_language = "(ab|ba)*a*"
+        erasing_system = ErasingSystem(erasing_strings, regular_language, True)
+        portfolio_solver = PortfolioSolver(erasing_strings, regular_language, processes=2)
+
+        for input_string in ["", "abaab", "baaba", "abb", "bbaa"]:
+            expected_result = SearchResult.ACCEPTED if erasing_system.run(input_string) else SearchResult.REJECTED
+            self.assertEqual(portfolio_solver.run(input_string), expected_result)
+            self.assertIsNotNone(portfolio_solver.winning_configuration)
+
+        # Odmítnutí bez ověřování všech pozic vymazávacích řetězců není jisté.
+        configuration = PortfolioConfiguration(False, ordering_policy=LeftmostFirstOrderingPolicy())
+        portfolio_solver = PortfolioSolver(erasing_strings, regular_language, [configuration], processes=1)
+
+        self.assertEqual(portfolio_solver.run("bab"), SearchResult.UNKNOWN)
+        self.assertIsNone(portfolio_solver.winning_configuration)
+
+        # Výjimka vyvolaná v procesu konfigurace (zde neplatnou strategií pořadí prohledávání) je vyvolána i v hlavním
+        # procesu.
+        configuration = PortfolioConfiguration(ordering_policy="invalid")
+        portfolio_solver = PortfolioSolver(erasing_strings, regular_language, [configuration], processes=1)
+
+        with self.assertRaises(AttributeError):
+            portfolio_solver.run("abaab")
+
+        with self.assertRaises(ValueError):
+            PortfolioSolver(erasing_strings, regular_language, [])
+
+    def test_search_budget(self):
+        """Testování rozpočtu prohledávání, přičemž po jeho vyčerpání není o přijetí vstupního řetězce rozhodnuto."""
+        erasing_strings = {"ab", "ba", "a"}
+        regular_language = "(ab|ba)*a*"
+        erasing_system = ErasingSystem(erasing_strings, regular_language, True)
+
+        result, statistics = erasing_system.run_with_budget("abaab", SearchBudget(max_nodes=100))
+        self.assertEqual(result, SearchResult.ACCEPTED)
+        self.assertGreater(statistics.expanded_nodes, 0)
+
+        result, statistics = erasing_system.run_with_budget("abb", SearchBudget(max_nodes=100))
+        self.assertEqual(result, SearchResult.REJECTED)
+
+        result, statistics = erasing_system.run_with_budget("ab" * 40 + "bb", SearchBudget(max_nodes=50))
+        self.assertEqual(result, SearchResult.UNKNOWN)
+        self.assertLessEqual(statistics.expanded_nodes, 51)
+
+        result, statistics = erasing_system.run_with_budget("ab" * 40 + "bb", SearchBudget(max_time=0.0))
+        self.assertEqual(result, SearchResult.UNKNOWN)
+
+        result, statistics = erasing_system.run_with_budget("ab" * 40 + "bb", SearchBudget(max_memory=0))
+        self.assertEqual(result, SearchResult.UNKNOWN)
+
+        # Po vyčerpání rozpočtu musí běh bez rozpočtu pracovat beze změny.
+        self.assertTrue(erasing_system.run("abaab"))
+
+        # Rozpočet omezuje také rozhodování bez prohledávání konfigurací.
+        interval_erasing_system = ErasingSystem({"ab", "c"}, "(ab)*c*", True, interval_dynamic_programming=True)
+        result, statistics = interval_erasing_system.run_with_budget("a" * 200 + "b" * 200, SearchBudget(max_nodes=10))
+        self.assertEqual(result, SearchResult.UNKNOWN)
+
+        brackets_erasing_system = ErasingSystem({"ab"}, "(ab)*", True)
+        result, statistics = brackets_erasing_system.run_with_budget("ab" * 10, SearchBudget(max_time=0.0))
+        self.assertEqual(result, SearchResult.UNKNOWN)
+
+        single_symbol_erasing_system = ErasingSystem({"a", "b"}, "(ab)*", True)
+        result, statistics = single_symbol_erasing_system.run_with_budget("ba", SearchBudget(max_time=0.0))
+        self.assertEqual(result, SearchResult.UNKNOWN)
+
+    def test_search_statistics(self):
+        """Testování statistik prohledávání, které musí být po každém běhu vymazávacího systému aktuální."""
+        erasing_strings = {"ab", "ba", "a"}
+        regular_language = "(ab|ba)*a*"
+        erasing_system = ErasingSystem(erasing_strings, regular_language, True)
+
+        self.assertFalse(erasing_system.run("ab" * 10 + "bb"))
+        statistics = erasing_system.statistics
+
+        self.assertGreater(statistics.expanded_nodes, 1)
+        self.assertGreater(statistics.backtracks, 0)
+        self.assertGreater(statistics.maximum_depth, 0)
+        self.assertGreaterEqual(statistics.generated_candidates, statistics.filtered_candidates)
+        self.assertEqual(statistics.viability_prunes, erasing_system.viability_prunes)
+        self.assertEqual(statistics.transposition_table_hits, erasing_system.transposition_table_hits)
+        self.assertEqual(statistics.matching_time + statistics.tape_time, 0.0)
+        self.assertEqual(statistics.as_dict()["expanded_nodes"], statistics.expanded_nodes)
+
+        # Rozdělení doby prohledávání je měřeno pouze na vyžádání.
+        erasing_system.detailed_timing = True
+
+        self.assertFalse(erasing_system.run("ab" * 10 + "bb"))
+        statistics = erasing_system.statistics
+
+        self.assertGreater(statistics.matching_time, 0.0)
+        self.assertGreater(statistics.tape_time, 0.0)
+        self.assertGreaterEqual(statistics.elapsed_time, statistics.matching_time + statistics.tape_time)
+
+        erasing_system.detailed_timing = False
+
+        self.assertFalse(erasing_system.run("abc"))
+        self.assertTrue(erasing_system.statistics.parikh_vector_rejected)
+        self.assertEqual(erasing_system.statistics.expanded_nodes, 0)
+
+        erasing_system = ErasingSystem({"ab", "c"}, "abc|cab", True)
+
+        self.assertTrue(erasing_system.run("acb"))
+        self.assertGreater(erasing_system.statistics.regular_expression_evaluations, 0)
+
+    def test_search_tracer(self):
+        """Testování sledování průběhu prohledávání zápisem všech událostí, případně každé n-té události, do souboru."""
+        erasing_strings = {"ab", "ba", "a"}
+        regular_language = "(ab|ba)*a*"
+        input_string = "abba" * 4 + "aa"
+        erasing_system = ErasingSystem(erasing_strings, regular_language, True,
+                                       ordering_policy=LeftmostFirstOrderingPolicy())
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_paths = [os.path.join(directory, "trace.tsv"), os.path.join(directory, "sampled_trace.tsv")]
+
+            with BufferedFileSearchTracer(file_paths[0], 4) as tracer:
+                erasing_system.tracer = tracer
+
+                self.assertTrue(erasing_system.run(input_string))
+
+            expanded_nodes = erasing_system.statistics.expanded_nodes
+
+            with BufferedFileSearchTracer(file_paths[1]) as tracer:
+                erasing_system.tracer = SamplingSearchTracer(tracer, 3)
+
+                self.assertTrue(erasing_system.run(input_string))
+
+            events = list()
+
+            for file_path in file_paths:
+                with open(file_path, encoding="utf-8") as trace_file:
+                    events.append([line.rstrip("\n").split("\t") for line in trace_file])
+
+        erasing_system.tracer = None
+
+        self.assertEqual(events[0][0], ["run_started", input_string])
+        self.assertEqual(events[0][1], ["node_entered", "0", input_string])
+        self.assertEqual(events[0][-1], ["run_finished", "accepted"])
+
+        # Vstupní páska je předávána bez sestavení řetězce, jehož obsah sestaví až sledování při zápisu události.
+        erasure_events = [event for event in events[0] if event[0] == "erasure"]
+
+        self.assertEqual(erasure_events[0], ["erasure", "0", "a", "0", input_string])
+        self.assertEqual(sum(event[0] == "node_entered" for event in events[0]), expanded_nodes)
+
+        accept_events = [event for event in events[0] if event[0] == "accept"]
+
+        self.assertEqual(len(accept_events), 1)
+        self.assertTrue(erasing_system.run(accept_events[0][2]))
+
+        # Vzorkovány jsou pouze časté události, přičemž průběh obou běhů je díky deterministickému výběru totožný.
+        frequent_events = [[event for event in trace if event[0] in ("node_entered", "erasure", "backtrack")]
+                           for trace in events]
+
+        self.assertEqual(len(events[1]) - len(frequent_events[1]), 3)
+        self.assertEqual(frequent_events[1], frequent_events[0][2::3])
+
+    def test_derivation_witness(self):
+        """Testování svědků přijetí, kteří musí být ověřitelní bez prohledávání, včetně odmítnutí upravených svědků."""
+        erasing_strings = {"ab", "ba", "a"}
+        regular_language = "(ab|ba)*a*"
+        input_string = "abba" * 3 + "aa"
+
+        for erasing_system in [ErasingSystem(erasing_strings, regular_language, True),
+                               ErasingSystem(erasing_strings, regular_language, True,
+                                             search_strategy=BestFirstSearchStrategy())]:
+            accepted, witness = erasing_system.run_with_witness(input_string)
+
+            self.assertTrue(accepted)
+            self.assertEqual(witness, erasing_system.witness)
+            self.assertTrue(verify_witness(erasing_strings, regular_language, input_string, witness))
+            self.assertFalse(verify_witness(erasing_strings, regular_language, input_string, witness[:-1]))
+            self.assertFalse(verify_witness(erasing_strings, regular_language, input_string + "a", witness))
+            self.assertFalse(verify_witness(erasing_strings, "(ab)*", input_string, witness))
+            self.assertTrue(erasing_system.verify_witness(input_string, witness))
+            self.assertFalse(erasing_system.verify_witness(input_string, witness[:-1]))
+            self.assertFalse(erasing_system.verify_witness(input_string + "a", witness))
+
+            self.assertEqual(erasing_system.run_with_witness("bb"), (False, None))
+
+        # Svědek je poskytnut i rozhodnutími, která nevyužívají hlavní algoritmus vymazávacího systému.
+        for erasing_strings, regular_language, input_string in [({"Aa", "Bb"}, "(Aa|Bb)*", "ABbaAa"),
+                                                                ({"ab", "c"}, "abc|cab", "acb"),
+                                                                ({"a", "b"}, "(ab)*", "bbaa"),
+                                                                ({"ab", "cd"}, "(ab)(cd)*", "")]:
+            erasing_system = ErasingSystem(erasing_strings, regular_language, interval_dynamic_programming=True)
+            accepted, witness = erasing_system.run_with_witness(input_string)
+
+            self.assertEqual(accepted, input_string != "")
+            self.assertEqual(accepted, witness is not None)
+
+            if accepted:
+                self.assertTrue(verify_witness(erasing_strings, regular_language, input_string, witness))
+                self.assertTrue(erasing_system.verify_witness(input_string, witness))
+
+        self.assertEqual(ErasingSystem({"ab"}, "(ab)*").run_with_witness(""), (True, ()))
+        self.assertTrue(verify_witness({"ab"}, "(ab)*", "", ()))
+        self.assertFalse(verify_witness({"ab"}, "(ab)*", "aabb", ((0, 0), (0, 1))))
+        self.assertTrue(verify_witness({"ab"}, "(ab)*", "aabb", ((0, 1), (0, 0))))
+
+        # Regulární výraz, pro který není sestaven automat, je porovnán s řetězcem vzniklým konkatenací.
+        erasing_system = ErasingSystem({"a", "b", "ab"}, "a|b*")
+
+        self.assertTrue(erasing_system.verify_witness("bb", ((2, 1), (2, 0))))
+        self.assertFalse(erasing_system.verify_witness("ab", ((1, 0),)))
+
+    def test_accepting_derivations(self):
+        """Testování počtu přijímajících posloupností vymazání a výčtu řetězců vzniklých konkatenací."""
+        erasing_strings = {"ab", "ba", "a"}
+        regular_language = "(ab|ba)*a*"
+        erasing_system = ErasingSystem(erasing_strings, regular_language)
+
+        self.assertEqual(erasing_system.count_accepting_derivations("aba"), 3)
+        self.assertEqual(erasing_system.enumerate_erased_strings_concatenations("aba"), ["aba", "baa"])
+        self.assertEqual(erasing_system.count_accepting_derivations(""), 1)
+        self.assertEqual(erasing_system.enumerate_erased_strings_concatenations(""), [""])
+        self.assertEqual(erasing_system.count_accepting_derivations("bb"), 0)
+        self.assertEqual(erasing_system.enumerate_erased_strings_concatenations("bb"), [])
+
+        # Počet posloupností vymazání roste exponenciálně, ale podproblémy jsou sdíleny.
+        self.assertEqual(erasing_system.count_accepting_derivations("ab" * 10), 654729075)
+
+        # Výpočet je omezen rozpočtem prohledávání, ze kterého každý řešený podproblém spotřebuje jednu jednotku.
+        budget = SearchBudget(max_nodes=1000)
+
+        self.assertEqual(erasing_system.count_accepting_derivations("ab" * 5, budget), 945)
+        self.assertGreater(budget.nodes, 1)
+
+        with self.assertRaises(SearchBudgetExhaustedException):
+            erasing_system.count_accepting_derivations("ab" * 10, SearchBudget(max_nodes=10))
+
+        with self.assertRaises(SearchBudgetExhaustedException):
+            erasing_system.enumerate_erased_strings_concatenations("ab" * 10, None, SearchBudget(max_time=0.0))
+
+        concatenations = erasing_system.enumerate_erased_strings_concatenations("ab" * 6)
+
+        self.assertEqual(erasing_system.enumerate_erased_strings_concatenations("ab" * 6, 5), concatenations[:5])
+        self.assertEqual(erasing_system.enumerate_erased_strings_concatenations("ab" * 6, 0), [])
+
+        # Regulární výraz, pro který není sestaven automat.
+        erasing_system = ErasingSystem({"a", "b", "ab"}, "a|b*")
+
+        self.assertEqual(erasing_system.count_accepting_derivations("bbb"), 6)
+        self.assertEqual(erasing_system.enumerate_erased_strings_concatenations("bbb"), ["bbb"])
+        self.assertEqual(erasing_system.count_accepting_derivations("ab"), 0)
+
     def test_valid_regular_language_pattern(self):
         """Testování validních tvarů regulárních výrazů pro regulární jazyky."""
         erasing_strings = set()
@@ -21,8 +21,6 @@ from es_tools.custom_exceptions.invalid_argument_exception import InvalidArgumen
 from es_tools.custom_exceptions.invalid_input_data_structure_exception import InvalidInputDataStructure
 from es_tools.custom_exceptions.invalid_regular_language_pattern_exception import InvalidRegularLanguagePatternException
 from es_tools.custom_exceptions.invalid_searched_sequences_exception import InvalidSearchedSequencesException
-from es_tools.custom_exceptions.maximum_input_string_length_exceeded_exception import \
-    MaximumInputStringLengthExceededException
 from es_tools.custom_exceptions.required_argument_not_provided_exception import RequiredArgumentNotProvidedException
 from es_tools.error_utils.exit_code import ExitCode
 from es_tools.handlers.argument_handler.argument_handler import ArgumentHandler
@@ -203,8 +201,6 @@ class AminoAcidSequenceSearchTool(Tool):
                                                   systému.
         :raises InvalidRegularLanguagePatternException: nevalidní nebo nepovolený tvar regulárního jazyka vymazávacího
                                                         systému.
-        :raises MaximumInputStringLengthExceededException: překročena maximální povolená délka vstupního řetězce pro
-                                                           vymazávací systém.
         """
         input_sequence = self.input_data[0]
 
@@ -283,12 +279,9 @@ class AminoAcidSequenceSearchTool(Tool):
         accepted = False
 
         for output_string in output_strings_with_labels_count.keys():
-            try:
-                if erasing_system.run(output_string):
-                    accepted = True
-                    break
-            except MaximumInputStringLengthExceededException:
-                raise
+            if erasing_system.run(output_string):
+                accepted = True
+                break
 
         if accepted:
             print("------------------------------------------------------------------------------------\n")
@@ -312,8 +305,6 @@ class AminoAcidSequenceSearchTool(Tool):
                                                   systému.
         :raises InvalidRegularLanguagePatternException: nevalidní nebo nepovolený tvar regulárního jazyka vymazávacího
                                                         systému.
-        :raises MaximumInputStringLengthExceededException: překročena maximální povolená délka vstupního řetězce pro
-                                                           vymazávací systém.
         :raises InitialStateNotInStatesException: počáteční stav nenáleží do množiny stavů převodníku.
         :raises FinalStatesNotStatesSubsetException: množina konečných stavů převodníku není podmnožinou množiny všech
                                                      stavů.
@@ -343,8 +334,6 @@ class AminoAcidSequenceSearchTool(Tool):
             raise
         except InvalidRegularLanguagePatternException:
             raise
-        except MaximumInputStringLengthExceededException:
-            raise
         except InitialStateNotInStatesException:
             raise
         except FinalStatesNotStatesSubsetException:
@@ -382,9 +371,6 @@ def main() -> None:
     except InvalidRegularLanguagePatternException as error:
         print("\nError: " + error.msg)
         sys.exit(ExitCode.INVALID_REGULAR_LANGUAGE.value)
-    except MaximumInputStringLengthExceededException as error:
-        print("\nError: " + error.msg)
-        sys.exit(ExitCode.MAXIMUM_INPUT_STRING_LENGTH_EXCEEDED.value)
     except InitialStateNotInStatesException as error:
         print("\nError: " + error.msg)
         sys.exit(ExitCode.INITIAL_STATE_NOT_IN_STATES.value)
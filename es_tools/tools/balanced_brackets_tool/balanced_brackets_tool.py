@@ -20,8 +20,6 @@ from es_tools.custom_exceptions.invalid_argument_exception import InvalidArgumen
 from es_tools.custom_exceptions.invalid_input_data_structure_exception import InvalidInputDataStructure
 from es_tools.custom_exceptions.invalid_regular_language_pattern_exception import InvalidRegularLanguagePatternException
 from es_tools.custom_exceptions.invalid_transition_exception import InvalidTransitionException
-from es_tools.custom_exceptions.maximum_input_string_length_exceeded_exception import \
-    MaximumInputStringLengthExceededException
 from es_tools.error_utils.exit_code import ExitCode
 from es_tools.handlers.argument_handler.argument_handler import ArgumentHandler
 from es_tools.tools.balanced_brackets_tool.custom_utils.custom_erasing_system_creation import create_erasing_system
@@ -127,8 +125,6 @@ class BalancedBracketsTool(Tool):
                                                   systému.
         :raises InvalidRegularLanguagePatternException: nevalidní nebo nepovolený tvar regulárního jazyka vymazávacího
                                                         systému.
-        :raises MaximumInputStringLengthExceededException: překročena maximální povolená délka vstupního řetězce pro
-                                                           vymazávací systém.
         """
         input_text = "".join(self.input_data)
 
@@ -158,10 +154,7 @@ class BalancedBracketsTool(Tool):
         except InvalidRegularLanguagePatternException:
             raise
 
-        try:
-            accepted = erasing_system.run(output_strings[0])
-        except MaximumInputStringLengthExceededException:
-            raise
+        accepted = erasing_system.run(output_strings[0])
 
         if accepted:
             print("------------------------------------------------------------------------------------\n")
@@ -185,8 +178,6 @@ class BalancedBracketsTool(Tool):
                                                   systému.
         :raises InvalidRegularLanguagePatternException: nevalidní nebo nepovolený tvar regulárního jazyka vymazávacího
                                                         systému.
-        :raises MaximumInputStringLengthExceededException: překročena maximální povolená délka vstupního řetězce pro
-                                                           vymazávací systém.
         :raises InitialStateNotInStatesException: počáteční stav nenáleží do množiny stavů převodníku.
         :raises FinalStatesNotStatesSubsetException: množina konečných stavů převodníku není podmnožinou množiny všech
                                                      stavů.
@@ -209,8 +200,6 @@ class BalancedBracketsTool(Tool):
             raise
         except InvalidRegularLanguagePatternException:
             raise
-        except MaximumInputStringLengthExceededException:
-            raise
         except InitialStateNotInStatesException:
             raise
         except FinalStatesNotStatesSubsetException:
@@ -243,9 +232,6 @@ def main() -> None:
     except InvalidRegularLanguagePatternException as error:
         print("\nError: " + error.msg)
         sys.exit(ExitCode.INVALID_REGULAR_LANGUAGE.value)
-    except MaximumInputStringLengthExceededException as error:
-        print("\nError: " + error.msg)
-        sys.exit(ExitCode.MAXIMUM_INPUT_STRING_LENGTH_EXCEEDED.value)
     except InitialStateNotInStatesException as error:
         print("\nError: " + error.msg)
         sys.exit(ExitCode.INITIAL_STATE_NOT_IN_STATES.value)
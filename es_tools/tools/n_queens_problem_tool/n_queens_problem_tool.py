@@ -21,8 +21,6 @@ from es_tools.custom_exceptions.invalid_argument_exception import InvalidArgumen
 from es_tools.custom_exceptions.invalid_input_data_structure_exception import InvalidInputDataStructure
 from es_tools.custom_exceptions.invalid_regular_language_pattern_exception import InvalidRegularLanguagePatternException
 from es_tools.custom_exceptions.invalid_value_exception import InvalidValueException
-from es_tools.custom_exceptions.maximum_input_string_length_exceeded_exception import \
-    MaximumInputStringLengthExceededException
 from es_tools.error_utils.exit_code import ExitCode
 from es_tools.handlers.argument_handler.argument_handler import ArgumentHandler
 from es_tools.tools.n_queens_problem_tool.custom_utils.custom_constants import INPUT_LINES_NUMBER
@@ -163,8 +161,6 @@ class NQueensProblemTool(Tool):
                                                   systému.
         :raises InvalidRegularLanguagePatternException: nevalidní nebo nepovolený tvar regulárního jazyka vymazávacího
                                                         systému.
-        :raises MaximumInputStringLengthExceededException: překročena maximální povolená délka vstupního řetězce pro
-                                                           vymazávací systém.
         """
         input_solution = self.input_data[0]
 
@@ -196,10 +192,7 @@ class NQueensProblemTool(Tool):
         except InvalidRegularLanguagePatternException:
             raise
 
-        try:
-            accepted = erasing_system_base_coordinates.run(output_strings[0])
-        except MaximumInputStringLengthExceededException:
-            raise
+        accepted = erasing_system_base_coordinates.run(output_strings[0])
 
         if not accepted:
             print("------------------------------------------------------------------------------------\n")
@@ -219,10 +212,7 @@ class NQueensProblemTool(Tool):
         except InvalidRegularLanguagePatternException:
             raise
 
-        try:
-            accepted = erasing_system_diagonal_coordinates.run(solution_in_diagonal_axes)
-        except MaximumInputStringLengthExceededException:
-            raise
+        accepted = erasing_system_diagonal_coordinates.run(solution_in_diagonal_axes)
 
         if not accepted:
             print("------------------------------------------------------------------------------------\n")
@@ -247,8 +237,6 @@ class NQueensProblemTool(Tool):
                                                   systému.
         :raises InvalidRegularLanguagePatternException: nevalidní nebo nepovolený tvar regulárního jazyka vymazávacího
                                                         systému.
-        :raises MaximumInputStringLengthExceededException: překročena maximální povolená délka vstupního řetězce pro
-                                                           vymazávací systém.
         :raises InitialStateNotInStatesException: počáteční stav nenáleží do množiny stavů převodníku.
         :raises FinalStatesNotStatesSubsetException: množina konečných stavů převodníku není podmnožinou množiny všech
                                                      stavů.
@@ -272,8 +260,6 @@ class NQueensProblemTool(Tool):
             raise
         except InvalidRegularLanguagePatternException:
             raise
-        except MaximumInputStringLengthExceededException:
-            raise
         except InitialStateNotInStatesException:
             raise
         except FinalStatesNotStatesSubsetException:
@@ -308,9 +294,6 @@ def main() -> None:
     except InvalidRegularLanguagePatternException as error:
         print("\nError: " + error.msg)
         sys.exit(ExitCode.INVALID_REGULAR_LANGUAGE.value)
-    except MaximumInputStringLengthExceededException as error:
-        print("\nError: " + error.msg)
-        sys.exit(ExitCode.MAXIMUM_INPUT_STRING_LENGTH_EXCEEDED.value)
     except InitialStateNotInStatesException as error:
         print("\nError: " + error.msg)
         sys.exit(ExitCode.INITIAL_STATE_NOT_IN_STATES.value)
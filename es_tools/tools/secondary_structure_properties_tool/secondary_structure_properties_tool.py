@@ -24,8 +24,6 @@ from es_tools.custom_exceptions.invalid_regular_language_pattern_exception impor
 from es_tools.custom_exceptions.invalid_transition_exception import InvalidTransitionException
 from es_tools.custom_exceptions.invalid_value_exception import InvalidValueException
 from es_tools.custom_exceptions.invalid_input_data_structure_exception import InvalidInputDataStructure
-from es_tools.custom_exceptions.maximum_input_string_length_exceeded_exception import \
-    MaximumInputStringLengthExceededException
 from es_tools.error_utils.exit_code import ExitCode
 from es_tools.handlers.argument_handler.argument_handler import ArgumentHandler
 from es_tools.shared_utils.input_data_check import is_rna_secondary_structure_sequence
@@ -306,8 +304,6 @@ class SecondaryStructurePropertiesTool(Tool):
                                                   systému.
         :raises InvalidRegularLanguagePatternException: nevalidní nebo nepovolený tvar regulárního jazyka vymazávacího
                                                         systému.
-        :raises MaximumInputStringLengthExceededException: překročena maximální povolená délka vstupního řetězce pro
-                                                           vymazávací systém.
         :raises InvalidTransitionException: převodník obsahuje neplatný přechod pro splnění požadovaných podmínek.
         """
         input_secondary_structure = self.input_data[0]
@@ -331,8 +327,6 @@ class SecondaryStructurePropertiesTool(Tool):
                 raise
             except InvalidRegularLanguagePatternException:
                 raise
-            except MaximumInputStringLengthExceededException:
-                raise
             except InitialStateNotInStatesException:
                 raise
             except FinalStatesNotStatesSubsetException:
@@ -363,8 +357,6 @@ class SecondaryStructurePropertiesTool(Tool):
                 raise
             except InvalidRegularLanguagePatternException:
                 raise
-            except MaximumInputStringLengthExceededException:
-                raise
             except InitialStateNotInStatesException:
                 raise
             except FinalStatesNotStatesSubsetException:
@@ -402,8 +394,6 @@ class SecondaryStructurePropertiesTool(Tool):
                                                   systému.
         :raises InvalidRegularLanguagePatternException: nevalidní nebo nepovolený tvar regulárního jazyka vymazávacího
                                                         systému.
-        :raises MaximumInputStringLengthExceededException: překročena maximální povolená délka vstupního řetězce pro
-                                                           vymazávací systém.
         :raises InitialStateNotInStatesException: počáteční stav nenáleží do množiny stavů převodníku.
         :raises FinalStatesNotStatesSubsetException: množina konečných stavů převodníku není podmnožinou množiny všech
                                                      stavů.
@@ -428,8 +418,6 @@ class SecondaryStructurePropertiesTool(Tool):
             raise
         except InvalidRegularLanguagePatternException:
             raise
-        except MaximumInputStringLengthExceededException:
-            raise
         except InitialStateNotInStatesException:
             raise
         except FinalStatesNotStatesSubsetException:
@@ -466,9 +454,6 @@ def main() -> None:
     except InvalidRegularLanguagePatternException as error:
         print("\nError: " + error.msg)
         sys.exit(ExitCode.INVALID_REGULAR_LANGUAGE.value)
-    except MaximumInputStringLengthExceededException as error:
-        print("\nError: " + error.msg)
-        sys.exit(ExitCode.MAXIMUM_INPUT_STRING_LENGTH_EXCEEDED.value)
     except InitialStateNotInStatesException as error:
         print("\nError: " + error.msg)
         sys.exit(ExitCode.INITIAL_STATE_NOT_IN_STATES.value)
@@ -16,8 +16,6 @@ from es_tools.custom_exceptions.illegal_symbol_occurrence_exception import Illeg
 from es_tools.custom_exceptions.initial_state_not_in_states_exception import InitialStateNotInStatesException
 from es_tools.custom_exceptions.internal_error_exception import InternalErrorException
 from es_tools.custom_exceptions.invalid_regular_language_pattern_exception import InvalidRegularLanguagePatternException
-from es_tools.custom_exceptions.maximum_input_string_length_exceeded_exception import \
-    MaximumInputStringLengthExceededException
 from es_tools.shared_utils.nucleotides_list import nucleotides_dna
 from es_tools.tools.sequence_search_tool.custom_utils.process_sequence import process_sequence
 from es_tools.tools.sequence_search_tool.custom_utils.data_type import DataType
@@ -49,8 +47,6 @@ def process_dna_sequence(strands: List[str],
     :raises IllegalSymbolOccurrenceException: výskyt nepovoleného symbolu ve vymazávacím řetězci.
     :raises InvalidRegularLanguagePatternException: nevalidní nebo nepovolený tvar regulárního výrazu
                                                     pro regulární jazyk.
-    :raises MaximumInputStringLengthExceededException: překročena maximální povolená délka vstupního řetězce pro
-                                                       vymazávací systém.
     """
     accepted = False
 
@@ -83,8 +79,6 @@ def process_dna_sequence(strands: List[str],
             raise
         except InvalidRegularLanguagePatternException:
             raise
-        except MaximumInputStringLengthExceededException:
-            raise
 
         i = i + 1
 
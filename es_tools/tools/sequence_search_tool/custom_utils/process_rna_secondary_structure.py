@@ -16,8 +16,6 @@ from es_tools.custom_exceptions.final_states_not_states_subset_exception import
 from es_tools.custom_exceptions.illegal_symbol_occurrence_exception import IllegalSymbolOccurrenceException
 from es_tools.custom_exceptions.initial_state_not_in_states_exception import InitialStateNotInStatesException
 from es_tools.custom_exceptions.invalid_regular_language_pattern_exception import InvalidRegularLanguagePatternException
-from es_tools.custom_exceptions.maximum_input_string_length_exceeded_exception import \
-    MaximumInputStringLengthExceededException
 from es_tools.tools.sequence_search_tool.custom_utils.process_sequence import process_sequence
 from es_tools.shared_utils.rna_secondary_structure_alphabet \
     import rna_secondary_structure_alphabet_conversed, rna_secondary_structure_conversions
@@ -41,8 +39,6 @@ def process_rna_secondary_structure(input_sequence: str,
     :raises IllegalSymbolOccurrenceException: výskyt nepovoleného symbolu ve vymazávacím řetězci.
     :raises InvalidRegularLanguagePatternException: nevalidní nebo nepovolený tvar regulárního výrazu
                                                     pro regulární jazyk.
-    :raises MaximumInputStringLengthExceededException: překročena maximální povolená délka vstupního řetězce pro
-                                                       vymazávací systém.
     """
     print("Input RNA secondary structure sequence: " + input_sequence + "\n")
     print("Searched sequences: " + str(sequences)[1:-1])
@@ -72,8 +68,6 @@ def process_rna_secondary_structure(input_sequence: str,
         raise
     except InvalidRegularLanguagePatternException:
         raise
-    except MaximumInputStringLengthExceededException:
-        raise
 
     if accepted:
         print("------------------------------------------------------------------------------------\n")
@@ -15,8 +15,6 @@ from es_tools.custom_exceptions.final_states_not_states_subset_exception import
 from es_tools.custom_exceptions.illegal_symbol_occurrence_exception import IllegalSymbolOccurrenceException
 from es_tools.custom_exceptions.initial_state_not_in_states_exception import InitialStateNotInStatesException
 from es_tools.custom_exceptions.invalid_regular_language_pattern_exception import InvalidRegularLanguagePatternException
-from es_tools.custom_exceptions.maximum_input_string_length_exceeded_exception import \
-    MaximumInputStringLengthExceededException
 from es_tools.shared_utils.nucleotides_list import nucleotides_rna
 from es_tools.tools.sequence_search_tool.custom_utils.process_sequence import process_sequence
 
@@ -36,8 +34,6 @@ def process_rna_sequence(input_sequence: str, sequences: List[str], greedy_quant
     :raises IllegalSymbolOccurrenceException: výskyt nepovoleného symbolu ve vymazávacím řetězci.
     :raises InvalidRegularLanguagePatternException: nevalidní nebo nepovolený tvar regulárního výrazu
                                                     pro regulární jazyk.
-    :raises MaximumInputStringLengthExceededException: překročena maximální povolená délka vstupního řetězce pro
-                                                       vymazávací systém.
     """
     print("Input RNA sequence: " + input_sequence + "\n")
     print("Searched sequences: " + str(sequences)[1:-1])
@@ -52,8 +48,6 @@ def process_rna_sequence(input_sequence: str, sequences: List[str], greedy_quant
         raise
     except InvalidRegularLanguagePatternException:
         raise
-    except MaximumInputStringLengthExceededException:
-        raise
 
     if accepted:
         print("------------------------------------------------------------------------------------\n")
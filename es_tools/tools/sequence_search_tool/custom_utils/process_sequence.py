@@ -15,8 +15,6 @@ from es_tools.custom_exceptions.final_states_not_states_subset_exception import
 from es_tools.custom_exceptions.illegal_symbol_occurrence_exception import IllegalSymbolOccurrenceException
 from es_tools.custom_exceptions.initial_state_not_in_states_exception import InitialStateNotInStatesException
 from es_tools.custom_exceptions.invalid_regular_language_pattern_exception import InvalidRegularLanguagePatternException
-from es_tools.custom_exceptions.maximum_input_string_length_exceeded_exception import \
-    MaximumInputStringLengthExceededException
 from es_tools.shared_utils.transducer_creation_sequences_labelling import create_transducer_subsequences_labelling
 from es_tools.tools.sequence_search_tool.custom_utils.custom_erasing_system_creation import create_custom_erasing_system
 from es_tools.shared_utils.shared_constants import SUBSEQUENCE_LABEL
@@ -47,8 +45,6 @@ def process_sequence(input_sequence: str,
     :raises IllegalSymbolOccurrenceException: výskyt nepovoleného symbolu ve vymazávacím řetězci.
     :raises InvalidRegularLanguagePatternException: nevalidní nebo nepovolený tvar regulárního výrazu
                                                     pro regulární jazyk.
-    :raises MaximumInputStringLengthExceededException: překročena maximální povolená délka vstupního řetězce pro
-                                                       vymazávací systém.
     """
     try:
         transducer = create_transducer_subsequences_labelling(alphabet, sequences)
@@ -94,10 +90,7 @@ def process_sequence(input_sequence: str,
         raise
 
     for output_string in output_strings_with_labels_count.keys():
-        try:
-            if erasing_system.run(output_string):
-                return True
-        except MaximumInputStringLengthExceededException:
-            raise
+        if erasing_system.run(output_string):
+            return True
 
     return False
@@ -23,8 +23,6 @@ from es_tools.custom_exceptions.invalid_argument_exception import InvalidArgumen
 from es_tools.custom_exceptions.invalid_input_data_structure_exception import InvalidInputDataStructure
 from es_tools.custom_exceptions.invalid_regular_language_pattern_exception import InvalidRegularLanguagePatternException
 from es_tools.custom_exceptions.invalid_searched_sequences_exception import InvalidSearchedSequencesException
-from es_tools.custom_exceptions.maximum_input_string_length_exceeded_exception import \
-    MaximumInputStringLengthExceededException
 from es_tools.custom_exceptions.required_argument_not_provided_exception import RequiredArgumentNotProvidedException
 from es_tools.custom_exceptions.unexpected_input_data_type_exception import UnexpectedInputDataTypeException
 from es_tools.error_utils.exit_code import ExitCode
@@ -223,8 +221,6 @@ class SequenceSearchTool(Tool):
                                                   systému.
         :raises InvalidRegularLanguagePatternException: nevalidní nebo nepovolený tvar regulárního jazyka vymazávacího
                                                         systému.
-        :raises MaximumInputStringLengthExceededException: překročena maximální povolená délka vstupního řetězce pro
-                                                           vymazávací systém.
         """
         try:
             self._set_input_data_type()
@@ -269,8 +265,6 @@ class SequenceSearchTool(Tool):
             raise
         except InvalidRegularLanguagePatternException:
             raise
-        except MaximumInputStringLengthExceededException:
-            raise
 
     def run(self) -> None:
         """Spuštění běhu nástroje.
@@ -294,8 +288,6 @@ class SequenceSearchTool(Tool):
                                                   systému.
         :raises InvalidRegularLanguagePatternException: nevalidní nebo nepovolený tvar regulárního jazyka vymazávacího
                                                         systému.
-        :raises MaximumInputStringLengthExceededException: překročena maximální povolená délka vstupního řetězce pro
-                                                           vymazávací systém.
         :raises InitialStateNotInStatesException: počáteční stav nenáleží do množiny stavů převodníku.
         :raises FinalStatesNotStatesSubsetException: množina konečných stavů převodníku není podmnožinou množiny všech
                                                      stavů.
@@ -331,8 +323,6 @@ class SequenceSearchTool(Tool):
             raise
         except InvalidRegularLanguagePatternException:
             raise
-        except MaximumInputStringLengthExceededException:
-            raise
         except InitialStateNotInStatesException:
             raise
         except FinalStatesNotStatesSubsetException:
@@ -391,9 +381,6 @@ def main() -> None:
     except InvalidRegularLanguagePatternException as error:
         print("\nError: " + error.msg)
         sys.exit(ExitCode.INVALID_REGULAR_LANGUAGE.value)
-    except MaximumInputStringLengthExceededException as error:
-        print("\nError: " + error.msg)
-        sys.exit(ExitCode.MAXIMUM_INPUT_STRING_LENGTH_EXCEEDED.value)
     except InitialStateNotInStatesException as error:
         print("\nError: " + error.msg)
         sys.exit(ExitCode.INITIAL_STATE_NOT_IN_STATES.value)